@@ -0,0 +1,188 @@
+"""Vectorized analytics over movie collections. Requires ``numpy``."""
+
+from collections.abc import Iterable
+from typing import Any, Literal
+
+try:
+    import numpy as np
+    import numpy.typing as npt
+except ImportError as e:
+    raise ImportError("lotr_sdk.analytics requires numpy: pip install 'lotr-sdk[analytics]'") from e
+
+from lotr_sdk.schemas.base import BaseSort
+from lotr_sdk.schemas.movie import Movie, MovieFilters
+
+Aggregation = Literal["count", "sum", "mean", "min", "max", "median", "std"]
+
+MOVIE_DTYPE = np.dtype(
+    [
+        ("id", "U24"),
+        ("name", object),
+        ("runtime_in_minutes", np.int64),
+        ("budget_in_millions", np.float64),
+        ("box_office_revenue_in_millions", np.float64),
+        ("academy_award_nominations", np.int64),
+        ("academy_award_wins", np.int64),
+        ("rotten_tomatoes_score", np.float64),
+    ]
+)
+
+_COLUMNS: tuple[str, ...] = MOVIE_DTYPE.names or ()
+
+_API_NAMES = {field.alias or name: name for name, field in Movie.model_fields.items() if name in _COLUMNS}
+
+
+class MovieFrame:
+    """Columnar view of a movie collection backed by a NumPy structured array.
+
+    Attributes:
+        data: Structured array with one row per movie, see ``MOVIE_DTYPE``
+    """
+
+    def __init__(self, data: npt.NDArray[np.void]):
+        self.data = data
+
+    @classmethod
+    def from_movies(cls, movies: Iterable[Movie]) -> "MovieFrame":
+        """Build a frame from movies, such as a ``MovieList``.
+
+        Args:
+            movies: Movies to include
+
+        Returns:
+            A new MovieFrame
+        """
+        rows = [
+            (
+                movie.id,
+                movie.name,
+                movie.runtime_in_minutes,
+                movie.budget_in_millions,
+                movie.box_office_revenue_in_millions,
+                movie.academy_award_nominations,
+                movie.academy_award_wins,
+                movie.rotten_tomatoes_score,
+            )
+            for movie in movies
+        ]
+        return cls(np.array(rows, dtype=MOVIE_DTYPE))
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, field: str) -> npt.NDArray[Any]:
+        """Return a column by field name or API name."""
+        return self.data[_API_NAMES.get(field, field)]
+
+    def mask(self, filters: MovieFilters) -> npt.NDArray[np.bool_]:
+        """Evaluate movie filters over every row.
+
+        Args:
+            filters: Filters, with the same semantics as the API
+
+        Returns:
+            Boolean mask selecting the matching rows
+        """
+        return filters.mask({name: self.data[name] for name in _COLUMNS}, len(self.data))
+
+    def filter(self, filters: MovieFilters) -> "MovieFrame":
+        """Return the rows matching the filters."""
+        return MovieFrame(self.data[self.mask(filters)])
+
+    def sort(self, sort: BaseSort | str, order: Literal["asc", "desc"] = "asc") -> "MovieFrame":
+        """Return the rows sorted by a field.
+
+        Args:
+            sort: Sort options, or a field name
+            order: Sort order, when ``sort`` is a field name
+
+        Returns:
+            A new, sorted MovieFrame
+        """
+        if isinstance(sort, BaseSort):
+            if sort.field is None:
+                return self
+            field, order = sort.field, sort.order
+        else:
+            field = sort
+        indices = np.argsort(self[field], kind="stable")
+        if order == "desc":
+            indices = indices[::-1]
+        return MovieFrame(self.data[indices])
+
+    def aggregate(self, field: str, how: Aggregation = "mean") -> float:
+        """Aggregate a numeric column.
+
+        Args:
+            field: Column to aggregate
+            how: Aggregation to apply
+
+        Returns:
+            The aggregated value
+        """
+        column = self[field]
+        if how == "count":
+            return float(len(column))
+        return float(getattr(np, how)(column))
+
+    def group_by(self, field: str, value: str, how: Aggregation = "mean") -> dict[Any, float]:
+        """Aggregate a column per distinct value of another column.
+
+        Args:
+            field: Column to group by
+            value: Column to aggregate
+            how: Aggregation to apply
+
+        Returns:
+            Aggregated value by group key
+        """
+        keys, inverse, counts = np.unique(self[field], return_inverse=True, return_counts=True)
+        column = self[value].astype(np.float64)
+        if how == "count":
+            results = counts.astype(np.float64)
+        elif how in ("sum", "mean"):
+            results = np.bincount(inverse, weights=column, minlength=len(keys))
+            if how == "mean":
+                results = results / counts
+        else:
+            order = np.argsort(inverse, kind="stable")
+            groups = np.split(column[order], np.cumsum(counts)[:-1])
+            results = np.array([getattr(np, how)(group) for group in groups])
+        return {key: float(result) for key, result in zip(keys.tolist(), results, strict=True)}
+
+    def ratio(self, numerator: str, denominator: str) -> npt.NDArray[np.float64]:
+        """Return ``numerator / denominator`` per row, NaN where the denominator is zero."""
+        top = self[numerator].astype(np.float64)
+        bottom = self[denominator].astype(np.float64)
+        result: npt.NDArray[np.float64] = np.divide(top, bottom, out=np.full(len(top), np.nan), where=bottom != 0)
+        return result
+
+    def budget_to_box_office(self) -> npt.NDArray[np.float64]:
+        """Return each movie's budget divided by its box office revenue."""
+        return self.ratio("budget_in_millions", "box_office_revenue_in_millions")
+
+    def awards_per_minute(self) -> npt.NDArray[np.float64]:
+        """Return each movie's Academy Award wins per minute of runtime."""
+        return self.ratio("academy_award_wins", "runtime_in_minutes")
+
+    def histogram(
+        self, field: str, bins: int | list[float] = 10
+    ) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.float64]]:
+        """Return the distribution of a column, as ``numpy.histogram`` does."""
+        return np.histogram(self[field], bins=bins)
+
+    def to_pandas(self) -> Any:
+        """Return the rows as a ``pandas.DataFrame``. Requires ``pandas``."""
+        import pandas as pd
+
+        return pd.DataFrame.from_records(self.data)
+
+    def to_arrow(self) -> Any:
+        """Return the rows as a ``pyarrow.Table``. Requires ``pyarrow``."""
+        import pyarrow as pa
+
+        return pa.table({name: self.data[name].tolist() for name in _COLUMNS})
+
+    def to_movies(self) -> list[Movie]:
+        """Convert the rows back into movies."""
+        return [Movie.model_construct(**dict(zip(_COLUMNS, row, strict=True))) for row in self.data.tolist()]
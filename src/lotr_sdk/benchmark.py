@@ -0,0 +1,234 @@
+"""Comparative throughput benchmark of the HTTP transports.
+
+Run it against the live API with ``python -m lotr_sdk.benchmark``; settings are
+read from the ``LOTR_*`` environment variables. Only the transports whose
+dependencies are installed are measured.
+"""
+
+import argparse
+import functools
+import statistics
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Literal
+
+import anyio
+
+from lotr_sdk.client.base import HTTPClient
+from lotr_sdk.client.httpx import HTTPXClient
+from lotr_sdk.core.concurrency import gather
+from lotr_sdk.core.errors import APIError
+from lotr_sdk.core.settings import Settings
+
+Mode = Literal["sync", "async"]
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    """Measurements of one transport in one mode.
+
+    Attributes:
+        transport: Transport name
+        mode: Whether the synchronous or asynchronous interface was measured
+        seconds: Wall-clock time for all requests
+        latencies: Per-request latency in seconds, for successful requests
+        errors: Number of failed requests
+    """
+
+    transport: str
+    mode: Mode
+    seconds: float
+    latencies: tuple[float, ...]
+    errors: int = 0
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies) + self.errors
+
+    @property
+    def requests_per_second(self) -> float:
+        """Successful requests per second; failed requests are not counted."""
+        return len(self.latencies) / self.seconds if self.seconds else 0.0
+
+    def percentile(self, q: int) -> float:
+        """Return the ``q``-th latency percentile in seconds."""
+        if len(self.latencies) <= 1:
+            return self.latencies[0] if self.latencies else 0.0
+        return statistics.quantiles(self.latencies, n=100, method="inclusive")[q - 1]
+
+
+def transports() -> dict[str, tuple[Callable[[Settings], HTTPClient], tuple[Mode, ...]]]:
+    """Return the installed transports, with the modes each supports."""
+    available: dict[str, tuple[Callable[[Settings], HTTPClient], tuple[Mode, ...]]] = {
+        "httpx": (HTTPXClient, ("sync", "async")),
+    }
+    try:
+        from lotr_sdk.client.urllib3 import Urllib3Client
+
+        available["urllib3"] = (Urllib3Client, ("sync",))
+    except ImportError:
+        pass
+    try:
+        from lotr_sdk.client.aiohttp import AiohttpClient
+
+        available["aiohttp"] = (AiohttpClient, ("async",))
+    except ImportError:
+        pass
+    return available
+
+
+def benchmark_sync(  # noqa: PLR0913
+    client: HTTPClient,
+    *,
+    name: str = "",
+    url: str = "/v2/movie",
+    params: dict[str, Any] | None = None,
+    requests: int = 100,
+    concurrency: int = 8,
+) -> BenchmarkResult:
+    """Measure a client's synchronous interface, issuing requests from a thread pool.
+
+    Args:
+        client: Client to measure
+        name: Transport name to report
+        url: Endpoint to request
+        params: Query parameters
+        requests: Total number of requests
+        concurrency: Number of requests in flight at once
+
+    Returns:
+        The measurements
+    """
+
+    def timed(_: int) -> float | None:
+        start = time.perf_counter()
+        try:
+            client.request(method="GET", url=url, params=params)
+        except APIError:
+            return None
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        timings = list(pool.map(timed, range(requests)))
+    return _result(name, "sync", time.perf_counter() - start, timings)
+
+
+async def benchmark_async(  # noqa: PLR0913
+    client: HTTPClient,
+    *,
+    name: str = "",
+    url: str = "/v2/movie",
+    params: dict[str, Any] | None = None,
+    requests: int = 100,
+    concurrency: int = 8,
+) -> BenchmarkResult:
+    """Measure a client's asynchronous interface. See :func:`benchmark_sync`."""
+
+    async def timed() -> float | None:
+        start = time.perf_counter()
+        try:
+            await client.request_async(method="GET", url=url, params=params)
+        except APIError:
+            return None
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    timings = await gather((timed() for _ in range(requests)), limit=concurrency)
+    return _result(name, "async", time.perf_counter() - start, timings)
+
+
+async def _measure_async(
+    client: HTTPClient, *, name: str, url: str, requests: int, concurrency: int
+) -> BenchmarkResult:
+    """Warm up and measure a client's asynchronous interface, then close its asynchronous resources."""
+    await benchmark_async(client, name=name, url=url, requests=1, concurrency=concurrency)
+    result = await benchmark_async(client, name=name, url=url, requests=requests, concurrency=concurrency)
+    if close_async := getattr(client, "close_async", None):
+        await close_async()
+    return result
+
+
+def _result(name: str, mode: Mode, seconds: float, timings: Iterable[float | None]) -> BenchmarkResult:
+    timings = list(timings)
+    latencies = tuple(timing for timing in timings if timing is not None)
+    return BenchmarkResult(name, mode, seconds, latencies, errors=len(timings) - len(latencies))
+
+
+def run(
+    settings: Settings,
+    *,
+    names: Iterable[str] | None = None,
+    url: str = "/v2/movie",
+    requests: int = 100,
+    concurrency: int = 8,
+) -> list[BenchmarkResult]:
+    """Benchmark every installed transport in every mode it supports.
+
+    Each transport is warmed up with one request so connection setup is not measured.
+
+    Args:
+        settings: Client settings
+        names: Transports to measure, all installed ones if None
+        url: Endpoint to request
+        requests: Requests per transport and mode
+        concurrency: Number of requests in flight at once
+
+    Returns:
+        One result per transport and mode
+    """
+    available = transports()
+    # Identical requests would otherwise be coalesced or served from the cache,
+    # and the urllib3 pool is sized from max_workers
+    settings = settings.model_copy(update={"coalesce_requests": False, "cache_url": None, "max_workers": concurrency})
+    results = []
+    for name in names or available:
+        factory, modes = available[name]
+        client = factory(settings)
+        try:
+            if "sync" in modes:
+                benchmark_sync(client, name=name, url=url, requests=1, concurrency=concurrency)
+                results.append(benchmark_sync(client, name=name, url=url, requests=requests, concurrency=concurrency))
+            if "async" in modes:
+                measure = functools.partial(
+                    _measure_async, client, name=name, url=url, requests=requests, concurrency=concurrency
+                )
+                results.append(anyio.run(measure))
+        finally:
+            client.close()
+    return results
+
+
+def format_results(results: Iterable[BenchmarkResult]) -> str:
+    """Render results as a table, fastest first."""
+    lines = [f"{'transport':<10} {'mode':<6} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'errors':>6}"]
+    for result in sorted(results, key=lambda result: result.requests_per_second, reverse=True):
+        lines.append(
+            f"{result.transport:<10} {result.mode:<6} {result.requests_per_second:>9.1f} "
+            f"{result.percentile(50) * 1000:>8.1f} {result.percentile(95) * 1000:>8.1f} {result.errors:>6}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Compare the throughput of the HTTP transports")
+    parser.add_argument("--transport", action="append", choices=sorted(transports()), help="transport to measure")
+    parser.add_argument("--url", default="/v2/movie", help="endpoint to request")
+    parser.add_argument("--requests", type=int, default=100, help="requests per transport and mode")
+    parser.add_argument("--concurrency", type=int, default=8, help="requests in flight at once")
+    args = parser.parse_args(argv)
+
+    results = run(
+        Settings(),
+        names=args.transport,
+        url=args.url,
+        requests=args.requests,
+        concurrency=args.concurrency,
+    )
+    print(format_results(results))
+
+
+if __name__ == "__main__":
+    main()
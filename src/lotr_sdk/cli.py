@@ -0,0 +1,292 @@
+"""Command-line tool streaming movies or quotes to NDJSON or CSV.
+
+Settings come from ``LOTR_*`` environment variables, as for ``Settings()``::
+
+    LOTR_API_KEY=... lotr quotes --movie 5cd95395de30eff6ebccde5c --output quotes.ndjson
+    LOTR_API_KEY=... lotr movies --runtime-in-minutes '>=160' --sort budgetInMillions:desc --format csv
+
+Every filter field of ``MovieFilters`` and ``QuoteFilters`` is a flag taking an
+expression, and a flag may be repeated to combine conditions:
+
+- ``value``: equal to the value
+- ``!=value``: not equal to the value
+- ``a,b,c``: one of the values; ``!a,b,c``: none of them
+- ``>value``, ``>=value``, ``<value``, ``<=value``: numeric bounds
+- ``/pattern/i``: matches a regular expression
+- ``exists`` or ``!exists``: the field is set or not
+
+Pages are fetched ``--concurrency`` at a time and written in order, with the
+throughput and estimated time left shown on stderr.
+"""
+
+import argparse
+import csv
+import dataclasses
+import json
+import re
+import sys
+import time
+from collections.abc import Iterator
+from itertools import batched
+from typing import Any, Literal, TextIO
+
+from lotr_sdk.core.errors import APIError
+from lotr_sdk.core.settings import Settings
+from lotr_sdk.lotr import LotrAPI
+from lotr_sdk.schemas.base import BaseFilters, BaseResource, BaseSort, FieldFilter, PaginatedResponse, Pagination
+from lotr_sdk.schemas.movie import MovieFilters
+from lotr_sdk.schemas.quote import QuoteFilters
+from lotr_sdk.services.movie import MovieService
+from lotr_sdk.services.quote import QuoteService
+
+OutputFormat = Literal["ndjson", "csv"]
+
+FILTERS: dict[str, type[BaseFilters]] = {"movies": MovieFilters, "quotes": QuoteFilters}
+
+_BOUND = re.compile(r"(>=|<=|>|<)(.*)", flags=re.DOTALL)
+_BOUND_FIELDS = {">": "gt", ">=": "gte", "<": "lt", "<=": "lte"}
+_ORDERS: dict[str, Literal["asc", "desc"]] = {"": "asc", "asc": "asc", "desc": "desc"}
+
+_FILTER_SYNTAX = (
+    "EXPR is value, !=value, a,b (any of), !a,b (none of), >n, >=n, <n, <=n, /regex/i, exists or !exists. "
+    "Repeat a flag to combine conditions."
+)
+
+
+def _number(text: str) -> int | float | str:
+    for convert in (int, float):
+        try:
+            return convert(text)
+        except ValueError:
+            pass
+    return text
+
+
+def parse_filter(expressions: list[str]) -> FieldFilter:
+    """Parse filter expressions on a single field into a FieldFilter.
+
+    Args:
+        expressions: Expressions in the syntax described in the module docstring
+
+    Returns:
+        A FieldFilter requiring every expression to hold
+
+    Raises:
+        ValueError: If an expression is empty or conflicts with another one
+    """
+    conditions: dict[str, Any] = {}
+    for expression in expressions:
+        if not expression:
+            raise ValueError("Empty filter expression")
+        if expression in ("exists", "!exists"):
+            conditions["exists"] = expression == "exists"
+        elif len(expression) > 1 and expression.startswith("/") and re.fullmatch(r"/.*/[a-z]*", expression, re.DOTALL):
+            conditions["regex"] = expression
+        elif match := _BOUND.fullmatch(expression):
+            conditions[_BOUND_FIELDS[match.group(1)]] = _number(match.group(2))
+        elif expression.startswith("!="):
+            conditions["not_match"] = expression[2:]
+        elif expression.startswith("!"):
+            conditions["exclude"] = expression[1:].split(",")
+        elif "," in expression:
+            conditions["include"] = expression.split(",")
+        else:
+            conditions["match"] = expression
+    return FieldFilter(**conditions)
+
+
+def parse_sort(text: str) -> BaseSort:
+    """Parse ``field`` or ``field:asc|desc`` into sort options."""
+    field, _, order = text.partition(":")
+    if order not in _ORDERS:
+        raise argparse.ArgumentTypeError(f"Invalid sort order: {order}")
+    return BaseSort(field=field, order=_ORDERS[order])
+
+
+def _flag(name: str) -> str:
+    return "--" + name.replace("_", "-")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="lotr",
+        description="Stream movies or quotes from The One API. Configure with LOTR_* environment variables.",
+    )
+    resources = parser.add_subparsers(dest="resource", required=True)
+    for resource, filters in FILTERS.items():
+        command = resources.add_parser(resource, help=f"stream {resource}")
+        command.add_argument("--format", choices=["ndjson", "csv"], default="ndjson", help="output format")
+        command.add_argument("-o", "--output", help="output file, stdout by default")
+        command.add_argument("--sort", type=parse_sort, help="sort as field or field:desc")
+        command.add_argument("--fields", help="comma-separated fields to keep")
+        command.add_argument("--limit", type=int, default=1000, help="page size")
+        command.add_argument("--concurrency", type=int, default=4, help="pages fetched at once")
+        command.add_argument("--max-records", type=int, help="stop after this many records")
+        command.add_argument("-q", "--quiet", action="store_true", help="do not report progress on stderr")
+        group = command.add_argument_group("filters", _FILTER_SYNTAX)
+        for field in dataclasses.fields(filters):  # type: ignore[arg-type]
+            group.add_argument(_flag(field.name), dest=f"filter_{field.name}", action="append", metavar="EXPR")
+    return parser
+
+
+def build_filters(resource: str, args: argparse.Namespace) -> BaseFilters | None:
+    """Build the resource's filters from the parsed filter flags, or None if none were given."""
+    filters = FILTERS[resource]
+    conditions = {
+        field.name: parse_filter(expressions)
+        for field in dataclasses.fields(filters)  # type: ignore[arg-type]
+        if (expressions := getattr(args, f"filter_{field.name}"))
+    }
+    return filters(**conditions) if conditions else None
+
+
+class Progress:
+    """Reports records written, throughput and time left on a stream."""
+
+    def __init__(self, stream: TextIO, *, interval: float = 0.5):
+        """Initialize the reporter.
+
+        Args:
+            stream: Stream to report to, usually stderr
+            interval: Minimum time in seconds between two reports
+        """
+        self.stream = stream
+        self.interval = interval
+        self.total: int | None = None
+        self.records = 0
+        self.start = time.monotonic()
+        self._reported = 0.0
+
+    def update(self, records: int, total: int | None = None) -> None:
+        """Count newly written records, reporting at most once per interval on a terminal."""
+        self.records += records
+        if total is not None:
+            self.total = total
+        now = time.monotonic()
+        if self.stream.isatty() and now - self._reported >= self.interval:
+            self._reported = now
+            self.stream.write(f"\r{self.line()}\033[K")
+            self.stream.flush()
+
+    def line(self) -> str:
+        elapsed = max(time.monotonic() - self.start, 1e-9)
+        rate = self.records / elapsed
+        records = f"{self.records:,}/{self.total:,}" if self.total else f"{self.records:,}"
+        line = f"{records} records  {rate:,.0f} records/s  {elapsed:.1f}s"
+        if self.total and rate and self.records < self.total:
+            line += f"  ETA {(self.total - self.records) / rate:.0f}s"
+        return line
+
+    def finish(self) -> None:
+        if self.stream.isatty():
+            self.stream.write(f"\r{self.line()}\033[K\n")
+        else:
+            self.stream.write(f"{self.line()}\n")
+        self.stream.flush()
+
+
+def iter_pages(  # noqa: PLR0913
+    service: MovieService | QuoteService,
+    *,
+    filters: BaseFilters | None = None,
+    sort: BaseSort | None = None,
+    fields: list[str] | None = None,
+    limit: int = 1000,
+    concurrency: int = 4,
+) -> Iterator[PaginatedResponse[Any]]:
+    """Yield every page of a collection in order, fetching ``concurrency`` pages at a time.
+
+    The service's executor needs ``concurrency`` workers for the pages of a
+    window to be fetched in parallel.
+    """
+    options: dict[str, Any] = {"filters": filters, "sort": sort, "fields": fields}
+    first = service.list(pagination=Pagination(page=1, limit=limit), **options)
+    yield first
+    pages = first.pages or -(-first.total // (first.limit or limit))
+    for window in batched(range(2, pages + 1), concurrency, strict=False):
+        yield from service.list_pages(window, limit=limit, **options)
+
+
+class _Writer:
+    def __init__(self, stream: TextIO, format: OutputFormat):
+        self.stream = stream
+        self.format = format
+        self._csv: csv.DictWriter[str] | None = None
+
+    def write(self, docs: list[BaseResource]) -> None:
+        rows = [doc.model_dump(mode="json") for doc in docs]
+        if self.format == "ndjson":
+            self.stream.writelines(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+            return
+        if rows and self._csv is None:
+            self._csv = csv.DictWriter(self.stream, fieldnames=list(rows[0]))
+            self._csv.writeheader()
+        if self._csv is not None:
+            self._csv.writerows(rows)
+
+
+def run(args: argparse.Namespace, *, settings: Settings | None = None, stdout: TextIO | None = None) -> int:
+    """Stream the requested collection.
+
+    Args:
+        args: Parsed command-line arguments
+        settings: Client settings, read from the environment if None
+        stdout: Stream written to when no output file is given
+
+    Returns:
+        Number of records written
+    """
+    settings = settings or Settings()
+    fields = args.fields.split(",") if args.fields else None
+    filters = build_filters(args.resource, args)
+    progress = None if args.quiet else Progress(sys.stderr)
+    output: TextIO = open(args.output, "w", encoding="utf-8", newline="") if args.output else stdout or sys.stdout  # noqa: SIM115
+    written = 0
+    try:
+        with LotrAPI(settings=settings, max_workers=args.concurrency) as api:
+            service = api.movies if args.resource == "movies" else api.quotes
+            writer = _Writer(output, args.format)
+            pages = iter_pages(
+                service,
+                filters=filters,
+                sort=args.sort,
+                fields=fields,
+                limit=args.limit,
+                concurrency=args.concurrency,
+            )
+            for page in pages:
+                docs = page.docs
+                if args.max_records is not None:
+                    docs = docs[: args.max_records - written]
+                writer.write(docs)
+                written += len(docs)
+                if progress is not None:
+                    total = page.total if args.max_records is None else min(page.total, args.max_records)
+                    progress.update(len(docs), total)
+                if args.max_records is not None and written >= args.max_records:
+                    break
+    finally:
+        if args.output:
+            output.close()
+        else:
+            output.flush()
+        if progress is not None:
+            progress.finish()
+    return written
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        run(args)
+    except ValueError as e:
+        parser.error(str(e))
+    except APIError as e:
+        parser.exit(1, f"{parser.prog}: error: {str(e) or type(e).__name__}\n")
+    except KeyboardInterrupt:
+        sys.exit(130)
+
+
+if __name__ == "__main__":
+    main()
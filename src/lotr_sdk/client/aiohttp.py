@@ -0,0 +1,103 @@
+"""Asynchronous HTTPClient built on aiohttp. Requires ``aiohttp``."""
+
+from typing import Any, override
+
+try:
+    import aiohttp
+except ImportError as e:
+    raise ImportError("lotr_sdk.client.aiohttp requires aiohttp: pip install 'lotr-sdk[aiohttp]'") from e
+
+from lotr_sdk.client.base import BaseHTTPClient, TransportResponse
+from lotr_sdk.core.settings import Settings
+from lotr_sdk.core.timeouts import Timeouts
+from lotr_sdk.schemas.base import APIResponse
+
+
+class AiohttpClient(BaseHTTPClient):
+    """Asynchronous-only HTTP client using an aiohttp session.
+
+    The session is created on the first request, since aiohttp binds it to the
+    running event loop. aiohttp only supports asyncio, not Trio. Synchronous
+    requests are not supported; use ``HTTPXClient`` or ``Urllib3Client`` for those.
+    """
+
+    transient_errors = (aiohttp.ClientConnectionError, TimeoutError)
+
+    def __init__(self, settings: Settings, *, limit: int = 100):
+        """Initialize the HTTP client.
+
+        Args:
+            settings: Client settings
+            limit: Maximum number of simultaneous connections
+        """
+        super().__init__(settings)
+        self.limit = limit
+        self.session: aiohttp.ClientSession | None = None
+
+    def _session(self) -> aiohttp.ClientSession:
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                headers=self.default_headers,
+                connector=aiohttp.TCPConnector(limit=self.limit),
+            )
+        return self.session
+
+    @override
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> APIResponse[Any]:
+        """Not supported: aiohttp is asynchronous only.
+
+        Raises:
+            TypeError: Always
+        """
+        raise TypeError("AiohttpClient is asynchronous only, use request_async")
+
+    @override
+    def warmup(self, connections: int = 1) -> None:
+        """Not supported: aiohttp is asynchronous only.
+
+        Raises:
+            TypeError: Always
+        """
+        raise TypeError("AiohttpClient is asynchronous only, use warmup_async")
+
+    @override
+    async def _send_async(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        body: bytes | None,
+        headers: dict[str, str] | None,
+        timeouts: Timeouts,
+    ) -> TransportResponse:
+        async with self._session().request(
+            method,
+            self.settings.base_url + url,
+            params=params,
+            data=body,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(
+                total=timeouts.total,
+                connect=timeouts.pool + timeouts.connect,
+                sock_connect=timeouts.connect,
+                sock_read=timeouts.read,
+            ),
+            allow_redirects=False,
+        ) as response:
+            return TransportResponse(
+                response.status,
+                {name.lower(): value for name, value in response.headers.items()},
+                await response.read(),
+            )
+
+    async def close_async(self) -> None:
+        """Close the session."""
+        if self.session is not None:
+            await self.session.close()
@@ -1,7 +1,35 @@
-from typing import Any, Protocol
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractAsyncContextManager, nullcontext
+from dataclasses import dataclass, replace
+from functools import partial
+from http import HTTPStatus
+from typing import Any, NoReturn, Protocol
+from urllib.parse import urlencode
 
+import anyio
+from loguru import logger
+
+from lotr_sdk.core.cache import CacheBackend, decode_response, encode_response, open_cache
+from lotr_sdk.core.coalesce import Coalescer
+from lotr_sdk.core.codec import get_codec
+from lotr_sdk.core.concurrency import gather
+from lotr_sdk.core.errors import (
+    APIError,
+    AuthenticationError,
+    DeadlineExceededError,
+    RateLimitError,
+    ResourceNotFoundError,
+    RetryError,
+    ServerError,
+)
+from lotr_sdk.core.keys import KeyPool
+from lotr_sdk.core.latency import LatencyTracker
+from lotr_sdk.core.scheduler import RequestScheduler, current_priority
 from lotr_sdk.core.settings import Settings
-from lotr_sdk.schemas.base import APIResponse
+from lotr_sdk.core.timeouts import Timeouts, check_deadline, remaining
+from lotr_sdk.schemas.base import APIResponse, query_key
 
 
 class HTTPClient(Protocol):
@@ -15,6 +43,7 @@ class HTTPClient(Protocol):
         url: str,
         params: dict[str, Any] | None = None,
         data: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
     ) -> APIResponse[Any]:
         """Make an HTTP request.
 
@@ -23,9 +52,11 @@ class HTTPClient(Protocol):
             url: Request URL
             params: Query parameters
             data: Request body data
+            headers: Additional request headers
 
         Returns:
-            APIResponse containing the response data
+            APIResponse containing the response data. A ``304 Not Modified``
+            answer to a conditional request is returned with empty ``data``.
         """
         ...
 
@@ -35,6 +66,7 @@ class HTTPClient(Protocol):
         url: str,
         params: dict[str, Any] | None = None,
         data: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
     ) -> APIResponse[Any]:
         """Make an HTTP request asynchronously.
 
@@ -43,8 +75,635 @@ class HTTPClient(Protocol):
             url: Request URL
             params: Query parameters
             data: Request body data
+            headers: Additional request headers
 
         Returns:
-            APIResponse containing the response data
+            APIResponse containing the response data. A ``304 Not Modified``
+            answer to a conditional request is returned with empty ``data``.
         """
         ...
+
+    def close(self) -> None:
+        """Release any resources held by the client."""
+        ...
+
+
+@dataclass(frozen=True)
+class TransportResponse:
+    """A response as received by a transport, before decoding.
+
+    Attributes:
+        status_code: HTTP status code
+        headers: Response headers, with lowercase names
+        content: Raw response body
+    """
+
+    status_code: int
+    headers: dict[str, str]
+    content: bytes
+
+
+class BaseHTTPClient:
+    """Transport-agnostic HTTPClient with retry and error handling.
+
+    Subclasses only move bytes: they implement :meth:`_send` and/or
+    :meth:`_send_async` and name the exceptions that mean a request may succeed
+    if retried. Retries, status-to-error mapping and decoding live here, so every
+    transport behaves the same. Identical GET requests in flight at the same
+    time are sent once and share the response.
+
+    When ``Settings.cache_url`` is set, or a backend is assigned to ``cache``,
+    successful GET responses are cached for ``Settings.cache_ttl`` seconds. A
+    miss takes a lock in the cache while fetching, so that concurrent misses
+    for the same request, even in other processes, wait for that one fetch.
+    """
+
+    # Interval at which a request waiting on another process's fetch polls the cache
+    cache_poll_interval = 0.05
+
+    # Exceptions raised by the transport for failures worth retrying, such as timeouts
+    transient_errors: tuple[type[Exception], ...] = ()
+
+    def __init__(self, settings: Settings):
+        """Initialize the HTTP client.
+
+        Args:
+            settings: Client settings
+        """
+        self.settings = settings
+        self.codec = get_codec(settings.json_codec)
+        self.keys = KeyPool(settings.all_api_keys, strategy=settings.key_strategy)
+        self._coalescer = Coalescer()
+        self.cache: CacheBackend | None = open_cache(settings.cache_url) if settings.cache_url else None
+        self._prefetched: dict[str, bytes] = {}
+        self.latency = LatencyTracker()
+        self._hedgeable = 0
+        self._hedged = 0
+        self.scheduler = (
+            RequestScheduler(
+                settings.max_concurrent_requests,
+                weights=settings.priority_weights,
+                limits=settings.priority_limits,
+            )
+            if settings.max_concurrent_requests
+            else None
+        )
+
+    @property
+    def default_headers(self) -> dict[str, str]:
+        """Headers sent with every request. The Authorization header is added per request."""
+        return {"User-Agent": self.settings.user_agent}
+
+    def _authorize(self, headers: dict[str, str] | None) -> tuple[str, dict[str, str]]:
+        """Pick an API key from the pool and return it with the request headers carrying it.
+
+        Raises:
+            RateLimitError: If every key is benched
+        """
+        key = self.keys.acquire()
+        if key is None:
+            raise RateLimitError(f"Every API key is rate limited, retry in {self.keys.next_available():.0f}s")
+        return key, {"Authorization": f"Bearer {key}", **(headers or {})}
+
+    def _release(self, key: str, response: TransportResponse | None) -> None:
+        if response is None:
+            self.keys.release(key)
+        else:
+            self.keys.release(key, response.status_code, response.headers)
+
+    def _send_authorized(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        body: bytes | None,
+        headers: dict[str, str] | None,
+        timeouts: Timeouts,
+    ) -> TransportResponse:
+        """Send a request with a key from the pool, updating the key's quota from the response."""
+        key, authorized = self._authorize(headers)
+        response = None
+        start = time.perf_counter()
+        try:
+            response = self._send(method, url, params, body, authorized, timeouts)
+            self.latency.record(url, time.perf_counter() - start)
+            return response
+        finally:
+            self._release(key, response)
+
+    async def _send_authorized_async(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        body: bytes | None,
+        headers: dict[str, str] | None,
+        timeouts: Timeouts,
+    ) -> TransportResponse:
+        """Asynchronous version of :meth:`_send_authorized`."""
+        key, authorized = self._authorize(headers)
+        response = None
+        start = time.perf_counter()
+        try:
+            response = await self._send_async(method, url, params, body, authorized, timeouts)
+            self.latency.record(url, time.perf_counter() - start)
+            return response
+        finally:
+            self._release(key, response)
+
+    def _timeouts(self, url: str, left: float | None) -> Timeouts:
+        """Return the timeouts for the next attempt at ``url``.
+
+        With adaptive timeouts, connect and read timeouts are ``timeout_multiplier``
+        times the endpoint's p99 latency, no lower than ``min_timeout`` and no
+        higher than the configured timeouts. The timeouts are then scaled down to
+        fit, together, in the time left until the call's deadline. Transports
+        without a total timeout, such as httpx, apply the read timeout to each
+        read, so a response trickling in slowly may still outlast the deadline.
+        """
+        timeouts = self.settings.timeouts
+        if self.settings.adaptive_timeouts:
+            p99 = self.latency.percentile(url, 99)
+            if p99 is not None:
+                adaptive = max(self.settings.min_timeout, self.settings.timeout_multiplier * p99)
+                timeouts = replace(timeouts, connect=min(timeouts.connect, adaptive), read=min(timeouts.read, adaptive))
+        if left is not None:
+            timeouts = timeouts.capped(left)
+        return timeouts
+
+    def _hedge_delay(self, method: str, url: str) -> float | None:
+        """Return how long to wait before hedging a request, or None if it must not be hedged.
+
+        Transports relying on the default :meth:`_send_async` are never hedged:
+        a request running in a worker thread cannot be cancelled, so the losing
+        request would keep its thread and connection until it completes.
+        """
+        if not self.settings.hedge_requests or method != "GET":
+            return None
+        if type(self)._send_async is BaseHTTPClient._send_async:
+            return None
+        return self.latency.percentile(url, self.settings.hedge_percentile)
+
+    async def _send_hedged_async(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        body: bytes | None,
+        headers: dict[str, str] | None,
+        timeouts: Timeouts,
+    ) -> TransportResponse:
+        """Send a request, and a duplicate if no answer arrives within the endpoint's usual latency.
+
+        The first response wins and the other request is cancelled. A failed
+        request cancels nothing: the call only fails once both requests have
+        failed, or the first one failed before the duplicate was sent. Hedges
+        are capped at ``Settings.hedge_max_rate`` of hedgeable requests.
+        """
+        delay = self._hedge_delay(method, url)
+        if delay is None:
+            return await self._send_authorized_async(method, url, params, body, headers, timeouts)
+        self._hedgeable += 1
+        responses: list[TransportResponse] = []
+        errors: list[Exception] = []
+        hedged = False
+
+        async def attempt(wait: float | None) -> None:
+            nonlocal hedged
+            if wait is not None:
+                await anyio.sleep(wait)
+                if self._hedged >= self.settings.hedge_max_rate * self._hedgeable:
+                    return
+                self._hedged += 1
+                hedged = True
+                logger.debug("Hedging {method} {url} after {delay:.3f}s", method=method, url=url, delay=wait)
+            try:
+                responses.append(await self._send_authorized_async(method, url, params, body, headers, timeouts))
+            except Exception as e:
+                errors.append(e)
+                # After a failure the retry logic takes over, rather than a hedge
+                if not hedged:
+                    group.cancel_scope.cancel()
+            else:
+                group.cancel_scope.cancel()
+
+        async with anyio.create_task_group() as group:
+            group.start_soon(attempt, None)
+            group.start_soon(attempt, delay)
+        if responses:
+            return responses[0]
+        raise errors[0]
+
+    def _slot(self) -> AbstractAsyncContextManager[None]:
+        """Return a context holding a scheduler slot for one asynchronous request."""
+        if self.scheduler is None:
+            return nullcontext()
+        return self.scheduler.slot()
+
+    def _send(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        body: bytes | None,
+        headers: dict[str, str] | None,
+        timeouts: Timeouts,
+    ) -> TransportResponse:
+        """Send a single request, without retries.
+
+        ``body`` is already encoded, and ``headers`` then include its content type.
+        The transport must apply ``timeouts`` to this request.
+        """
+        raise NotImplementedError
+
+    async def _send_async(  # noqa: PLR0913
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        body: bytes | None,
+        headers: dict[str, str] | None,
+        timeouts: Timeouts,
+    ) -> TransportResponse:
+        """Send a single request asynchronously, without retries.
+
+        Defaults to running :meth:`_send` in a worker thread, for synchronous
+        transports. The thread cannot be cancelled, so a deadline passing
+        mid-request is only enforced through ``timeouts``.
+        """
+        return await anyio.to_thread.run_sync(partial(self._send, method, url, params, body, headers, timeouts))
+
+    def _handle_error(self, status_code: int) -> NoReturn:
+        """Convert an HTTP error status to an API error.
+
+        Args:
+            status_code: HTTP status code
+
+        Raises:
+            APIError: Appropriate error based on status code
+        """
+        if status_code == HTTPStatus.UNAUTHORIZED:
+            raise AuthenticationError()
+        elif status_code == HTTPStatus.NOT_FOUND:
+            raise ResourceNotFoundError()
+        elif status_code == HTTPStatus.TOO_MANY_REQUESTS:
+            raise RateLimitError()
+        elif status_code >= HTTPStatus.INTERNAL_SERVER_ERROR:
+            raise ServerError()
+        else:
+            raise APIError()
+
+    def _should_retry(self, status_code: int | None = None, error: Exception | None = None) -> bool:
+        """Check if a failed request should be retried.
+
+        Args:
+            status_code: HTTP error status, if a response was received
+            error: Transport error, if no response was received
+
+        Returns:
+            True if the request should be retried, False otherwise
+        """
+        if status_code is not None:
+            return status_code >= HTTPStatus.INTERNAL_SERVER_ERROR
+        return isinstance(error, self.transient_errors)
+
+    def _decode(self, response: TransportResponse) -> APIResponse[Any]:
+        """Decode a successful response."""
+        if response.status_code == HTTPStatus.NOT_MODIFIED:
+            return APIResponse(data={}, status_code=response.status_code, headers=response.headers)
+        try:
+            data = self.codec.loads(response.content)
+        except ValueError as e:
+            raise APIError("Invalid JSON response") from e
+        return APIResponse(data=data, status_code=response.status_code, headers=response.headers)
+
+    def _coalesce_key(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+    ) -> tuple[Any, ...] | None:
+        """Return the key under which identical concurrent requests share one response, if they may.
+
+        Requests share a response only within a priority class, so a batch request
+        never holds back an interactive one.
+        """
+        if method != "GET" or not self.settings.coalesce_requests:
+            return None
+        return (url, query_key(params), query_key(headers), current_priority())
+
+    def _cache_key(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+    ) -> str | None:
+        """Return the cache key of a request, or None if its response must not be cached.
+
+        Only plain GET requests are cached: extra headers, such as conditional
+        ones, ask for an answer from the server.
+        """
+        if self.cache is None or method != "GET" or headers:
+            return None
+        return f"{self.settings.base_url}{url}?{urlencode(query_key(params))}"
+
+    @property
+    def _backend(self) -> CacheBackend:
+        """The response cache, on code paths only reached with a cache key, so with caching enabled."""
+        assert self.cache is not None
+        return self.cache
+
+    def prefetch(self, requests: Iterable[tuple[str, dict[str, Any] | None]]) -> int:
+        """Load the cached responses of upcoming GET requests in a single round trip.
+
+        The responses found are kept until the matching :meth:`request` call
+        consumes them, so a batch of lookups costs one cache round trip rather
+        than one per request. Each prefetch replaces the responses kept by the
+        previous one, so those never requested do not accumulate.
+
+        Args:
+            requests: URL and query parameters of each upcoming request
+
+        Returns:
+            Number of responses found in the cache
+        """
+        keys = [key for url, params in requests if (key := self._cache_key("GET", url, params, None)) is not None]
+        if not keys:
+            return 0
+        return self._store_prefetched(keys, self._backend.get_many(keys))
+
+    async def prefetch_async(self, requests: Iterable[tuple[str, dict[str, Any] | None]]) -> int:
+        """Asynchronous version of :meth:`prefetch`."""
+        keys = [key for url, params in requests if (key := self._cache_key("GET", url, params, None)) is not None]
+        if not keys:
+            return 0
+        return self._store_prefetched(keys, await self._cache_call(self._backend.get_many, keys))
+
+    def _store_prefetched(self, keys: list[str], values: list[bytes | None]) -> int:
+        found = {key: value for key, value in zip(keys, values, strict=True) if value is not None}
+        self._prefetched = found
+        return len(found)
+
+    def _cache_get(self, key: str) -> APIResponse[Any] | None:
+        value = self._prefetched.pop(key, None)
+        if value is None:
+            value = self._backend.get(key)
+        return None if value is None else decode_response(self.codec, value)
+
+    def _lock_timeout(self) -> float:
+        """Return how long a cache lock is held at most, and how long others wait on it."""
+        left = remaining()
+        return self.settings.timeout if left is None else min(self.settings.timeout, left)
+
+    def _cached_request(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        data: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+    ) -> APIResponse[Any]:
+        key = self._cache_key(method, url, params, headers)
+        if key is None:
+            return self._request(method, url, params, data, headers)
+        if (cached := self._cache_get(key)) is not None:
+            return cached
+
+        timeout = self._lock_timeout()
+        token = self._backend.lock(key, timeout)
+        if token is None:
+            # Another process is fetching this response: wait for it to land in the cache
+            give_up = time.monotonic() + timeout
+            while time.monotonic() < give_up:
+                time.sleep(self.cache_poll_interval)
+                if (cached := self._cache_get(key)) is not None:
+                    return cached
+        try:
+            response = self._request(method, url, params, data, headers)
+            if response.status_code == HTTPStatus.OK:
+                self._backend.set(key, encode_response(self.codec, response), self.settings.cache_ttl)
+            return response
+        finally:
+            if token is not None:
+                self._backend.unlock(key, token)
+
+    async def _cache_call[T](self, function: Callable[..., T], *args: Any) -> T:
+        """Call a cache method, in a worker thread if the backend does network I/O."""
+        if self._backend.blocking:
+            return await anyio.to_thread.run_sync(partial(function, *args))
+        return function(*args)
+
+    async def _cached_request_async(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        data: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+    ) -> APIResponse[Any]:
+        key = self._cache_key(method, url, params, headers)
+        if key is None:
+            return await self._request_async(method, url, params, data, headers)
+        if (cached := await self._cache_call(self._cache_get, key)) is not None:
+            return cached
+
+        timeout = self._lock_timeout()
+        token = await self._cache_call(self._backend.lock, key, timeout)
+        if token is None:
+            with anyio.move_on_after(timeout):
+                while True:
+                    await anyio.sleep(self.cache_poll_interval)
+                    if (cached := await self._cache_call(self._cache_get, key)) is not None:
+                        return cached
+        try:
+            response = await self._request_async(method, url, params, data, headers)
+            if response.status_code == HTTPStatus.OK:
+                value = encode_response(self.codec, response)
+                await self._cache_call(self._backend.set, key, value, self.settings.cache_ttl)
+            return response
+        finally:
+            if token is not None:
+                with anyio.CancelScope(shield=True):
+                    await self._cache_call(self._backend.unlock, key, token)
+
+    def _encode(
+        self,
+        data: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+    ) -> tuple[bytes | None, dict[str, str] | None]:
+        """Encode a request body, adding its content type to the headers."""
+        if data is None:
+            return None, headers
+        return self.codec.dumps(data), {"Content-Type": "application/json", **(headers or {})}
+
+    def _attempt_failed(self, attempt: int, response: TransportResponse | None, error: Exception | None) -> float:
+        """Raise the final error for a failed attempt, or return the delay before retrying it."""
+        if isinstance(error, APIError):
+            raise error
+        if response is not None:
+            retries_left = attempt < self.settings.max_retries
+            if response.status_code == HTTPStatus.TOO_MANY_REQUESTS and retries_left and self.keys.available():
+                # Another key still has quota: switch to it right away
+                return 0.0
+            if not self._should_retry(status_code=response.status_code) or attempt == self.settings.max_retries:
+                self._handle_error(response.status_code)
+        elif not self._should_retry(error=error) or attempt == self.settings.max_retries:
+            raise APIError() from error
+        delay = self.settings.retry_delay * (attempt + 1)
+        left = remaining()
+        if left is not None and delay >= left:
+            # The retry could not finish before the deadline
+            raise DeadlineExceededError() from error
+        return delay
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> APIResponse[Any]:
+        """Make an HTTP request with retry logic.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: Request URL
+            params: Query parameters
+            data: Request body data
+            headers: Additional request headers
+
+        Returns:
+            APIResponse containing the response data
+
+        Raises:
+            AuthenticationError: If authentication fails
+            ResourceNotFoundError: If resource is not found
+            RateLimitError: If rate limit is exceeded
+            ServerError: If server returns an error
+            RetryError: If all retry attempts are exhausted
+        """
+        key = self._coalesce_key(method, url, params, headers)
+        if key is None:
+            return self._cached_request(method, url, params, data, headers)
+        return self._coalescer.run(key, lambda: self._cached_request(method, url, params, data, headers))
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        data: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+    ) -> APIResponse[Any]:
+        body, headers = self._encode(data, headers)
+        for attempt in range(self.settings.max_retries + 1):
+            logger.info("Requesting {method} {url}", method=method, url=url, params=params)
+            timeouts = self._timeouts(url, check_deadline())
+            try:
+                response = self._send_authorized(method, url, params, body, headers, timeouts)
+            except Exception as e:
+                delay = self._attempt_failed(attempt, None, e)
+            else:
+                if response.status_code < HTTPStatus.BAD_REQUEST:
+                    return self._decode(response)
+                delay = self._attempt_failed(attempt, response, None)
+            time.sleep(delay)
+
+        raise RetryError()
+
+    async def request_async(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> APIResponse[Any]:
+        """Make an HTTP request asynchronously with retry logic.
+
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            url: Request URL
+            params: Query parameters
+            data: Request body data
+            headers: Additional request headers
+
+        Returns:
+            APIResponse containing the response data
+
+        Raises:
+            AuthenticationError: If authentication fails
+            ResourceNotFoundError: If resource is not found
+            RateLimitError: If rate limit is exceeded
+            ServerError: If server returns an error
+            RetryError: If all retry attempts are exhausted
+        """
+        key = self._coalesce_key(method, url, params, headers)
+        if key is None:
+            return await self._cached_request_async(method, url, params, data, headers)
+        return await self._coalescer.run_async(
+            key, lambda: self._cached_request_async(method, url, params, data, headers)
+        )
+
+    async def _request_async(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        data: dict[str, Any] | None,
+        headers: dict[str, str] | None,
+    ) -> APIResponse[Any]:
+        body, headers = self._encode(data, headers)
+        for attempt in range(self.settings.max_retries + 1):
+            logger.info("Requesting {method} {url}", method=method, url=url, params=params, data=data)
+            left = check_deadline()
+            timeouts = self._timeouts(url, left)
+            try:
+                # Cancels native async transports at the deadline. Requests sent from a worker
+                # thread run on until their timeouts, which the deadline caps, expire
+                with anyio.move_on_after(left) as scope:
+                    async with self._slot():
+                        response = await self._send_hedged_async(method, url, params, body, headers, timeouts)
+                if scope.cancelled_caught:
+                    raise DeadlineExceededError()
+            except Exception as e:
+                delay = self._attempt_failed(attempt, None, e)
+            else:
+                if response.status_code < HTTPStatus.BAD_REQUEST:
+                    return self._decode(response)
+                delay = self._attempt_failed(attempt, response, None)
+            await anyio.sleep(delay)
+
+        raise RetryError()
+
+    def warmup(self, connections: int = 1) -> None:
+        """Open keep-alive connections to the API ahead of the first request.
+
+        Sends ``connections`` concurrent ``HEAD /`` requests, which need no API
+        key and cost no quota, so that DNS resolution, TCP and TLS handshakes are
+        paid before the first real request and the connections stay pooled.
+
+        Args:
+            connections: Number of connections to open
+        """
+        timeouts = self.settings.timeouts
+        with ThreadPoolExecutor(max_workers=connections, thread_name_prefix="lotr-sdk-warmup") as pool:
+            list(pool.map(lambda _: self._send("HEAD", "/", None, None, None, timeouts), range(connections)))
+
+    async def warmup_async(self, connections: int = 1) -> None:
+        """Asynchronous version of :meth:`warmup`, opening connections of the asynchronous pool.
+
+        Call it from the event loop that will send the requests.
+        """
+        timeouts = self.settings.timeouts
+        await gather(self._send_async("HEAD", "/", None, None, None, timeouts) for _ in range(connections))
+
+    def close(self) -> None:
+        """Release any resources held by the client."""
+
+    async def close_async(self) -> None:
+        """Release any resources held by the client, including those only closable from an event loop."""
+        self.close()
@@ -0,0 +1,209 @@
+"""HTTPClient that records exchanges to a cassette file and replays them offline.
+
+A cassette is a gzip-compressed NDJSON file with one exchange per line: the
+request's method, URL, canonical query and body, the response, and how long
+the server took to answer. Replaying a cassette runs the same retry, decoding
+and caching code as a live client, without network or quota, optionally
+reproducing the recorded latencies, as is or scaled by a speed factor.
+"""
+
+import base64
+import gzip
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, override
+
+import anyio
+
+from lotr_sdk.client.base import BaseHTTPClient, TransportResponse
+from lotr_sdk.core.errors import CassetteMissError
+from lotr_sdk.core.settings import Settings
+from lotr_sdk.core.timeouts import Timeouts
+from lotr_sdk.schemas.base import query_key
+
+RequestKey = tuple[str, str, tuple[tuple[str, str], ...], bytes | None]
+
+
+class CassetteClient(BaseHTTPClient):
+    """Records the exchanges of another client, or replays recorded ones.
+
+    Requests are matched on method, URL, query parameters and body. When a
+    request was recorded several times, replays return the recorded responses
+    in order, starting over once all of them have been returned.
+
+    Build instances with :meth:`record` or :meth:`replay`.
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        path: str | Path,
+        *,
+        client: BaseHTTPClient | None = None,
+        speed: float | None = None,
+    ):
+        """Initialize the client.
+
+        Args:
+            settings: Client settings
+            path: Cassette file
+            client: Client whose exchanges are recorded, or None to replay ``path``
+            speed: Replay recorded latencies divided by this factor, 1.0 for the original
+                timing. None replays without delay.
+        """
+        super().__init__(settings)
+        self.path = Path(path)
+        self.client = client
+        self.speed = speed
+        self.exchanges: list[dict[str, Any]] = []
+        self._responses: dict[RequestKey, list[tuple[TransportResponse, float]]] = defaultdict(list)
+        self._played: dict[RequestKey, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        if client is None:
+            self._load()
+
+    @classmethod
+    def record(cls, client: BaseHTTPClient, path: str | Path) -> "CassetteClient":
+        """Record the exchanges of a live client, saved to ``path`` on :meth:`close`."""
+        return cls(client.settings, path, client=client)
+
+    @classmethod
+    def replay(cls, settings: Settings, path: str | Path, *, speed: float | None = None) -> "CassetteClient":
+        """Replay the exchanges recorded in ``path``.
+
+        Args:
+            settings: Client settings
+            path: Cassette file
+            speed: Replay recorded latencies divided by this factor, 1.0 for the original
+                timing. None replays without delay.
+        """
+        return cls(settings, path, speed=speed)
+
+    def _key(self, method: str, url: str, params: dict[str, Any] | None, body: bytes | None) -> RequestKey:
+        return (method, url, query_key(params), body)
+
+    def _load(self) -> None:
+        with gzip.open(self.path, "rb") as file:
+            for line in file:
+                exchange = self.codec.loads(line)
+                body = exchange["body"]
+                key = (
+                    exchange["method"],
+                    exchange["url"],
+                    tuple((name, value) for name, value in exchange["params"]),
+                    None if body is None else body.encode(),
+                )
+                content = exchange["content"]
+                response = TransportResponse(
+                    exchange["status_code"],
+                    exchange["headers"],
+                    base64.b64decode(content) if exchange.get("base64") else content.encode(),
+                )
+                self._responses[key].append((response, exchange["latency"]))
+
+    def _store(self, key: RequestKey, response: TransportResponse, latency: float) -> None:
+        method, url, params, body = key
+        try:
+            content, encoded = response.content.decode(), False
+        except UnicodeDecodeError:
+            content, encoded = base64.b64encode(response.content).decode(), True
+        exchange = {
+            "method": method,
+            "url": url,
+            "params": params,
+            "body": None if body is None else body.decode(),
+            "status_code": response.status_code,
+            "headers": response.headers,
+            "content": content,
+            "latency": round(latency, 6),
+        }
+        if encoded:
+            exchange["base64"] = True
+        with self._lock:
+            self.exchanges.append(exchange)
+            self._responses[key].append((response, latency))
+
+    def _play(self, key: RequestKey) -> tuple[TransportResponse, float]:
+        with self._lock:
+            recorded = self._responses.get(key)
+            if not recorded:
+                method, url, params, _ = key
+                raise CassetteMissError(f"No recorded response for {method} {url} {dict(params)}")
+            index = self._played[key]
+            self._played[key] = index + 1
+        response, latency = recorded[index % len(recorded)]
+        return response, 0.0 if self.speed is None else latency / self.speed
+
+    @override
+    def _send(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        body: bytes | None,
+        headers: dict[str, str] | None,
+        timeouts: Timeouts,
+    ) -> TransportResponse:
+        key = self._key(method, url, params, body)
+        if self.client is not None:
+            start = time.perf_counter()
+            response = self.client._send(method, url, params, body, headers, timeouts)
+            self._store(key, response, time.perf_counter() - start)
+            return response
+        response, delay = self._play(key)
+        if delay:
+            time.sleep(delay)
+        return response
+
+    @override
+    async def _send_async(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        body: bytes | None,
+        headers: dict[str, str] | None,
+        timeouts: Timeouts,
+    ) -> TransportResponse:
+        key = self._key(method, url, params, body)
+        if self.client is not None:
+            start = time.perf_counter()
+            response = await self.client._send_async(method, url, params, body, headers, timeouts)
+            self._store(key, response, time.perf_counter() - start)
+            return response
+        response, delay = self._play(key)
+        if delay:
+            await anyio.sleep(delay)
+        return response
+
+    def warmup(self, connections: int = 1) -> None:
+        """Warm up the recorded client. Replays open no connections."""
+        if self.client is not None:
+            self.client.warmup(connections)
+
+    async def warmup_async(self, connections: int = 1) -> None:
+        """Asynchronous version of :meth:`warmup`."""
+        if self.client is not None:
+            await self.client.warmup_async(connections)
+
+    def save(self) -> None:
+        """Write the exchanges recorded so far to the cassette file."""
+        with self._lock:
+            lines = [self.codec.dumps(exchange) + b"\n" for exchange in self.exchanges]
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(self.path, "wb") as file:
+            file.writelines(lines)
+
+    def close(self) -> None:
+        """Save the cassette when recording, and close the recorded client."""
+        if self.client is not None:
+            self.save()
+            self.client.close()
+
+    async def close_async(self) -> None:
+        """Asynchronous version of :meth:`close`."""
+        if self.client is not None:
+            self.save()
+            await self.client.close_async()
@@ -0,0 +1,76 @@
+"""Synchronous HTTPClient built on urllib3. Requires ``urllib3``."""
+
+from typing import Any, override
+from urllib.parse import urlencode
+
+try:
+    import urllib3
+except ImportError as e:
+    raise ImportError("lotr_sdk.client.urllib3 requires urllib3: pip install 'lotr-sdk[urllib3]'") from e
+
+from lotr_sdk.client.base import BaseHTTPClient, TransportResponse
+from lotr_sdk.core.settings import Settings
+from lotr_sdk.core.timeouts import Timeouts
+
+
+class Urllib3Client(BaseHTTPClient):
+    """HTTP client using a urllib3 connection pool.
+
+    urllib3 does less work per request than httpx, which pays off when many
+    small requests are issued from threads, for example with ``max_workers``.
+    Asynchronous requests run in a worker thread.
+    """
+
+    transient_errors = (urllib3.exceptions.TimeoutError, urllib3.exceptions.ProtocolError)
+
+    def __init__(self, settings: Settings, *, maxsize: int | None = None):
+        """Initialize the HTTP client.
+
+        Args:
+            settings: Client settings
+            maxsize: Number of connections kept open, defaults to ``settings.max_workers``.
+                Requests wait for a free connection, so size it to the number of
+                threads issuing requests.
+        """
+        super().__init__(settings)
+        self.pool = urllib3.PoolManager(
+            maxsize=maxsize or settings.max_workers,
+            block=True,
+            headers=self.default_headers,
+            timeout=urllib3.Timeout(connect=settings.timeouts.connect, read=settings.timeouts.read),
+            retries=False,
+        )
+
+    @override
+    def _send(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None,
+        body: bytes | None,
+        headers: dict[str, str] | None,
+        timeouts: Timeouts,
+    ) -> TransportResponse:
+        url = self.settings.base_url + url
+        if params:
+            url = f"{url}?{urlencode(params, doseq=True)}"
+        response = self.pool.request(
+            method,
+            url,
+            body=body,
+            headers={**self.default_headers, **(headers or {})},
+            timeout=urllib3.Timeout(
+                total=timeouts.connect + timeouts.read, connect=timeouts.connect, read=timeouts.read
+            ),
+            pool_timeout=timeouts.pool,
+            redirect=False,
+        )
+        return TransportResponse(
+            response.status,
+            {name.lower(): value for name, value in response.headers.items()},
+            response.data,
+        )
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        self.pool.clear()
@@ -0,0 +1,187 @@
+"""Response caches shared by HTTP clients, in process or across processes.
+
+A cache stores serialized, optionally compressed ``APIResponse`` payloads of
+GET requests. The Redis backend lets every worker process of a deployment
+share one cache, so a page is fetched from the API once per TTL rather than
+once per process. Requires ``redis`` for the Redis backend.
+"""
+
+import threading
+import time
+import uuid
+import zlib
+from collections.abc import Sequence
+from typing import Any, Protocol
+
+from lotr_sdk.core.codec import JSONCodec
+from lotr_sdk.schemas.base import APIResponse
+
+# Payloads shorter than this are stored uncompressed
+COMPRESSION_THRESHOLD = 1024
+
+_RAW = b"\x00"
+_ZLIB = b"\x01"
+
+
+class CacheBackend(Protocol):
+    """Storage for cached responses.
+
+    Attributes:
+        blocking: Whether calls do network I/O and should run in a worker thread from async code
+    """
+
+    blocking: bool
+
+    def get(self, key: str) -> bytes | None:
+        """Return the value stored under a key, or None if missing or expired."""
+        ...
+
+    def get_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        """Return the values stored under several keys, in one round trip where possible."""
+        ...
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Store a value for ``ttl`` seconds."""
+        ...
+
+    def lock(self, key: str, ttl: float) -> str | None:
+        """Try to take the lock guarding the computation of a key.
+
+        Returns:
+            A token to pass to :meth:`unlock`, or None if another holder has the lock
+        """
+        ...
+
+    def unlock(self, key: str, token: str) -> None:
+        """Release a lock taken with :meth:`lock`, unless it expired and was taken by someone else."""
+        ...
+
+
+def encode_response(codec: JSONCodec, response: APIResponse[Any]) -> bytes:
+    """Serialize a response, compressing large payloads."""
+    payload = codec.dumps({"data": response.data, "status_code": response.status_code, "headers": response.headers})
+    if len(payload) < COMPRESSION_THRESHOLD:
+        return _RAW + payload
+    return _ZLIB + zlib.compress(payload, 1)
+
+
+def decode_response(codec: JSONCodec, value: bytes) -> APIResponse[Any]:
+    """Deserialize a response stored by :func:`encode_response`."""
+    payload = zlib.decompress(value[1:]) if value[:1] == _ZLIB else value[1:]
+    return APIResponse(**codec.loads(payload))
+
+
+class MemoryCache:
+    """Cache held in the memory of the current process."""
+
+    blocking = False
+
+    def __init__(self) -> None:
+        self._values: dict[str, tuple[float, bytes]] = {}
+        self._locks: dict[str, tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                del self._values[key]
+                return None
+            return entry[1]
+
+    def get_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        return [self.get(key) for key in keys]
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        with self._lock:
+            self._values[key] = (time.monotonic() + ttl, value)
+
+    def lock(self, key: str, ttl: float) -> str | None:
+        now = time.monotonic()
+        with self._lock:
+            held = self._locks.get(key)
+            if held is not None and held[0] > now:
+                return None
+            token = uuid.uuid4().hex
+            self._locks[key] = (now + ttl, token)
+            return token
+
+    def unlock(self, key: str, token: str) -> None:
+        with self._lock:
+            held = self._locks.get(key)
+            if held is not None and held[1] == token:
+                del self._locks[key]
+
+
+class RedisCache:
+    """Cache stored in Redis, or any server speaking the Redis protocol.
+
+    Values expire through Redis TTLs, locks are ``SET NX PX`` keys, and
+    :meth:`get_many` pipelines its ``GET`` commands into a single round trip.
+    """
+
+    blocking = True
+
+    def __init__(self, client: Any, *, prefix: str = "lotr:"):
+        """Initialize the cache.
+
+        Args:
+            client: A ``redis.Redis`` client, or a compatible one such as ``fakeredis.FakeRedis``
+            prefix: Prefix of every key written by the cache
+        """
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs: Any) -> "RedisCache":
+        """Connect to Redis, for example ``redis://localhost:6379/0``. Requires ``redis``."""
+        try:
+            import redis
+        except ImportError as e:
+            raise ImportError("RedisCache requires redis: pip install 'lotr-sdk[redis]'") from e
+        return cls(redis.Redis.from_url(url), **kwargs)
+
+    def get(self, key: str) -> bytes | None:
+        value: bytes | None = self.client.get(self.prefix + key)
+        return value
+
+    def get_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        pipeline = self.client.pipeline(transaction=False)
+        for key in keys:
+            pipeline.get(self.prefix + key)
+        values: list[bytes | None] = pipeline.execute()
+        return values
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self.client.set(self.prefix + key, value, px=max(int(ttl * 1000), 1))
+
+    def lock(self, key: str, ttl: float) -> str | None:
+        token = uuid.uuid4().hex
+        if self.client.set(f"{self.prefix}{key}:lock", token, nx=True, px=max(int(ttl * 1000), 1)):
+            return token
+        return None
+
+    def unlock(self, key: str, token: str) -> None:
+        from redis.exceptions import WatchError
+
+        lock_key = f"{self.prefix}{key}:lock"
+        with self.client.pipeline() as pipeline:
+            try:
+                pipeline.watch(lock_key)
+                held = pipeline.get(lock_key)
+                if held is not None and (held.decode() if isinstance(held, bytes) else held) == token:
+                    pipeline.multi()
+                    pipeline.delete(lock_key)
+                    pipeline.execute()
+            except WatchError:
+                # Lost a race with expiry or another holder: the lock is no longer ours
+                pass
+
+
+def open_cache(url: str) -> CacheBackend:
+    """Create a cache from a URL: ``memory://`` or a ``redis://``/``rediss://``/``unix://`` URL."""
+    if url == "memory://":
+        return MemoryCache()
+    return RedisCache.from_url(url)
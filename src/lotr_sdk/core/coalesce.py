@@ -0,0 +1,108 @@
+"""Deduplication of identical in-flight requests."""
+
+import threading
+from collections.abc import Awaitable, Callable, Hashable
+from concurrent.futures import Future
+from typing import Any
+
+import anyio
+
+from lotr_sdk.core.errors import DeadlineExceededError
+from lotr_sdk.core.timeouts import check_deadline
+
+
+class _Call:
+    """An in-flight asynchronous call shared by every caller with the same key."""
+
+    def __init__(self) -> None:
+        self.done = anyio.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class Coalescer:
+    """Shares the result of a call among concurrent callers with the same key.
+
+    The first caller for a key runs the call; callers arriving while it is in
+    flight wait for and receive its result, or its error. Nothing is cached:
+    once the call completes, the next caller runs it again.
+
+    A waiting caller is still bound by its own deadline, not by that of the
+    caller running the call. If the running call fails with a
+    :class:`DeadlineExceededError`, or is cancelled, the waiting callers run
+    the call themselves rather than share a failure that was not theirs.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._futures: dict[Hashable, Future[Any]] = {}
+        self._calls: dict[Hashable, _Call] = {}
+
+    def run[T](self, key: Hashable, call: Callable[[], T]) -> T:
+        """Run ``call``, or wait for an identical call already running on another thread.
+
+        Args:
+            key: Identity of the call
+            call: Function to run
+
+        Returns:
+            The call's result
+
+        Raises:
+            DeadlineExceededError: If the current deadline passes while waiting
+        """
+        while True:
+            with self._lock:
+                future = self._futures.get(key)
+                if future is None:
+                    future = self._futures[key] = Future()
+                    break
+            left = check_deadline()
+            try:
+                result: T = future.result(timeout=left)
+            except DeadlineExceededError:
+                continue
+            except TimeoutError:
+                if future.done():
+                    raise
+                raise DeadlineExceededError() from None
+            return result
+
+        try:
+            result = call()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._futures[key]
+
+    async def run_async[T](self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """Asynchronous version of :meth:`run`."""
+        while (shared := self._calls.get(key)) is not None:
+            with anyio.move_on_after(check_deadline()) as scope:
+                await shared.done.wait()
+            if scope.cancelled_caught:
+                raise DeadlineExceededError()
+            if shared.error is None:
+                result: T = shared.result
+                return result
+            cancelled = anyio.get_cancelled_exc_class()
+            if not isinstance(shared.error, DeadlineExceededError | cancelled):
+                raise shared.error
+
+        shared = self._calls[key] = _Call()
+        try:
+            result = await call()
+            shared.result = result
+            return result
+        except BaseException as e:
+            shared.error = e
+            raise
+        finally:
+            if self._calls.get(key) is shared:
+                del self._calls[key]
+            shared.done.set()
@@ -0,0 +1,77 @@
+"""Backend-agnostic structured concurrency helpers built on AnyIO.
+
+Everything here runs under asyncio and Trio alike.
+"""
+
+from collections.abc import Awaitable, Callable, Coroutine, Iterable
+from typing import Any, Protocol
+
+import anyio
+
+
+class AsyncQueue[T](Protocol):
+    """Anything records can be put into: an ``asyncio.Queue`` or similar."""
+
+    async def put(self, item: T) -> None: ...
+
+
+class AsyncSendStream[T](Protocol):
+    """An AnyIO memory object send stream, or anything else with ``send``."""
+
+    async def send(self, item: T) -> None: ...
+
+
+def _first_error(group: BaseExceptionGroup) -> BaseException:
+    error: BaseException = group
+    while isinstance(error, BaseExceptionGroup):
+        error = error.exceptions[0]
+    return error
+
+
+async def gather[T](awaitables: Iterable[Awaitable[T]], *, limit: int | None = None) -> list[T]:
+    """Await several awaitables concurrently inside a task group.
+
+    Unlike ``asyncio.gather``, the first failure cancels every other task. The
+    failure is re-raised as is rather than wrapped in an exception group, so
+    callers can keep catching specific API errors.
+
+    Args:
+        awaitables: Awaitables to run
+        limit: Maximum number running at once, unlimited if None
+
+    Returns:
+        Results in input order
+    """
+    awaitables = list(awaitables)
+    results: list[Any] = [None] * len(awaitables)
+    limiter = anyio.CapacityLimiter(limit) if limit else None
+
+    async def run(index: int, awaitable: Awaitable[T]) -> None:
+        if limiter is None:
+            results[index] = await awaitable
+            return
+        async with limiter:
+            results[index] = await awaitable
+
+    try:
+        async with anyio.create_task_group() as group:
+            for index, awaitable in enumerate(awaitables):
+                group.start_soon(run, index, awaitable)
+    except BaseExceptionGroup as e:
+        raise _first_error(e) from None
+    return results
+
+
+async def run_workers(worker: Callable[[], Coroutine[Any, Any, None]], count: int) -> None:
+    """Run ``count`` copies of a worker in a task group until all of them return.
+
+    Args:
+        worker: Coroutine function to run
+        count: Number of concurrent copies
+    """
+    try:
+        async with anyio.create_task_group() as group:
+            for _ in range(count):
+                group.start_soon(worker)
+    except BaseExceptionGroup as e:
+        raise _first_error(e) from None
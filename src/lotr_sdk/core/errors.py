@@ -24,3 +24,11 @@ class ServerError(APIError):
 
 class RetryError(APIError):
     """Raised when all retry attempts are exhausted."""
+
+
+class DeadlineExceededError(APIError):
+    """Raised when a call's deadline passes before it completes."""
+
+
+class CassetteMissError(APIError):
+    """Raised when a replayed cassette holds no response for a request."""
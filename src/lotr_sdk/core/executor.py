@@ -0,0 +1,61 @@
+import contextvars
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ParallelExecutor:
+    """Runs blocking calls on a shared thread pool.
+
+    ``httpx.Client`` is thread-safe, so every worker shares the same connection
+    pool. With ``max_workers`` of 1 (the default) calls run inline, one after
+    another, exactly as they would without an executor.
+    """
+
+    def __init__(self, max_workers: int = 1):
+        """Initialize the executor.
+
+        Args:
+            max_workers: Maximum number of threads used for parallel calls
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        self._pool: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="lotr-sdk",
+                )
+            return self._pool
+
+    def map[T, R](self, fn: Callable[[T], R], items: Iterable[T]) -> list[R]:
+        """Call ``fn`` for every item and return the results in input order.
+
+        Args:
+            fn: Blocking callable to run
+            items: Arguments to call ``fn`` with
+
+        Returns:
+            List of results, in the same order as ``items``
+
+        Raises:
+            Exception: The first error raised by any of the calls
+        """
+        items = list(items)
+        if self.max_workers == 1 or len(items) <= 1:
+            return [fn(item) for item in items]
+        # Carry context variables, such as the call's deadline, into the worker threads
+        context = contextvars.copy_context()
+        return list(self._get_pool().map(lambda item: context.copy().run(fn, item), items))
+
+    def shutdown(self) -> None:
+        """Shut down the thread pool, waiting for running calls to finish."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True)
+                self._pool = None
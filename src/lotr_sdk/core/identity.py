@@ -0,0 +1,119 @@
+"""Identity map sharing one instance among equal resources.
+
+Resources are frozen, so a record fetched several times, through overlapping
+pages or through both ``get`` and ``list``, can be a single object. Lookups are
+keyed by resource type and ID, plus a hashable copy of the raw record, so a
+record that changed on the server builds a new instance rather than returning
+the stale one. A hit also skips validation of the record.
+"""
+
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable
+from typing import Any
+
+IdentityKey = tuple[type, Any, Hashable]
+
+
+def fingerprint(doc: dict[str, Any]) -> Hashable:
+    """Return a hashable copy of a raw record, equal for records with the same fields and values.
+
+    Fingerprints are compared for equality, not only by hash, so records that
+    differ never share an instance. Nested objects become frozensets and
+    arrays tuples, so an object and an array of pairs stay distinct.
+    """
+    return _freeze(doc)
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value  # type: ignore[no-any-return]
+
+
+class IdentityMap:
+    """Maps resource type, ID and record fingerprint to a shared instance.
+
+    With ``maxsize`` of None, instances are held by weak references and an
+    entry lives as long as the instance is used somewhere. Otherwise the
+    ``maxsize`` most recently used instances are kept alive, and an updated
+    record replaces the previous version of its resource.
+
+    Attributes:
+        hits: Number of lookups that returned an existing instance
+        misses: Number of lookups that built a new instance
+    """
+
+    def __init__(self, maxsize: int | None = None):
+        """Initialize the identity map.
+
+        Args:
+            maxsize: Maximum number of instances kept alive, or None to use weak references
+        """
+        if maxsize is not None and maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._weak: weakref.WeakValueDictionary[IdentityKey, Any] = weakref.WeakValueDictionary()
+        self._recent: OrderedDict[tuple[type, Any], tuple[Hashable, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._weak) if self.maxsize is None else len(self._recent)
+
+    def _lookup(self, model: type, resource_id: Any, digest: Hashable) -> Any:
+        if self.maxsize is None:
+            return self._weak.get((model, resource_id, digest))
+        entry = self._recent.get((model, resource_id))
+        if entry is None or entry[0] != digest:
+            return None
+        self._recent.move_to_end((model, resource_id))
+        return entry[1]
+
+    def _store(self, model: type, resource_id: Any, digest: Hashable, instance: Any) -> None:
+        if self.maxsize is None:
+            self._weak[(model, resource_id, digest)] = instance
+            return
+        self._recent[(model, resource_id)] = (digest, instance)
+        self._recent.move_to_end((model, resource_id))
+        while len(self._recent) > self.maxsize:
+            self._recent.popitem(last=False)
+
+    def resolve[M](self, model: type[M], doc: dict[str, Any]) -> M:
+        """Return the shared instance for a raw record, building it on first sight.
+
+        Args:
+            model: Resource model
+            doc: Raw record as returned by the API
+
+        Returns:
+            An instance of ``model``, shared with every earlier lookup of an identical record
+        """
+        resource_id = doc.get("_id", doc.get("id"))
+        if resource_id is None:
+            return model(**doc)
+        digest = fingerprint(doc)
+        with self._lock:
+            shared: M | None = self._lookup(model, resource_id, digest)
+            if shared is not None:
+                self.hits += 1
+                return shared
+        instance = model(**doc)
+        with self._lock:
+            self.misses += 1
+            self._store(model, resource_id, digest, instance)
+        return instance
+
+    def resolve_many[M](self, model: type[M], docs: Iterable[dict[str, Any]]) -> list[M]:
+        """Resolve several raw records, see :meth:`resolve`."""
+        return [self.resolve(model, doc) for doc in docs]
+
+    def clear(self) -> None:
+        """Forget every instance."""
+        with self._lock:
+            self._weak.clear()
+            self._recent.clear()
@@ -0,0 +1,182 @@
+"""A pool of API keys with per-key quota tracking."""
+
+import math
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import Literal
+
+KeyStrategy = Literal["least_used", "weighted"]
+
+# How long a key is benched after a 429 that says nothing about when its quota resets
+DEFAULT_BENCH_SECONDS = 60.0
+
+# ``X-RateLimit-Reset`` values above this are Unix timestamps, values below are delays in seconds
+_TIMESTAMP_THRESHOLD = 1_000_000_000
+
+
+@dataclass
+class KeyState:
+    """Usage and quota of one API key.
+
+    Attributes:
+        key: The API key
+        limit: Requests allowed per quota window, once reported by the server
+        remaining: Requests left in the current window, once reported by the server
+        in_flight: Requests currently using the key
+        used: Requests sent with the key
+        rate_limited: Number of 429 responses received with the key
+        benched_until: Monotonic time before which the key is not used
+        current_weight: Running weight used by weighted round-robin
+    """
+
+    key: str
+    limit: int | None = None
+    remaining: int | None = None
+    in_flight: int = 0
+    used: int = 0
+    rate_limited: int = 0
+    benched_until: float = 0.0
+    current_weight: float = 0.0
+
+    def load(self) -> tuple[int, float, int]:
+        """Return a sort key ranking the least used key first. Keys with unknown quota count as fresh."""
+        remaining = self.remaining if self.remaining is not None else math.inf
+        return (self.in_flight, -remaining, self.used)
+
+    def weight(self) -> float:
+        """Return the key's share in weighted selection: its remaining quota, if known."""
+        if self.remaining is not None:
+            return max(self.remaining - self.in_flight, 0)
+        return self.limit or 1
+
+
+class KeyPool:
+    """Spreads requests over several API keys.
+
+    Each response's rate limit headers update the quota of the key that sent
+    it. Keys that exhaust their quota or receive a 429 are benched until their
+    reset time. With the ``least_used`` strategy, a request gets the key with
+    the fewest requests in flight and the most quota left; with ``weighted``,
+    keys take turns in proportion to their remaining quota (smooth weighted
+    round-robin).
+    """
+
+    def __init__(
+        self,
+        keys: Iterable[str],
+        *,
+        strategy: KeyStrategy = "least_used",
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the pool.
+
+        Args:
+            keys: API keys, duplicates are ignored
+            strategy: How to choose among available keys
+            clock: Monotonic clock, replaceable for tests
+        """
+        self.states = {key: KeyState(key) for key in dict.fromkeys(keys)}
+        if not self.states:
+            raise ValueError("At least one API key is required")
+        self.strategy = strategy
+        self.clock = clock
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.states)
+
+    def _available(self) -> list[KeyState]:
+        now = self.clock()
+        available = []
+        for state in self.states.values():
+            if state.benched_until > now:
+                continue
+            if state.benched_until:
+                # The quota window has reset: the key is fresh again until the server says otherwise
+                state.benched_until = 0.0
+                state.remaining = state.limit
+            available.append(state)
+        return available
+
+    def available(self) -> int:
+        """Return the number of keys not currently benched."""
+        with self._lock:
+            return len(self._available())
+
+    def next_available(self) -> float:
+        """Return the seconds until a benched key becomes available again, 0 if one already is."""
+        with self._lock:
+            soonest = min(state.benched_until for state in self.states.values())
+            return max(soonest - self.clock(), 0.0)
+
+    def acquire(self) -> str | None:
+        """Choose a key for a request.
+
+        Every acquired key must be given back with :meth:`release`.
+
+        Returns:
+            The key, or None if every key is benched
+        """
+        with self._lock:
+            candidates = self._available()
+            if not candidates:
+                return None
+            if self.strategy == "weighted":
+                total = 0.0
+                for state in candidates:
+                    state.current_weight += state.weight()
+                    total += state.weight()
+                chosen = max(candidates, key=lambda state: state.current_weight)
+                chosen.current_weight -= total
+            else:
+                chosen = min(candidates, key=KeyState.load)
+            chosen.in_flight += 1
+            chosen.used += 1
+            return chosen.key
+
+    def release(self, key: str, status_code: int | None = None, headers: Mapping[str, str] | None = None) -> None:
+        """Return a key after its request, updating its quota from the response.
+
+        Args:
+            key: Key returned by :meth:`acquire`
+            status_code: Response status, None if no response was received
+            headers: Response headers, with lowercase names
+        """
+        headers = headers or {}
+        with self._lock:
+            state = self.states[key]
+            state.in_flight -= 1
+            now = self.clock()
+            if (limit := _int_header(headers, "x-ratelimit-limit")) is not None:
+                state.limit = limit
+            if (remaining := _int_header(headers, "x-ratelimit-remaining")) is not None:
+                state.remaining = remaining
+            reset = _reset_delay(headers)
+            if status_code == HTTPStatus.TOO_MANY_REQUESTS:
+                state.rate_limited += 1
+                state.remaining = 0
+                state.benched_until = now + (reset if reset is not None else DEFAULT_BENCH_SECONDS)
+            elif state.remaining == 0 and reset is not None:
+                state.benched_until = now + reset
+
+
+def _int_header(headers: Mapping[str, str], name: str) -> int | None:
+    try:
+        return int(headers[name])
+    except (KeyError, ValueError):
+        return None
+
+
+def _reset_delay(headers: Mapping[str, str]) -> float | None:
+    """Return the seconds until the quota resets, from ``Retry-After`` or ``X-RateLimit-Reset``."""
+    if (retry_after := _int_header(headers, "retry-after")) is not None:
+        return float(max(retry_after, 0))
+    reset = _int_header(headers, "x-ratelimit-reset")
+    if reset is None:
+        return None
+    if reset > _TIMESTAMP_THRESHOLD:
+        return max(reset - time.time(), 0.0)
+    return float(max(reset, 0))
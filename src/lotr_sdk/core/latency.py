@@ -0,0 +1,69 @@
+"""Per-endpoint latency tracking."""
+
+import re
+import statistics
+import threading
+from collections import deque
+
+# Path segments that identify a single resource, such as Mongo IDs
+_ID_SEGMENT = re.compile(r"/[0-9a-fA-F]{24}(?=/|$)")
+
+
+def endpoint_key(url: str) -> str:
+    """Group URLs by endpoint, replacing resource IDs with ``{id}``.
+
+    Args:
+        url: Request URL or path
+
+    Returns:
+        The endpoint, such as ``/v2/movie/{id}/quote``
+    """
+    return _ID_SEGMENT.sub("/{id}", url.split("?", 1)[0])
+
+
+class LatencyTracker:
+    """Keeps a sliding window of recent request latencies per endpoint."""
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        """Initialize the tracker.
+
+        Args:
+            window: Number of recent latencies kept per endpoint
+            min_samples: Samples needed before percentiles are reported
+        """
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: dict[str, deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, url: str, seconds: float) -> None:
+        """Record the latency of a completed request.
+
+        Args:
+            url: Request URL or path
+            seconds: Time from sending the request to receiving the response
+        """
+        endpoint = endpoint_key(url)
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def percentile(self, url: str, q: float) -> float | None:
+        """Return the ``q``-th latency percentile of an endpoint.
+
+        Args:
+            url: Request URL or path
+            q: Percentile between 0 and 100
+
+        Returns:
+            The percentile in seconds, or None until ``min_samples`` latencies are recorded
+        """
+        with self._lock:
+            samples = list(self._samples.get(endpoint_key(url), ()))
+        if len(samples) < max(self.min_samples, 2):
+            return None
+        cuts = statistics.quantiles(samples, n=1000, method="inclusive")
+        index = min(max(round(q * 10) - 1, 0), len(cuts) - 1)
+        return cuts[index]
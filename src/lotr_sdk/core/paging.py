@@ -0,0 +1,75 @@
+"""Adaptive page sizing for full-collection scans."""
+
+import threading
+
+
+class PageSizeController:
+    """Chooses the page size of each request in a bulk scan.
+
+    The first request uses a modest page size. Its latency gives a per-record
+    cost, from which the controller sizes the next pages to take about
+    ``target_latency`` seconds each, growing at most ``max_growth`` times per
+    step. A page the server answers with fewer records than requested, while
+    more remain, reveals the server's maximum page size. Failed requests halve
+    the page size, so a scan backs off before it times out.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial: int = 100,
+        minimum: int = 10,
+        maximum: int = 1000,
+        target_latency: float = 2.0,
+        max_growth: float = 4.0,
+    ):
+        """Initialize the controller.
+
+        Args:
+            initial: Page size of the first request
+            minimum: Smallest page size to request
+            maximum: Largest page size to request, lowered if the server caps page sizes
+            target_latency: Desired duration of a single request in seconds
+            max_growth: Largest factor by which the page size grows between requests
+        """
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError("Page sizes must satisfy 1 <= minimum <= initial <= maximum")
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.max_growth = max_growth
+        self.size = initial
+        self._lock = threading.Lock()
+
+    def _clamp(self, size: float) -> int:
+        return max(self.minimum, min(self.maximum, int(size)))
+
+    def record(self, *, requested: int, returned: int, remaining: int, latency: float) -> None:
+        """Adjust the page size after a successful request.
+
+        Args:
+            requested: Page size that was requested
+            returned: Number of records the server returned
+            remaining: Number of records left after this page
+            latency: Duration of the request in seconds
+        """
+        with self._lock:
+            if 0 < returned < requested and remaining > 0:
+                self.maximum = max(self.minimum, returned)
+            if returned == 0 or latency <= 0:
+                self.size = self._clamp(self.size * self.max_growth)
+                return
+            ideal = self.target_latency * returned / latency
+            self.size = self._clamp(min(ideal, self.size * self.max_growth))
+
+    def failed(self) -> bool:
+        """Shrink the page size after a failed request.
+
+        Returns:
+            True if the page size was reduced, False if it is already at the minimum
+        """
+        with self._lock:
+            if self.size <= self.minimum:
+                return False
+            self.size = self._clamp(self.size / 2)
+            return True
@@ -0,0 +1,165 @@
+"""Priority scheduling of asynchronous requests.
+
+Interactive calls and background crawls share one client. The scheduler caps
+the number of requests in flight and grants free slots by weighted fair
+queuing across priority classes, so a crawl cannot starve interactive calls.
+The priority of a call comes from the :func:`priority` context manager, or
+from a service bound with ``with_priority``.
+"""
+
+import itertools
+from collections.abc import AsyncIterator, Iterator, Mapping
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+import anyio
+
+DEFAULT_PRIORITY = "interactive"
+
+_priority: ContextVar[str | None] = ContextVar("lotr_sdk_priority", default=None)
+
+
+@contextmanager
+def priority(name: str) -> Iterator[None]:
+    """Run the requests made inside the block, and in tasks started from it, at a priority class.
+
+    Args:
+        name: Priority class, such as ``"interactive"`` or ``"batch"``
+    """
+    token = _priority.set(name)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> str | None:
+    """Return the priority class set for the current context, if any."""
+    return _priority.get()
+
+
+class _Waiter:
+    def __init__(self, name: str, tag: float, order: int):
+        self.name = name
+        self.tag = tag
+        self.order = order
+        self.granted = anyio.Event()
+
+
+class RequestScheduler:
+    """Grants request slots by weighted fair queuing across priority classes.
+
+    Each waiting request gets a virtual finish tag of ``1 / weight`` after the
+    previous request of its class, and the free slot goes to the smallest tag.
+    A class with weight 8 thus gets eight slots for every one of a class with
+    weight 1 while both are waiting, and all of them when the other is idle.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        *,
+        weights: Mapping[str, float] | None = None,
+        limits: Mapping[str, int] | None = None,
+        default: str = DEFAULT_PRIORITY,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            max_concurrency: Maximum number of requests in flight across all classes
+            weights: Share of each priority class, unknown classes weigh 1
+            limits: Maximum number of requests in flight per priority class
+            default: Priority class of requests made without one
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self.weights = dict(weights or {})
+        self.limits = dict(limits or {})
+        self.default = default
+        self.in_flight: dict[str, int] = {}
+        self._waiters: list[_Waiter] = []
+        self._finish: dict[str, float] = {}
+        self._virtual_time = 0.0
+        self._order = itertools.count()
+
+    @property
+    def total_in_flight(self) -> int:
+        return sum(self.in_flight.values())
+
+    def _eligible(self, name: str) -> bool:
+        limit = self.limits.get(name)
+        return limit is None or self.in_flight.get(name, 0) < limit
+
+    def _dispatch(self) -> None:
+        """Grant free slots to the waiters with the smallest finish tags."""
+        while self._waiters and self.total_in_flight < self.max_concurrency:
+            candidates = [waiter for waiter in self._waiters if self._eligible(waiter.name)]
+            if not candidates:
+                return
+            waiter = min(candidates, key=lambda waiter: (waiter.tag, waiter.order))
+            self._waiters.remove(waiter)
+            self._virtual_time = max(self._virtual_time, waiter.tag)
+            self.in_flight[waiter.name] = self.in_flight.get(waiter.name, 0) + 1
+            waiter.granted.set()
+
+    def _release(self, name: str) -> None:
+        self.in_flight[name] -= 1
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, name: str | None = None) -> AsyncIterator[None]:
+        """Wait for a request slot and hold it for the duration of the block.
+
+        Args:
+            name: Priority class, defaults to the current context's
+        """
+        name = name or current_priority() or self.default
+        start = max(self._virtual_time, self._finish.get(name, 0.0))
+        tag = self._finish[name] = start + 1 / self.weights.get(name, 1.0)
+        waiter = _Waiter(name, tag, next(self._order))
+        self._waiters.append(waiter)
+        self._dispatch()
+        try:
+            await waiter.granted.wait()
+        except BaseException:
+            if waiter.granted.is_set():
+                self._release(name)
+            else:
+                self._waiters.remove(waiter)
+            raise
+        try:
+            yield
+        finally:
+            self._release(name)
+
+
+class PrioritizedClient:
+    """Wraps an HTTPClient so that its asynchronous requests run at a fixed priority class."""
+
+    def __init__(self, client: Any, priority: str):
+        """Initialize the wrapper.
+
+        Args:
+            client: HTTPClient to wrap
+            priority: Priority class of every asynchronous request
+        """
+        self.client = client
+        self.priority = priority
+
+    def __getattr__(self, name: str) -> Any:
+        # Everything but requests, such as settings or prefetch, comes from the wrapped client
+        if name == "client":
+            raise AttributeError(name)
+        return getattr(self.client, name)
+
+    def request(self, *args: Any, **kwargs: Any) -> Any:
+        return self.client.request(*args, **kwargs)
+
+    async def request_async(self, *args: Any, **kwargs: Any) -> Any:
+        with priority(self.priority):
+            return await self.client.request_async(*args, **kwargs)
+
+    def close(self) -> None:
+        self.client.close()
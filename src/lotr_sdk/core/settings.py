@@ -1,3 +1,5 @@
+from typing import Literal
+
 from pydantic import Field
 from pydantic_settings import (
     BaseSettings,
@@ -5,14 +7,111 @@ from pydantic_settings import (
     SettingsConfigDict,
 )
 
+from lotr_sdk.core.codec import CodecName
+from lotr_sdk.core.keys import KeyStrategy
+from lotr_sdk.core.timeouts import Timeouts
+
 
 class Settings(BaseSettings):
     api_key: str = Field(..., description="API key for authentication")
+    api_keys: list[str] = Field(
+        default_factory=list,
+        description="Additional API keys; requests are spread over all keys",
+    )
+    key_strategy: KeyStrategy = Field(
+        default="least_used",
+        description="How to choose among API keys: least_used or weighted by remaining quota",
+    )
     base_url: str = Field(default="https://the-one-api.dev", description="Base URL for API requests")
     timeout: float = Field(default=30.0, description="Request timeout in seconds")
+    connect_timeout: float | None = Field(default=None, gt=0, description="Connect timeout, defaults to timeout")
+    read_timeout: float | None = Field(default=None, gt=0, description="Read timeout, defaults to timeout")
+    pool_timeout: float | None = Field(
+        default=None,
+        gt=0,
+        description="Time to wait for a pooled connection, defaults to timeout",
+    )
+    adaptive_timeouts: bool = Field(
+        default=False,
+        description="Derive connect and read timeouts from each endpoint's observed p99 latency",
+    )
+    timeout_multiplier: float = Field(default=4.0, gt=0, description="Adaptive timeouts as a multiple of p99 latency")
+    min_timeout: float = Field(default=1.0, gt=0, description="Floor of adaptive timeouts in seconds")
     max_retries: int = Field(default=3, description="Maximum number of retry attempts")
     retry_delay: float = Field(default=1.0, description="Delay between retries in seconds")
     user_agent: str = Field(default="lotr-sdk/1.0.0", description="User agent string for requests")
+    projection_param: str | None = Field(
+        default=None,
+        description="Query parameter for server-side field projection, if the server supports one",
+    )
+    max_workers: int = Field(default=1, ge=1, description="Threads used for parallel synchronous requests")
+    max_page_size: int = Field(default=1000, ge=1, description="Largest page size requested by adaptive scans")
+    target_page_latency: float = Field(
+        default=2.0,
+        gt=0,
+        description="Desired duration in seconds of each request in adaptive scans",
+    )
+    max_concurrent_requests: int | None = Field(
+        default=None,
+        ge=1,
+        description="Cap on asynchronous requests in flight, enabling priority scheduling",
+    )
+    priority_weights: dict[str, float] = Field(
+        default_factory=lambda: {"interactive": 8.0, "batch": 1.0},
+        description="Share of request slots per priority class under contention",
+    )
+    priority_limits: dict[str, int] = Field(
+        default_factory=dict,
+        description="Cap on asynchronous requests in flight per priority class",
+    )
+    hedge_requests: bool = Field(
+        default=False,
+        description="Send a duplicate async GET when the first is slower than the endpoint's usual latency",
+    )
+    hedge_percentile: float = Field(
+        default=95.0,
+        gt=0,
+        lt=100,
+        description="Latency percentile of an endpoint after which a request is hedged",
+    )
+    hedge_max_rate: float = Field(
+        default=0.05,
+        ge=0,
+        le=1,
+        description="Largest fraction of hedgeable requests that may be hedged",
+    )
+    coalesce_requests: bool = Field(
+        default=True,
+        description="Send identical concurrent GET requests once and share the response",
+    )
+    cache_url: str | None = Field(
+        default=None,
+        description="Response cache for GET requests: memory:// or a redis:// URL shared by processes",
+    )
+    cache_ttl: float = Field(default=300.0, gt=0, description="Time in seconds a cached response stays fresh")
+    identity_map: Literal["off", "weak", "lru"] = Field(
+        default="off",
+        description="Share one instance among equal resources: off, by weak reference, or among the most recent",
+    )
+    identity_map_size: int = Field(default=10_000, ge=1, description="Resources kept alive by the lru identity map")
+    json_codec: CodecName = Field(
+        default="auto",
+        description="JSON codec for request and response bodies, auto picks the fastest installed",
+    )
+
+    @property
+    def timeouts(self) -> Timeouts:
+        """Return the configured per-attempt timeouts, falling back to ``timeout``."""
+        return Timeouts(
+            connect=self.connect_timeout or self.timeout,
+            read=self.read_timeout or self.timeout,
+            pool=self.pool_timeout or self.timeout,
+        )
+
+    @property
+    def all_api_keys(self) -> list[str]:
+        """Return every configured API key, ``api_key`` first, without duplicates."""
+        return list(dict.fromkeys([self.api_key, *self.api_keys]))
 
     model_config = SettingsConfigDict(env_prefix="LOTR_", case_sensitive=False)
 
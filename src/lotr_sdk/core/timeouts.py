@@ -0,0 +1,161 @@
+"""Request timeouts and call deadlines.
+
+A deadline bounds a whole service call, including every retry and every page
+it fetches. It is kept in a context variable, so it reaches the HTTP client
+through any number of layers, and into tasks and executor threads started
+during the call.
+"""
+
+import functools
+import inspect
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from typing import Any
+
+from lotr_sdk.core.errors import DeadlineExceededError
+
+_deadline: ContextVar[float | None] = ContextVar("lotr_sdk_deadline", default=None)
+
+
+@dataclass(frozen=True)
+class Timeouts:
+    """Timeouts of a single request attempt, in seconds.
+
+    Attributes:
+        connect: Time allowed to establish a connection
+        read: Time allowed between bytes of the response
+        pool: Time allowed to wait for a free connection from the pool
+    """
+
+    connect: float
+    read: float
+    pool: float
+
+    @property
+    def total(self) -> float:
+        """Upper bound on the duration of an attempt."""
+        return self.pool + self.connect + self.read
+
+    def capped(self, seconds: float) -> "Timeouts":
+        """Return the timeouts scaled down so that their :attr:`total` does not exceed ``seconds``.
+
+        The phases of an attempt run one after another, so capping each of them
+        at ``seconds`` would let the attempt as a whole run up to three times
+        longer. Instead the budget is split across the phases in proportion to
+        their configured timeouts.
+        """
+        if self.total <= seconds:
+            return self
+        scale = max(seconds, 0.0) / self.total
+        return replace(self, connect=self.connect * scale, read=self.read * scale, pool=self.pool * scale)
+
+
+def _expiry(seconds: float) -> float:
+    """Return the monotonic expiry of a deadline ``seconds`` from now, within the current one."""
+    expires = time.monotonic() + seconds
+    current = _deadline.get()
+    return expires if current is None else min(current, expires)
+
+
+@contextmanager
+def deadline(seconds: float | None) -> Iterator[None]:
+    """Bound every request made inside the block to finish within ``seconds`` from now.
+
+    Nested deadlines never extend an enclosing one.
+
+    Args:
+        seconds: Time budget, or None for no additional bound
+    """
+    if seconds is None:
+        yield
+        return
+    token = _deadline.set(_expiry(seconds))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+# Service methods take a ``deadline`` argument that shadows the context manager
+_bound = deadline
+
+
+def remaining() -> float | None:
+    """Return the seconds left until the current deadline, or None if there is none."""
+    expires = _deadline.get()
+    if expires is None:
+        return None
+    return expires - time.monotonic()
+
+
+def check_deadline() -> float | None:
+    """Return the seconds left until the current deadline, raising if it has passed.
+
+    Raises:
+        DeadlineExceededError: If the deadline has passed
+    """
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceededError()
+    return left
+
+
+def _iterate[T](iterator: Iterator[T], seconds: float) -> Iterator[T]:
+    expires = _expiry(seconds)
+    while True:
+        token = _deadline.set(expires)
+        try:
+            item = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            _deadline.reset(token)
+        yield item
+
+
+async def _aiterate[T](iterator: AsyncIterator[T], seconds: float) -> AsyncIterator[T]:
+    expires = _expiry(seconds)
+    while True:
+        token = _deadline.set(expires)
+        try:
+            item = await anext(iterator)
+        except StopAsyncIteration:
+            return
+        finally:
+            _deadline.reset(token)
+        yield item
+
+
+def accepts_deadline[F: Callable[..., Any]](method: F) -> F:
+    """Add a ``deadline`` keyword argument, in seconds, to a service method.
+
+    The deadline applies to every request the method makes. For methods
+    returning an iterator it covers the whole iteration, measured from the call.
+    The wrapper consumes the argument, so the method only declares it, with a
+    default of None, for type checkers.
+    """
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def async_wrapper(*args: Any, deadline: float | None = None, **kwargs: Any) -> Any:
+            with _bound(deadline):
+                return await method(*args, **kwargs)
+
+        return async_wrapper  # type: ignore[return-value]
+
+    @functools.wraps(method)
+    def wrapper(*args: Any, deadline: float | None = None, **kwargs: Any) -> Any:
+        with _bound(deadline):
+            result = method(*args, **kwargs)
+        if deadline is None:
+            return result
+        if isinstance(result, AsyncIterator):
+            return _aiterate(result, deadline)
+        if isinstance(result, Iterator):
+            return _iterate(result, deadline)
+        return result
+
+    return wrapper  # type: ignore[return-value]
@@ -0,0 +1,391 @@
+"""Bulk export of quotes and movies to NDJSON, CSV or Parquet shards."""
+
+import csv
+import json
+import math
+import multiprocessing
+import threading
+import time
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Literal, Protocol
+
+from loguru import logger
+
+from lotr_sdk.core.settings import Settings
+from lotr_sdk.lotr import LotrAPI
+from lotr_sdk.schemas.base import BaseResource, Pagination
+
+ExportFormat = Literal["ndjson", "csv", "parquet"]
+PartitionBy = Literal["page", "movie"]
+
+_EXTENSIONS: dict[str, str] = {"ndjson": "ndjson", "csv": "csv", "parquet": "parquet"}
+
+
+class RateBudget:
+    """Request budget shared by every process taking part in an export.
+
+    Requests are spaced ``1 / requests_per_second`` apart. The lock and the next
+    free slot may be ``multiprocessing.Manager`` proxies, which lets worker
+    processes draw from the same budget as the coordinator.
+    """
+
+    def __init__(self, requests_per_second: float, lock: Any = None, next_slot: Any = None):
+        """Initialize the budget.
+
+        Args:
+            requests_per_second: Maximum request rate across all workers
+            lock: Lock guarding ``next_slot``
+            next_slot: Object whose ``value`` holds the next free slot as a UNIX timestamp
+        """
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive")
+        self.interval = 1.0 / requests_per_second
+        self._lock = lock if lock is not None else threading.Lock()
+        self._next_slot = next_slot if next_slot is not None else SimpleNamespace(value=0.0)
+
+    @classmethod
+    def shared(cls, manager: Any, requests_per_second: float) -> "RateBudget":
+        """Create a budget that can be passed to worker processes.
+
+        Args:
+            manager: A running ``multiprocessing.Manager``
+            requests_per_second: Maximum request rate across all workers
+
+        Returns:
+            A picklable RateBudget backed by manager proxies
+        """
+        return cls(requests_per_second, lock=manager.Lock(), next_slot=manager.Value("d", 0.0))
+
+    def acquire(self) -> None:
+        """Block until the caller may send its next request."""
+        with self._lock:
+            now = time.time()
+            slot = max(now, self._next_slot.value)
+            self._next_slot.value = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+@dataclass(frozen=True)
+class Shard:
+    """A slice of the quote space exported by a single worker.
+
+    Attributes:
+        name: Shard name, used as the output file stem
+        movie_id: Export the quotes of this movie only
+        first_page: First page to export
+        last_page: Last page to export, or None to read until the end
+        first_rows: Rows of the first page, when they were already fetched while planning
+    """
+
+    name: str
+    movie_id: str | None = None
+    first_page: int = 1
+    last_page: int | None = None
+    first_rows: tuple[dict[str, Any], ...] | None = None
+
+
+@dataclass(frozen=True)
+class ExportResult:
+    """Outcome of exporting a single shard.
+
+    Attributes:
+        shard: The exported shard
+        path: File the shard was written to
+        records: Number of records written
+        pages: Number of pages fetched
+    """
+
+    shard: Shard
+    path: Path
+    records: int
+    pages: int
+
+
+class ShardWriter(Protocol):
+    """Protocol for streaming record writers."""
+
+    def write(self, rows: list[dict[str, Any]]) -> None: ...
+
+    def close(self) -> None: ...
+
+
+class NDJSONWriter:
+    """Writes one JSON document per line."""
+
+    def __init__(self, path: Path):
+        self._file = path.open("w", encoding="utf-8")
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        self._file.writelines(json.dumps(row, ensure_ascii=False) + "\n" for row in rows)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class CSVWriter:
+    """Writes rows as CSV, taking the header from the first batch."""
+
+    def __init__(self, path: Path):
+        self._file = path.open("w", encoding="utf-8", newline="")
+        self._writer: csv.DictWriter[str] | None = None
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        if not rows:
+            return
+        if self._writer is None:
+            self._writer = csv.DictWriter(self._file, fieldnames=list(rows[0]))
+            self._writer.writeheader()
+        self._writer.writerows(rows)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ParquetWriter:
+    """Writes each batch as a Parquet row group. Requires ``pyarrow``."""
+
+    def __init__(self, path: Path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Parquet export requires pyarrow: pip install 'lotr-sdk[export]'") from e
+        self._pa = pa
+        self._pq = pq
+        self._path = path
+        self._writer: Any = None
+
+    def write(self, rows: list[dict[str, Any]]) -> None:
+        if not rows:
+            return
+        table = self._pa.Table.from_pylist(rows)
+        if self._writer is None:
+            self._writer = self._pq.ParquetWriter(self._path, table.schema)
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+
+def open_writer(path: Path, format: ExportFormat) -> ShardWriter:
+    """Open a streaming writer for the given format.
+
+    Args:
+        path: Output file
+        format: Output format
+
+    Returns:
+        A writer accepting batches of rows
+    """
+    if format == "ndjson":
+        return NDJSONWriter(path)
+    if format == "csv":
+        return CSVWriter(path)
+    if format == "parquet":
+        return ParquetWriter(path)
+    raise ValueError(f"Unsupported export format: {format}")
+
+
+def _rows(docs: Sequence[BaseResource]) -> list[dict[str, Any]]:
+    return [doc.model_dump(mode="json") for doc in docs]
+
+
+def _iter_shard_pages(api: LotrAPI, shard: Shard, limit: int, budget: RateBudget | None) -> Iterator[Any]:
+    """Yield the pages of a shard one at a time, after the first one if it was fetched while planning."""
+    page = shard.first_page if shard.first_rows is None else shard.first_page + 1
+    while shard.last_page is None or page <= shard.last_page:
+        if budget is not None:
+            budget.acquire()
+        pagination = Pagination(page=page, limit=limit)
+        if shard.movie_id is not None:
+            result = api.movies.get_quotes(shard.movie_id, pagination=pagination)
+        else:
+            result = api.quotes.list(pagination=pagination)
+        yield result
+        # Without a page count, a short page is the last one
+        last = page >= result.pages if result.pages is not None else len(result.docs) < result.limit
+        if not result.docs or last:
+            return
+        page += 1
+
+
+def export_shard(  # noqa: PLR0913
+    settings: Settings,
+    shard: Shard,
+    directory: Path,
+    *,
+    format: ExportFormat = "ndjson",
+    limit: int = 1000,
+    budget: RateBudget | None = None,
+) -> ExportResult:
+    """Export a single shard, streaming page by page to disk.
+
+    This is the unit of work run inside each worker process. Every call builds
+    its own client, since HTTP connections cannot be shared across processes.
+
+    Args:
+        settings: Client settings
+        shard: Shard to export
+        directory: Output directory
+        format: Output format
+        limit: Page size
+        budget: Shared request budget
+
+    Returns:
+        ExportResult describing the written file
+    """
+    path = directory / f"{shard.name}.{_EXTENSIONS[format]}"
+    api = LotrAPI(settings=settings)
+    writer = open_writer(path, format)
+    records = pages = 0
+    try:
+        if shard.first_rows is not None:
+            writer.write(list(shard.first_rows))
+            records += len(shard.first_rows)
+            pages += 1
+        for result in _iter_shard_pages(api, shard, limit, budget):
+            writer.write(_rows(result.docs))
+            records += len(result.docs)
+            pages += 1
+    finally:
+        writer.close()
+        api.close()
+
+    logger.info("Exported shard {name}: {records} records", name=shard.name, records=records)
+    return ExportResult(shard=shard, path=path, records=records, pages=pages)
+
+
+def plan_shards(
+    api: LotrAPI,
+    *,
+    partition_by: PartitionBy = "page",
+    limit: int = 1000,
+    shards: int | None = None,
+    budget: RateBudget | None = None,
+) -> list[Shard]:
+    """Split the quote space into shards.
+
+    With page partitioning, the first page is fetched to learn the page count
+    and handed to the first shard, so it is not requested twice.
+
+    Args:
+        api: Client used to discover the movies or the page count
+        partition_by: Partition by movie ID or by page range
+        limit: Page size used by the export
+        shards: Number of page-range shards, defaults to the CPU count
+        budget: Request budget the planning request is drawn from
+
+    Returns:
+        List of shards covering every quote
+    """
+    if budget is not None:
+        budget.acquire()
+    if partition_by == "movie":
+        return [Shard(name=f"movie-{movie.id}", movie_id=movie.id) for movie in api.movies.list()]
+
+    first = api.quotes.list(pagination=Pagination(page=1, limit=limit))
+    pages = first.pages or max(1, math.ceil(first.total / limit))
+    count = min(shards or multiprocessing.cpu_count(), pages)
+    size = math.ceil(pages / count)
+    planned = []
+    for start in range(1, pages + 1, size):
+        end = min(start + size - 1, pages)
+        first_rows = tuple(_rows(first.docs)) if start == 1 else None
+        planned.append(
+            Shard(name=f"pages-{start:05d}-{end:05d}", first_page=start, last_page=end, first_rows=first_rows)
+        )
+    return planned
+
+
+def export_quotes(  # noqa: PLR0913
+    settings: Settings,
+    directory: str | Path,
+    *,
+    format: ExportFormat = "ndjson",
+    partition_by: PartitionBy = "page",
+    limit: int = 1000,
+    max_workers: int | None = None,
+    requests_per_second: float | None = None,
+) -> list[ExportResult]:
+    """Export every quote to sharded files using a pool of worker processes.
+
+    Validation and serialization run inside the workers, so an export uses every
+    core instead of saturating one. All workers draw from a single request budget
+    held by the coordinating process.
+
+    Args:
+        settings: Client settings, passed to every worker
+        directory: Output directory, created if missing
+        format: Output format
+        partition_by: Partition the quotes by movie ID or by page range
+        limit: Page size
+        max_workers: Number of worker processes, defaults to the CPU count
+        requests_per_second: Request budget shared by all workers, unlimited if None
+
+    Returns:
+        One ExportResult per shard
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+
+    with ExitStack() as stack:
+        budget = None
+        if requests_per_second:
+            # Worker processes reach the shared budget through the manager's server process
+            manager = stack.enter_context(multiprocessing.Manager())
+            budget = RateBudget.shared(manager, requests_per_second)
+
+        api = LotrAPI(settings=settings)
+        try:
+            planned = plan_shards(api, partition_by=partition_by, limit=limit, shards=max_workers, budget=budget)
+        finally:
+            api.close()
+
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(export_shard, settings, shard, directory, format=format, limit=limit, budget=budget)
+                for shard in planned
+            ]
+            return [future.result() for future in futures]
+
+
+def export_movies(
+    settings: Settings,
+    directory: str | Path,
+    *,
+    format: ExportFormat = "ndjson",
+) -> ExportResult:
+    """Export every movie to a single file.
+
+    The movie collection is small enough that one request in the current
+    process is cheaper than starting a worker pool.
+
+    Args:
+        settings: Client settings
+        directory: Output directory, created if missing
+        format: Output format
+
+    Returns:
+        ExportResult describing the written file
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    shard = Shard(name="movies")
+    path = directory / f"{shard.name}.{_EXTENSIONS[format]}"
+
+    api = LotrAPI(settings=settings)
+    writer = open_writer(path, format)
+    try:
+        movies = api.movies.list()
+        writer.write(_rows(movies.docs))
+    finally:
+        writer.close()
+        api.close()
+    return ExportResult(shard=shard, path=path, records=len(movies.docs), pages=1)
@@ -0,0 +1,155 @@
+"""Joins quotes with the movies and characters they reference."""
+
+import inspect
+import threading
+from collections.abc import Awaitable, Callable, Collection, Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from itertools import batched
+from typing import Any
+
+from lotr_sdk.core.concurrency import gather
+from lotr_sdk.schemas.base import FieldFilter, Pagination
+from lotr_sdk.schemas.movie import Movie, MovieFilters, MovieList
+from lotr_sdk.schemas.quote import Quote
+from lotr_sdk.services.movie import MovieService
+
+CharacterResolver = Callable[[Collection[str]], Mapping[str, Any] | Awaitable[Mapping[str, Any]]]
+
+# Keeps the ``_id`` query parameter of a batched lookup well below common URL length limits
+MAX_IDS_PER_REQUEST = 100
+
+
+@dataclass(frozen=True)
+class HydratedQuote:
+    """A quote joined with the movie and character it references.
+
+    Attributes:
+        quote: The quote
+        movie: The quote's movie, or None if it could not be resolved
+        character: The quote's character, or None if no resolver was given
+    """
+
+    quote: Quote
+    movie: Movie | None
+    character: Any = None
+
+    @property
+    def dialog(self) -> str:
+        return self.quote.dialog
+
+
+class QuoteHydrator:
+    """Resolves the movies and characters referenced by quotes.
+
+    Foreign keys are collected across a whole batch of quotes and only the IDs
+    not already cached are fetched, in as few requests as possible. The cache is
+    kept for the hydrator's lifetime, so repeated renders of the same feed cost
+    no requests at all.
+    """
+
+    def __init__(self, movies: MovieService, *, characters: CharacterResolver | None = None):
+        """Initialize the hydrator.
+
+        Args:
+            movies: Service used to fetch movies
+            characters: Optional function mapping character IDs to character objects
+        """
+        self.movies = movies
+        self.characters = characters
+        self._movie_cache: dict[str, Movie] = {}
+        self._character_cache: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def _missing(self, cache: Mapping[str, Any], ids: Iterable[str]) -> list[str]:
+        with self._lock:
+            return sorted({resource_id for resource_id in ids if resource_id not in cache})
+
+    def _store(self, cache: dict[str, Any], values: Mapping[str, Any]) -> None:
+        with self._lock:
+            cache.update(values)
+
+    def _fetch_movies(self, movie_ids: Collection[str]) -> MovieList:
+        return self.movies.list(
+            filters=MovieFilters(id=FieldFilter(include=list(movie_ids))),
+            pagination=Pagination(limit=len(movie_ids)),
+        )
+
+    async def _fetch_movies_async(self, movie_ids: Collection[str]) -> MovieList:
+        return await self.movies.list_async(
+            filters=MovieFilters(id=FieldFilter(include=list(movie_ids))),
+            pagination=Pagination(limit=len(movie_ids)),
+        )
+
+    def _join(self, quotes: list[Quote]) -> list[HydratedQuote]:
+        return [
+            HydratedQuote(
+                quote=quote,
+                movie=self._movie_cache.get(quote.movie),
+                character=self._character_cache.get(quote.character),
+            )
+            for quote in quotes
+        ]
+
+    def hydrate(self, quotes: Iterable[Quote]) -> list[HydratedQuote]:
+        """Join quotes with their movies and characters.
+
+        Args:
+            quotes: Quotes to hydrate, such as a ``QuoteList``
+
+        Returns:
+            One HydratedQuote per quote, in input order
+        """
+        quotes = list(quotes)
+
+        missing = self._missing(self._movie_cache, (quote.movie for quote in quotes))
+        if missing:
+            pages = self.movies.executor.map(self._fetch_movies, batched(missing, MAX_IDS_PER_REQUEST, strict=False))
+            self._store(self._movie_cache, {movie.id: movie for page in pages for movie in page})
+
+        if self.characters is not None:
+            missing = self._missing(self._character_cache, (quote.character for quote in quotes))
+            if missing:
+                resolved = self.characters(missing)
+                if inspect.isawaitable(resolved):
+                    raise TypeError("Use hydrate_async with an asynchronous character resolver")
+                self._store(self._character_cache, resolved)
+
+        return self._join(quotes)
+
+    async def hydrate_async(self, quotes: Iterable[Quote]) -> list[HydratedQuote]:
+        """Asynchronous version of :meth:`hydrate`."""
+        quotes = list(quotes)
+
+        missing = self._missing(self._movie_cache, (quote.movie for quote in quotes))
+        if missing:
+            pages = await gather(
+                self._fetch_movies_async(ids) for ids in batched(missing, MAX_IDS_PER_REQUEST, strict=False)
+            )
+            self._store(self._movie_cache, {movie.id: movie for page in pages for movie in page})
+
+        if self.characters is not None:
+            missing = self._missing(self._character_cache, (quote.character for quote in quotes))
+            if missing:
+                resolved = self.characters(missing)
+                if inspect.isawaitable(resolved):
+                    resolved = await resolved
+                self._store(self._character_cache, resolved)
+
+        return self._join(quotes)
+
+    def iter_hydrate(self, quotes: Iterable[Quote], *, batch_size: int = 1000) -> Iterator[HydratedQuote]:
+        """Hydrate a stream of quotes, one batch at a time.
+
+        Args:
+            quotes: Quotes to hydrate
+            batch_size: Number of quotes whose foreign keys are resolved together
+
+        Yields:
+            HydratedQuote objects, in input order
+        """
+        for batch in batched(quotes, batch_size, strict=False):
+            yield from self.hydrate(batch)
+
+    def prime(self, movies: Iterable[Movie]) -> None:
+        """Seed the movie cache, for example from ``movies.list()`` or a snapshot."""
+        self._store(self._movie_cache, {movie.id: movie for movie in movies})
@@ -1,10 +1,42 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
 from lotr_sdk.client.base import HTTPClient
 from lotr_sdk.client.httpx import HTTPXClient
+from lotr_sdk.core.executor import ParallelExecutor
+from lotr_sdk.core.identity import IdentityMap
 from lotr_sdk.core.settings import Settings
+from lotr_sdk.hydration import QuoteHydrator
 from lotr_sdk.services.movie import MovieService
 from lotr_sdk.services.quote import QuoteService
 
 
+@dataclass
+class WarmupReport:
+    """Time taken by each phase of a warm-up.
+
+    Attributes:
+        phases: Duration in seconds by phase, in the order the phases ran
+    """
+
+    phases: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def total(self) -> float:
+        return sum(self.phases.values())
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as a phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = time.perf_counter() - start
+
+
 class LotrAPI:
     """Main SDK class that provides access to all resources."""
 
@@ -13,9 +45,111 @@ class LotrAPI:
         *,
         settings: Settings,
         http_client: HTTPClient | None = None,
+        max_workers: int | None = None,
     ):
         self.settings = settings
         self._http_client = http_client or HTTPXClient(settings=self.settings)
+        self._executor = ParallelExecutor(max_workers=self.settings.max_workers if max_workers is None else max_workers)
+        self.identity_map = _identity_map(self.settings)
+
+        self.movies = MovieService(self._http_client, self._executor, self.identity_map)
+        self.quotes = QuoteService(self._http_client, self._executor, self.identity_map)
+        self.hydrator = QuoteHydrator(self.movies)
+
+    def warmup(self, *, connections: int = 4, prefetch: bool = False, quote_pages: int = 1) -> WarmupReport:
+        """Prepare the client for fast first requests, for example before a readiness probe passes.
+
+        Opens keep-alive connections, then optionally fetches hot datasets: every
+        movie, which also primes ``hydrator``, and the first quote pages. With a
+        response cache configured, prefetched pages are served from the cache
+        afterwards.
+
+        Args:
+            connections: Number of keep-alive connections to open
+            prefetch: Whether to fetch the hot datasets
+            quote_pages: Number of quote pages to prefetch
+
+        Returns:
+            WarmupReport with the duration of each phase
+
+        Raises:
+            ValueError: If ``connections`` is less than 1
+        """
+        if connections < 1:
+            raise ValueError("connections must be at least 1")
+        report = WarmupReport()
+        warmup = getattr(self._http_client, "warmup", None)
+        if warmup is not None:
+            with report.phase("connect"):
+                warmup(connections)
+        if prefetch:
+            with report.phase("movies"):
+                self.hydrator.prime(self.movies.list())
+            with report.phase("quotes"):
+                self.quotes.list()
+                self.quotes.list_pages(range(2, quote_pages + 1))
+        return report
+
+    async def warmup_async(
+        self,
+        *,
+        connections: int = 4,
+        prefetch: bool = False,
+        quote_pages: int = 1,
+    ) -> WarmupReport:
+        """Asynchronous version of :meth:`warmup`, warming the asynchronous connection pool.
+
+        Call it from the event loop that will send the requests.
+        """
+        if connections < 1:
+            raise ValueError("connections must be at least 1")
+        report = WarmupReport()
+        warmup = getattr(self._http_client, "warmup_async", None)
+        if warmup is not None:
+            with report.phase("connect"):
+                await warmup(connections)
+        if prefetch:
+            with report.phase("movies"):
+                self.hydrator.prime(await self.movies.list_async())
+            with report.phase("quotes"):
+                await self.quotes.list_async()
+                await self.quotes.list_pages_async(range(2, quote_pages + 1))
+        return report
+
+    def close(self) -> None:
+        """Close the HTTP client and shut down the worker threads.
+
+        The asynchronous connection pool can only be closed from an event loop:
+        after asynchronous requests, use :meth:`close_async` instead.
+        """
+        self._http_client.close()
+        self._executor.shutdown()
+
+    async def close_async(self) -> None:
+        """Close the synchronous and asynchronous HTTP clients and shut down the worker threads."""
+        close_async = getattr(self._http_client, "close_async", None)
+        if close_async is not None:
+            await close_async()
+        else:
+            self._http_client.close()
+        self._executor.shutdown()
+
+    def __enter__(self) -> "LotrAPI":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "LotrAPI":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close_async()
+
 
-        self.movies = MovieService(self._http_client)
-        self.quotes = QuoteService(self._http_client)
+def _identity_map(settings: Settings) -> IdentityMap | None:
+    if settings.identity_map == "weak":
+        return IdentityMap()
+    if settings.identity_map == "lru":
+        return IdentityMap(maxsize=settings.identity_map_size)
+    return None
@@ -1,12 +1,80 @@
+import dataclasses
+import functools
+import heapq
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping
 from dataclasses import dataclass
-from typing import Any, Literal, TypeVar
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Literal, Optional, TypeVar, cast
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, create_model
 
+from lotr_sdk.schemas.predicates import Predicate, compile_mask, compile_predicate
 from lotr_sdk.types import MongoIdField
 
+if TYPE_CHECKING:
+    import numpy as np
+    from pydantic.fields import FieldInfo
+
 T = TypeVar("T")
 
+QueryKey = tuple[tuple[str, str], ...]
+
+
+def query_key(*params: Mapping[str, Any] | None) -> QueryKey:
+    """Build a canonical, hashable key from query parameters.
+
+    Parameters are compared as they are sent, as strings, and regardless of
+    order. Later mappings override earlier ones, as with ``dict.update``.
+
+    Args:
+        params: Query parameter mappings, None entries are skipped
+
+    Returns:
+        Sorted tuple of ``(name, value)`` pairs
+    """
+    merged: dict[str, Any] = {}
+    for mapping in params:
+        if mapping:
+            merged.update(mapping)
+    return tuple(sorted((str(name), str(value)) for name, value in merged.items()))
+
+
+def _typed(value: Any) -> tuple[type, Any]:
+    """Pair a value with its type, so that ``5`` and ``"5"`` compare unequal."""
+    return (type(value), value)
+
+
+class CanonicalQuery(ABC):
+    """Mixin giving query options value semantics.
+
+    Two instances are equal, and hash alike, when they are of the same type and
+    hold the same typed values, so equivalent options can key caches and
+    deduplicate requests. Values are not stringified: ``5`` and ``"5"`` differ,
+    even though both are sent as ``5``. Do not mutate an instance while it is
+    used as a dict key.
+    """
+
+    @abstractmethod
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the options to a dictionary of query parameters."""
+
+    def query_key(self) -> QueryKey:
+        """Return the canonical key of the query parameters, see :func:`query_key`."""
+        return query_key(self.to_dict())
+
+    def _value_key(self) -> Hashable:
+        """Return the typed values the instance is compared and hashed by."""
+        return tuple((field.name, _typed(getattr(self, field.name))) for field in dataclasses.fields(self))  # type: ignore[arg-type]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CanonicalQuery) or type(other) is not type(self):
+            return NotImplemented
+        return self._value_key() == other._value_key()
+
+    def __hash__(self) -> int:
+        return hash((type(self), self._value_key()))
+
 
 class APIResponse[T](BaseModel):
     """Generic response model for API responses.
@@ -76,8 +144,83 @@ class BaseResource(BaseModel):
     )
 
 
-@dataclass
-class BaseSort:
+class PartialResource(BaseModel):
+    """Mixin of partial models, which serialize only the fields that were set."""
+
+    def model_dump(self, **kwargs: Any) -> dict[str, Any]:
+        kwargs.setdefault("exclude_unset", True)
+        return super().model_dump(**kwargs)
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        kwargs.setdefault("exclude_unset", True)
+        return super().model_dump_json(**kwargs)
+
+
+@functools.cache
+def partial_model[M: BaseResource](model: type[M], fields: frozenset[str]) -> type[M]:
+    """Build a subclass of ``model`` in which only ``fields`` (and ``id``) are required.
+
+    Every other field defaults to None and is skipped by validation, so a
+    partial instance is still an instance of ``model`` and fits in its list
+    types. ``model_dump`` and ``model_dump_json`` leave the skipped fields out.
+    Partial models are cached per field selection.
+
+    Args:
+        model: Resource model to project
+        fields: Attribute names to keep
+
+    Returns:
+        The partial model class
+
+    Raises:
+        ValueError: If a field does not exist on the model
+    """
+    unknown = fields - model.model_fields.keys()
+    if unknown:
+        raise ValueError(f"Unknown {model.__name__} fields: {', '.join(sorted(unknown))}")
+    overrides: dict[str, Any] = {
+        name: (Optional[info.annotation], Field(default=None, alias=info.alias))  # noqa: UP007
+        for name, info in model.model_fields.items()
+        if name != "id" and name not in fields
+    }
+    bases: tuple[type[Any], ...] = (PartialResource, model)
+    return cast("type[M]", create_model(f"Partial{model.__name__}", __base__=bases, **overrides))
+
+
+def projection_fields(model: type[BaseResource], fields: Iterable[str]) -> frozenset[str]:
+    """Normalize a field selection, given by attribute or API names, to attribute names."""
+    return frozenset(_attribute_name(model, field) for field in fields)
+
+
+@functools.cache
+def _projection_keys(model: type[BaseResource], fields: frozenset[str]) -> frozenset[str]:
+    keys = {"_id", "id"}
+    for name in fields:
+        keys.add(name)
+        alias = model.model_fields[name].alias
+        if alias:
+            keys.add(alias)
+    return frozenset(keys)
+
+
+def project_docs[M: BaseResource](model: type[M], fields: frozenset[str], docs: list[dict[str, Any]]) -> list[M]:
+    """Strip raw docs down to the selected fields and validate them as partial models.
+
+    Args:
+        model: Resource model of the docs
+        fields: Attribute names to keep, see :func:`projection_fields`
+        docs: Raw docs as returned by the API
+
+    Returns:
+        Partial model instances
+    """
+    partial = partial_model(model, fields)
+    keys = _projection_keys(model, fields)
+    return [partial(**{key: value for key, value in doc.items() if key in keys}) for doc in docs]
+
+
+@dataclass(eq=False)
+class BaseSort(CanonicalQuery):
     """Base class for all sort options."""
 
     field: str | None = None
@@ -90,17 +233,133 @@ class BaseSort:
             params["sort"] = f"{self.field}:{self.order or 'asc'}"
         return params
 
+    def key(self, resource: Any) -> Any:
+        """Return the value of the sort field for a resource.
+
+        The field may be given by its API name (``rottenTomatoesScore``) or by
+        its attribute name (``rotten_tomatoes_score``).
+        """
+        model: type[BaseModel] = type(resource)
+        return getattr(resource, _attribute_name(model, self.field or "_id"))
+
+
+@functools.cache
+def _attribute_name(model: type, field: str) -> str:
+    """Map an API field name to the attribute holding it on a model."""
+    if field == "_id":
+        return "id"
+    model_fields: dict[str, FieldInfo] = getattr(model, "model_fields", {})
+    for name, info in model_fields.items():
+        if info.alias == field:
+            return name
+    return field
+
+
+def merge_sorted[R: BaseModel](*streams: Iterable[R], sort: BaseSort) -> Iterator[R]:
+    """Lazily merge streams that are each sorted by ``sort`` into one sorted stream.
+
+    Only the head of every stream is held in memory, so pages fetched
+    concurrently or served from partial caches can be combined without
+    materializing the whole collection.
+
+    Args:
+        streams: Iterables of resource models, each already sorted by ``sort``
+        sort: The order shared by the streams
+
+    Returns:
+        Iterator over all resources in global sort order
+    """
+    return heapq.merge(*streams, key=sort.key, reverse=sort.order == "desc")
+
+
+def _cached[F](owner: Any, kind: str, state: Any, build: Callable[[], F]) -> F:
+    """Return a compiled form cached on ``owner``, rebuilding it when ``state`` changes."""
+    cache: dict[str, tuple[Any, F]] = owner.__dict__.setdefault("_compiled", {})
+    entry = cache.get(kind)
+    if entry is None or entry[0] != state:
+        entry = (state, build())
+        cache[kind] = entry
+    return entry[1]
 
-class BaseFilters:
-    """Base class for all filters."""
+
+class BaseFilters(CanonicalQuery):
+    """Base class for all filters.
+
+    Subclasses are declared with ``@dataclass(eq=False)`` to keep the
+    value-based equality and hashing of :class:`CanonicalQuery`.
+    """
 
     def to_dict(self) -> dict[str, Any]:
         """Convert filters to dictionary of query parameters."""
         return {}
 
+    def _field_filters(self) -> list[tuple[str, "FieldFilter"]]:
+        return [
+            (field.name, value)
+            for field in dataclasses.fields(self)  # type: ignore[arg-type]
+            if (value := getattr(self, field.name)) is not None
+        ]
+
+    def _state(self) -> tuple[Any, ...]:
+        return tuple((name, field_filter._state()) for name, field_filter in self._field_filters())
+
+    def _value_key(self) -> Hashable:
+        return tuple((name, field_filter._value_key()) for name, field_filter in self._field_filters())
+
+    def predicate(self) -> Predicate:
+        """Compile the filters into a predicate over resources.
+
+        The predicate is cached on the instance and rebuilt only when a filter changes.
+
+        Returns:
+            Function returning True for resources matching every field filter
+        """
+
+        def build() -> Predicate:
+            checks = [(attrgetter(name), field_filter.predicate()) for name, field_filter in self._field_filters()]
+
+            def predicate(resource: Any) -> bool:
+                # A loop rather than all(), which would build a generator on every call
+                for get, check in checks:  # noqa: SIM110
+                    if not check(get(resource)):
+                        return False
+                return True
+
+            return predicate
 
-@dataclass
-class Pagination:
+        return _cached(self, "predicate", self._state(), build)
+
+    def apply[R](self, resources: Iterable[R]) -> list[R]:
+        """Return the resources matching the filters.
+
+        Args:
+            resources: Resources to filter, such as the docs of a cached page
+
+        Returns:
+            The matching resources, in input order
+        """
+        return list(filter(self.predicate(), resources))
+
+    def mask(self, columns: Mapping[str, "np.ndarray"], size: int) -> "np.ndarray":
+        """Evaluate the filters over columnar data. Requires ``numpy``.
+
+        Args:
+            columns: Columns by field name, such as a NumPy structured array
+            size: Number of rows
+
+        Returns:
+            Boolean mask selecting the matching rows
+        """
+        import numpy as np
+
+        result = np.ones(size, dtype=bool)
+        for name, field_filter in self._field_filters():
+            result &= field_filter.mask(columns[name])
+        return result
+
+
+@dataclass(eq=False)
+class Pagination(CanonicalQuery):
     """Pagination parameters for list requests."""
 
     page: int | None = None
@@ -119,8 +378,27 @@ class Pagination:
         return params
 
 
-@dataclass
-class FieldFilter:
+def _canonical_values(values: Iterable[Any]) -> str:
+    """Join list values in a canonical order, without duplicates."""
+    return ",".join(sorted(set(map(str, values))))
+
+
+@dataclass(eq=False)
+class FieldFilter(CanonicalQuery):
+    """Conditions on a single field.
+
+    Filters are equal when they send the same conditions with the same typed
+    values: ``include`` and ``exclude`` are order-insensitive and ignore
+    duplicates, and ``match`` equals an ``include`` of a single value.
+
+    ``match``, ``include``, ``exists=True`` and ``regex`` are all sent as the
+    ``field`` parameter, and ``not_match`` and ``exclude`` as ``field!``, so at
+    most one condition of each group may be set.
+
+    Raises:
+        ValueError: If two conditions would be sent as the same parameter
+    """
+
     match: Any = None
     not_match: Any = None
     include: list[Any] | None = None
@@ -132,16 +410,80 @@ class FieldFilter:
     lt: Any = None
     lte: Any = None
 
-    def to_dict(self, field: str) -> dict[str, Any]:
+    def __post_init__(self) -> None:
+        for group in (
+            {"match": self.match, "include": self.include, "exists": self.exists or None, "regex": self.regex},
+            {"not_match": self.not_match, "exclude": self.exclude},
+        ):
+            conflicting = [name for name, value in group.items() if value is not None]
+            if len(conflicting) > 1:
+                raise ValueError(f"Conflicting filter conditions: {', '.join(conflicting)}")
+
+    def query_key(self) -> QueryKey:
+        """Return the canonical key of the filter's query parameters, independent of the field name."""
+        return query_key(self.to_dict(""))
+
+    def _state(self) -> tuple[Any, ...]:
+        values = (getattr(self, field.name) for field in dataclasses.fields(self))
+        return tuple(tuple(value) if isinstance(value, list) else value for value in values)
+
+    def _value_key(self) -> Hashable:
+        # Mirrors to_dict, keyed by operator, with typed values in place of the sent strings
+        conditions: dict[str, Any] = {}
+        if self.match is not None:
+            conditions["="] = frozenset([_typed(self.match)])
+        if self.not_match is not None:
+            conditions["!="] = frozenset([_typed(self.not_match)])
+        if self.include is not None:
+            conditions["="] = frozenset(map(_typed, self.include))
+        if self.exclude is not None:
+            conditions["!="] = frozenset(map(_typed, self.exclude))
+        if self.exists is True:
+            conditions["="] = "exists"
+        if self.exists is False:
+            conditions["!exists"] = True
+        if self.regex is not None:
+            conditions["="] = ("regex", self.regex)
+        for operator, value in ((">", self.gt), (">=", self.gte), ("<", self.lt), ("<=", self.lte)):
+            if value is not None:
+                conditions[operator] = _typed(value)
+        return frozenset(conditions.items())
+
+    def predicate(self) -> Predicate:
+        """Compile the filter into a predicate over a single value.
+
+        The predicate is cached on the instance and rebuilt only when the filter changes.
+
+        Returns:
+            Function returning True for values matching every condition
+        """
+        return _cached(self, "predicate", self._state(), lambda: compile_predicate(self))
+
+    def matches(self, value: Any) -> bool:
+        """Check a single value against the filter."""
+        return self.predicate()(value)
+
+    def mask(self, column: "np.ndarray") -> "np.ndarray":
+        """Evaluate the filter over a column. Requires ``numpy``.
+
+        Args:
+            column: Column values
+
+        Returns:
+            Boolean mask selecting the matching rows
+        """
+        return _cached(self, "mask", self._state(), lambda: compile_mask(self))(column)
+
+    def to_dict(self, field: str) -> dict[str, Any]:  # type: ignore[override]
         params = {}
         if self.match is not None:
             params[field] = self.match
         if self.not_match is not None:
             params[f"{field}!"] = self.not_match
         if self.include is not None:
-            params[field] = ",".join(map(str, self.include))
+            params[field] = _canonical_values(self.include)
         if self.exclude is not None:
-            params[f"{field}!"] = ",".join(map(str, self.exclude))
+            params[f"{field}!"] = _canonical_values(self.exclude)
         if self.exists is True:
             params[field] = ""
         if self.exists is False:
@@ -5,7 +5,7 @@ from typing import Any
 
 from pydantic import Field
 
-from lotr_sdk.schemas.base import BaseResource, FieldFilter, PaginatedResponse
+from lotr_sdk.schemas.base import BaseFilters, BaseResource, FieldFilter, PaginatedResponse
 
 
 class Movie(BaseResource):
@@ -34,8 +34,8 @@ class Movie(BaseResource):
 MovieList = PaginatedResponse[Movie]
 
 
-@dataclass
-class MovieFilters:
+@dataclass(eq=False)
+class MovieFilters(BaseFilters):
     """Filter options for movie queries.
 
     Attributes:
@@ -46,6 +46,7 @@ class MovieFilters:
         academy_award_nominations: Filter by number of Academy Award nominations
         academy_award_wins: Filter by number of Academy Award wins
         rotten_tomatoes_score: Filter by Rotten Tomatoes score
+        id: Filter by movie ID
     """
 
     name: FieldFilter | None = None
@@ -55,6 +56,7 @@ class MovieFilters:
     academy_award_nominations: FieldFilter | None = None
     academy_award_wins: FieldFilter | None = None
     rotten_tomatoes_score: FieldFilter | None = None
+    id: FieldFilter | None = None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert filter options to dictionary of query parameters.
@@ -78,5 +80,7 @@ class MovieFilters:
             params.update(self.academy_award_wins.to_dict("academyAwardWins"))
         if self.rotten_tomatoes_score is not None:
             params.update(self.rotten_tomatoes_score.to_dict("rottenTomatoesScore"))
+        if self.id is not None:
+            params.update(self.id.to_dict("_id"))
 
         return params
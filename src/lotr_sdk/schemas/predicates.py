@@ -0,0 +1,154 @@
+"""Compilation of filters into local predicates and NumPy masks.
+
+The API evaluates filters on the server. These helpers evaluate the same
+operators locally, over already fetched resources or over columnar data, so a
+cached corpus can be re-filtered without another request.
+"""
+
+import re
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from lotr_sdk.schemas.base import FieldFilter
+
+Predicate = Callable[[Any], bool]
+MaskFunction = Callable[["np.ndarray"], "np.ndarray"]
+
+
+def compile_regex(pattern: str) -> re.Pattern[str]:
+    """Compile a regex in the API's ``/pattern/flags`` notation, or a bare pattern.
+
+    Args:
+        pattern: Regular expression, optionally wrapped in slashes with ``i`` flag
+
+    Returns:
+        The compiled pattern
+    """
+    match = re.fullmatch(r"/(.*)/([a-z]*)", pattern, flags=re.DOTALL)
+    if match is None:
+        return re.compile(pattern)
+    flags = re.IGNORECASE if "i" in match.group(2) else 0
+    return re.compile(match.group(1), flags)
+
+
+def _always(_: Any) -> bool:
+    return True
+
+
+def compile_predicate(field_filter: "FieldFilter") -> Predicate:
+    """Compile a FieldFilter into a predicate over a single value.
+
+    Every condition set on the filter must hold, matching how the API combines
+    query parameters.
+
+    Args:
+        field_filter: Filter to compile
+
+    Returns:
+        Function returning True for values that match the filter
+    """
+    checks: list[Predicate] = []
+    if field_filter.exists is not None:
+        exists = field_filter.exists
+        checks.append(lambda value: (value is not None) is exists)
+    if field_filter.match is not None:
+        expected = field_filter.match
+        checks.append(lambda value: value == expected)
+    if field_filter.not_match is not None:
+        unexpected = field_filter.not_match
+        checks.append(lambda value: value != unexpected)
+    if field_filter.include is not None:
+        included = frozenset(field_filter.include)
+        checks.append(lambda value: value in included)
+    if field_filter.exclude is not None:
+        excluded = frozenset(field_filter.exclude)
+        checks.append(lambda value: value not in excluded)
+    if field_filter.regex is not None:
+        search = compile_regex(field_filter.regex).search
+        checks.append(lambda value: value is not None and search(str(value)) is not None)
+
+    bounds = (field_filter.gt, field_filter.gte, field_filter.lt, field_filter.lte)
+    if any(bound is not None for bound in bounds):
+        gt, gte, lt, lte = bounds
+
+        def in_range(value: Any) -> bool:
+            return not (
+                value is None
+                or (gt is not None and not value > gt)
+                or (gte is not None and not value >= gte)
+                or (lt is not None and not value < lt)
+                or (lte is not None and not value <= lte)
+            )
+
+        checks.append(in_range)
+
+    if not checks:
+        return _always
+    if len(checks) == 1:
+        return checks[0]
+
+    def all_checks(value: Any) -> bool:
+        # A loop rather than all(), which would build a generator on every call
+        for check in checks:  # noqa: SIM110
+            if not check(value):
+                return False
+        return True
+
+    return all_checks
+
+
+def compile_mask(field_filter: "FieldFilter") -> MaskFunction:
+    """Compile a FieldFilter into a function computing a boolean mask over a column.
+
+    Requires ``numpy``.
+
+    Args:
+        field_filter: Filter to compile
+
+    Returns:
+        Function mapping a column to a boolean mask of matching rows
+    """
+    import numpy as np
+
+    steps: list[MaskFunction] = []
+    if field_filter.exists is False:
+        steps.append(lambda column: np.zeros(len(column), dtype=bool))
+    if field_filter.match is not None:
+        expected = field_filter.match
+        steps.append(lambda column: column == expected)
+    if field_filter.not_match is not None:
+        unexpected = field_filter.not_match
+        steps.append(lambda column: column != unexpected)
+    if field_filter.include is not None:
+        included = list(field_filter.include)
+        steps.append(lambda column: np.isin(column, np.asarray(included, dtype=column.dtype)))
+    if field_filter.exclude is not None:
+        excluded = list(field_filter.exclude)
+        steps.append(lambda column: ~np.isin(column, np.asarray(excluded, dtype=column.dtype)))
+    if field_filter.regex is not None:
+        search = compile_regex(field_filter.regex).search
+        matches = np.frompyfunc(lambda value: search(str(value)) is not None, 1, 1)
+        steps.append(lambda column: matches(column).astype(bool))
+    if field_filter.gt is not None:
+        gt = field_filter.gt
+        steps.append(lambda column: column > gt)
+    if field_filter.gte is not None:
+        gte = field_filter.gte
+        steps.append(lambda column: column >= gte)
+    if field_filter.lt is not None:
+        lt = field_filter.lt
+        steps.append(lambda column: column < lt)
+    if field_filter.lte is not None:
+        lte = field_filter.lte
+        steps.append(lambda column: column <= lte)
+
+    def mask(column: "np.ndarray") -> "np.ndarray":
+        result = np.ones(len(column), dtype=bool)
+        for step in steps:
+            result &= step(column)
+        return result
+
+    return mask
@@ -7,23 +7,25 @@ from lotr_sdk.schemas.base import (
     FieldFilter,
     PaginatedResponse,
 )
+from lotr_sdk.types import ForeignKeyField
 
 
 class Quote(BaseResource):
     dialog: str
-    movie: str
-    character: str
+    movie: ForeignKeyField
+    character: ForeignKeyField
 
 
 class QuoteList(PaginatedResponse[Quote]):
     pass
 
 
-@dataclass
+@dataclass(eq=False)
 class QuoteFilters(BaseFilters):
     dialog: FieldFilter | None = None
     movie: FieldFilter | None = None
     character: FieldFilter | None = None
+    id: FieldFilter | None = None
 
     def to_dict(self) -> dict[str, Any]:
         params: dict[str, Any] = {}
@@ -33,4 +35,6 @@ class QuoteFilters(BaseFilters):
             params.update(self.movie.to_dict("movie"))
         if self.character is not None:
             params.update(self.character.to_dict("character"))
+        if self.id is not None:
+            params.update(self.id.to_dict("_id"))
         return params
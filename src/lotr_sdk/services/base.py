@@ -0,0 +1,297 @@
+import copy
+import inspect
+import math
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from itertools import batched
+from typing import Any, Self
+
+from lotr_sdk.client.base import HTTPClient
+from lotr_sdk.core.concurrency import AsyncQueue, AsyncSendStream, gather, run_workers
+from lotr_sdk.core.errors import (
+    APIError,
+    AuthenticationError,
+    CassetteMissError,
+    DeadlineExceededError,
+    RateLimitError,
+    ResourceNotFoundError,
+)
+from lotr_sdk.core.executor import ParallelExecutor
+from lotr_sdk.core.identity import IdentityMap
+from lotr_sdk.core.paging import PageSizeController
+from lotr_sdk.core.scheduler import PrioritizedClient
+from lotr_sdk.core.timeouts import accepts_deadline
+from lotr_sdk.schemas.base import BaseResource, PaginatedResponse
+
+
+class BaseService:
+    """Shared plumbing for resource services.
+
+    Every public method of a subclass accepts a ``deadline`` keyword argument:
+    the number of seconds the whole call, retries included, may take before
+    it raises ``DeadlineExceededError``. Subclasses declare the argument so
+    type checkers accept it, and the wrapper installed here consumes it.
+    """
+
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        for name, value in list(vars(cls).items()):
+            if not name.startswith("_") and inspect.isfunction(value):
+                setattr(cls, name, accepts_deadline(value))
+
+    def __init__(
+        self,
+        http_client: HTTPClient,
+        executor: ParallelExecutor | None = None,
+        identity_map: IdentityMap | None = None,
+    ):
+        self.http_client = http_client
+        self.executor = executor or ParallelExecutor()
+        self.identity_map = identity_map
+
+    def with_priority(self, priority: str) -> Self:
+        """Return a copy of the service whose asynchronous requests run at a priority class.
+
+        Priorities take effect when ``Settings.max_concurrent_requests`` enables
+        the request scheduler.
+
+        Args:
+            priority: Priority class, such as ``"interactive"`` or ``"batch"``
+
+        Returns:
+            A new service sharing this one's client and executor
+        """
+        service = copy.copy(self)
+        client = self.http_client
+        if isinstance(client, PrioritizedClient):
+            client = client.client
+        service.http_client = PrioritizedClient(client, priority)
+        return service
+
+    def _build[R: BaseResource](self, model: type[R], doc: dict[str, Any]) -> R:
+        """Build a resource from a raw record, through the identity map if there is one."""
+        if self.identity_map is None:
+            return model(**doc)
+        return self.identity_map.resolve(model, doc)
+
+    def _build_page[L: PaginatedResponse[Any]](
+        self, page: type[L], model: type[BaseResource], data: dict[str, Any]
+    ) -> L:
+        """Build a page of resources from a raw response, through the identity map if there is one."""
+        if self.identity_map is None:
+            return page(**data)
+        return page(**{**data, "docs": self.identity_map.resolve_many(model, data["docs"])})
+
+    def _projection_params(self, model: type[BaseResource], fields: frozenset[str]) -> dict[str, str]:
+        """Build the query parameter asking the server for a projection, if it supports one."""
+        param = self.http_client.settings.projection_param
+        if not param:
+            return {}
+        return {param: ",".join(sorted(model.model_fields[name].alias or name for name in fields))}
+
+    def _prefetch(self, urls: Iterable[str]) -> None:
+        """Load the cached responses of upcoming GET requests in one round trip, if the client caches."""
+        prefetch = getattr(self.http_client, "prefetch", None)
+        if prefetch is not None:
+            prefetch([(url, None) for url in urls])
+
+    async def _prefetch_async(self, urls: Iterable[str]) -> None:
+        """Asynchronous version of :meth:`_prefetch`."""
+        prefetch = getattr(self.http_client, "prefetch_async", None)
+        if prefetch is not None:
+            await prefetch([(url, None) for url in urls])
+
+    def _fetch_pages[L](self, fetch: Callable[[int], L], pages: Iterable[int]) -> list[L]:
+        """Fetch several pages, in parallel when the executor allows it."""
+        return self.executor.map(fetch, pages)
+
+    async def _fetch_pages_async[L](self, fetch: Callable[[int], Awaitable[L]], pages: Iterable[int]) -> list[L]:
+        """Fetch several pages concurrently."""
+        return await gather(fetch(page) for page in pages)
+
+    def _fetch_all[L: PaginatedResponse[Any]](self, fetch: Callable[[int], L]) -> L:
+        """Fetch the first page, then every remaining page, and merge them."""
+        first = fetch(1)
+        rest = self._fetch_pages(fetch, _remaining_pages(first))
+        return _merge_pages(first, rest)
+
+    async def _fetch_all_async[L: PaginatedResponse[Any]](self, fetch: Callable[[int], Awaitable[L]]) -> L:
+        """Fetch the first page, then every remaining page concurrently, and merge them."""
+        first = await fetch(1)
+        rest = await self._fetch_pages_async(fetch, _remaining_pages(first))
+        return _merge_pages(first, rest)
+
+    def _iter_sorted[R](self, fetch: Callable[[int], PaginatedResponse[R]], window: int) -> Iterator[R]:
+        """Stream a server-sorted collection, fetching ``window`` pages at a time.
+
+        The server sorts the whole collection, so every page is a contiguous
+        range of the sort order and the pages are yielded in page order, without
+        merging. At most one window of pages is held in memory.
+        """
+        first = fetch(1)
+        yield from first.docs
+        for pages in batched(_remaining_pages(first), window, strict=False):
+            for page in self._fetch_pages(fetch, pages):
+                yield from page.docs
+
+    async def _iter_sorted_async[R](
+        self,
+        fetch: Callable[[int], Awaitable[PaginatedResponse[R]]],
+        window: int,
+    ) -> AsyncIterator[R]:
+        """Asynchronous version of :meth:`_iter_sorted`."""
+        first = await fetch(1)
+        for doc in first.docs:
+            yield doc
+        for pages in batched(_remaining_pages(first), window, strict=False):
+            for page in await self._fetch_pages_async(fetch, pages):
+                for doc in page.docs:
+                    yield doc
+
+    def page_size_controller(self) -> PageSizeController:
+        """Create a page size controller configured from the client settings."""
+        settings = self.http_client.settings
+        maximum = settings.max_page_size
+        return PageSizeController(
+            initial=min(100, maximum),
+            minimum=min(10, maximum),
+            maximum=maximum,
+            target_latency=min(settings.target_page_latency, settings.timeout / 2),
+        )
+
+    def _scan[R](
+        self,
+        fetch: Callable[[int, int], PaginatedResponse[R]],
+        controller: PageSizeController | None,
+    ) -> Iterator[R]:
+        """Stream a whole collection using offset pagination and adaptive page sizes.
+
+        ``fetch`` is called with an offset and a limit. The first response
+        gives the collection's total; the controller then sizes every following
+        page from the observed latency. A failed page is retried with a smaller
+        page size until the controller reaches its minimum.
+        """
+        controller = controller or self.page_size_controller()
+        offset = 0
+        total: int | None = None
+        while total is None or offset < total:
+            limit = controller.size if total is None else min(controller.size, total - offset)
+            start = time.perf_counter()
+            try:
+                page = fetch(offset, limit)
+            except _FATAL_ERRORS:
+                raise
+            except APIError:
+                if not controller.failed():
+                    raise
+                continue
+            total = page.total
+            offset += len(page.docs)
+            controller.record(
+                requested=limit,
+                returned=len(page.docs),
+                remaining=max(total - offset, 0),
+                latency=time.perf_counter() - start,
+            )
+            yield from page.docs
+            if not page.docs:
+                break
+
+    async def _scan_async[R](
+        self,
+        fetch: Callable[[int, int], Awaitable[PaginatedResponse[R]]],
+        controller: PageSizeController | None,
+    ) -> AsyncIterator[R]:
+        """Asynchronous version of :meth:`_scan`."""
+        controller = controller or self.page_size_controller()
+        offset = 0
+        total: int | None = None
+        while total is None or offset < total:
+            limit = controller.size if total is None else min(controller.size, total - offset)
+            start = time.perf_counter()
+            try:
+                page = await fetch(offset, limit)
+            except _FATAL_ERRORS:
+                raise
+            except APIError:
+                if not controller.failed():
+                    raise
+                continue
+            total = page.total
+            offset += len(page.docs)
+            controller.record(
+                requested=limit,
+                returned=len(page.docs),
+                remaining=max(total - offset, 0),
+                latency=time.perf_counter() - start,
+            )
+            for doc in page.docs:
+                yield doc
+            if not page.docs:
+                break
+
+    async def _produce_async[R](
+        self,
+        fetch: Callable[[int], Awaitable[PaginatedResponse[R]]],
+        queue: AsyncQueue[R] | AsyncSendStream[R],
+        concurrency: int,
+    ) -> int:
+        """Feed every record of a collection into a queue from concurrent page fetchers.
+
+        ``queue`` may be an ``asyncio.Queue`` or an AnyIO memory object send
+        stream, the latter working under Trio as well.
+
+        Each fetcher puts a page's records before fetching its next page, so a
+        full queue pauses fetching until consumers catch up. At most
+        ``concurrency`` pages are held on top of the queue's own capacity. An
+        error in any fetcher, or cancelling the producer, cancels every fetcher.
+
+        Returns:
+            Number of records put into the queue
+        """
+        first = await fetch(1)
+        pages = iter(_remaining_pages(first))
+        put = queue.put if hasattr(queue, "put") else queue.send
+        produced = 0
+
+        async def put_all(docs: list[R]) -> None:
+            nonlocal produced
+            for doc in docs:
+                await put(doc)
+                produced += 1
+
+        async def worker() -> None:
+            for page in pages:
+                await put_all((await fetch(page)).docs)
+
+        await put_all(first.docs)
+        await run_workers(worker, concurrency)
+        return produced
+
+
+# Errors that a smaller page size would not avoid
+_FATAL_ERRORS = (
+    AuthenticationError,
+    ResourceNotFoundError,
+    RateLimitError,
+    DeadlineExceededError,
+    CassetteMissError,
+)
+
+
+def _remaining_pages(first: PaginatedResponse[Any]) -> range:
+    """Return the page numbers that follow ``first``."""
+    pages = first.pages
+    if pages is None:
+        pages = math.ceil(first.total / first.limit) if first.limit else 1
+    return range(2, pages + 1)
+
+
+def _merge_pages[L: PaginatedResponse[Any]](first: L, rest: list[L]) -> L:
+    """Merge the docs of several pages into a single response."""
+    if not rest:
+        return first
+    docs = list(first.docs)
+    for page in rest:
+        docs.extend(page.docs)
+    return first.model_copy(update={"docs": docs})
@@ -1,13 +1,27 @@
+import builtins
+from collections.abc import AsyncIterator, Iterable, Iterator
+
 from lotr_sdk.client.base import HTTPClient
+from lotr_sdk.core.concurrency import gather
 from lotr_sdk.core.errors import ResourceNotFoundError
-from lotr_sdk.schemas.base import Pagination
+from lotr_sdk.core.executor import ParallelExecutor
+from lotr_sdk.core.identity import IdentityMap
+from lotr_sdk.core.paging import PageSizeController
+from lotr_sdk.schemas.base import BaseSort, Pagination, project_docs, projection_fields
 from lotr_sdk.schemas.movie import Movie, MovieFilters, MovieList
-from lotr_sdk.schemas.quote import QuoteList
+from lotr_sdk.schemas.quote import Quote, QuoteList
+from lotr_sdk.services.base import BaseService
+from lotr_sdk.sync import ChangeSet, SyncSnapshot, sync_collection, sync_collection_async
 
 
-class MovieService:
-    def __init__(self, http_client: HTTPClient):
-        self.http_client = http_client
+class MovieService(BaseService):
+    def __init__(
+        self,
+        http_client: HTTPClient,
+        executor: ParallelExecutor | None = None,
+        identity_map: IdentityMap | None = None,
+    ):
+        super().__init__(http_client, executor, identity_map)
         self.base_url = "/v2/movie"
 
     def list(
@@ -15,8 +29,12 @@ class MovieService:
         *,
         filters: MovieFilters | None = None,
         pagination: Pagination | None = None,
+        sort: BaseSort | None = None,
+        fields: Iterable[str] | None = None,
+        deadline: float | None = None,
     ) -> MovieList:
         params: dict[str, str] = {}
+        projection = projection_fields(Movie, fields) if fields else None
 
         if filters:
             params.update(filters.to_dict())
@@ -24,21 +42,33 @@ class MovieService:
         if pagination:
             params.update(pagination.to_dict())
 
+        if sort:
+            params.update(sort.to_dict())
+
+        if projection:
+            params.update(self._projection_params(Movie, projection))
+
         response = self.http_client.request(
             method="GET",
             url=self.base_url,
             params=params,
         )
 
-        return MovieList(**response.data)
+        if projection:
+            return MovieList(**{**response.data, "docs": project_docs(Movie, projection, response.data["docs"])})
+        return self._build_page(MovieList, Movie, response.data)
 
     async def list_async(
         self,
         *,
         filters: MovieFilters | None = None,
         pagination: Pagination | None = None,
+        sort: BaseSort | None = None,
+        fields: Iterable[str] | None = None,
+        deadline: float | None = None,
     ) -> MovieList:
         params: dict[str, str] = {}
+        projection = projection_fields(Movie, fields) if fields else None
 
         if filters:
             params.update(filters.to_dict())
@@ -46,14 +76,22 @@ class MovieService:
         if pagination:
             params.update(pagination.to_dict())
 
+        if sort:
+            params.update(sort.to_dict())
+
+        if projection:
+            params.update(self._projection_params(Movie, projection))
+
         response = await self.http_client.request_async(
             method="GET",
             url=self.base_url,
             params=params,
         )
-        return MovieList(**response.data)
+        if projection:
+            return MovieList(**{**response.data, "docs": project_docs(Movie, projection, response.data["docs"])})
+        return self._build_page(MovieList, Movie, response.data)
 
-    def get(self, movie_id: str) -> Movie:
+    def get(self, movie_id: str, *, deadline: float | None = None) -> Movie:
         response = self.http_client.request(
             method="GET",
             url=f"{self.base_url}/{movie_id}",
@@ -63,9 +101,9 @@ class MovieService:
         if not docs:
             raise ResourceNotFoundError("No docs found in response")
 
-        return Movie(**docs[0])
+        return self._build(Movie, docs[0])
 
-    async def get_async(self, movie_id: str) -> Movie:
+    async def get_async(self, movie_id: str, *, deadline: float | None = None) -> Movie:
         response = await self.http_client.request_async(
             method="GET",
             url=f"{self.base_url}/{movie_id}",
@@ -75,13 +113,14 @@ class MovieService:
         if not docs:
             raise ResourceNotFoundError("No docs found in response")
 
-        return Movie(**docs[0])
+        return self._build(Movie, docs[0])
 
     def get_quotes(
         self,
         movie_id: str,
         *,
         pagination: Pagination | None = None,
+        deadline: float | None = None,
     ) -> QuoteList:
         params: dict[str, str] = {}
         if pagination:
@@ -93,13 +132,14 @@ class MovieService:
             params=params,
         )
 
-        return QuoteList(**response.data)
+        return self._build_page(QuoteList, Quote, response.data)
 
     async def get_quotes_async(
         self,
         movie_id: str,
         *,
         pagination: Pagination | None = None,
+        deadline: float | None = None,
     ) -> QuoteList:
         params: dict[str, str] = {}
         if pagination:
@@ -111,4 +151,218 @@ class MovieService:
             params=params,
         )
 
-        return QuoteList(**response.data)
+        return self._build_page(QuoteList, Quote, response.data)
+
+    def list_pages(  # noqa: PLR0913
+        self,
+        pages: Iterable[int],
+        *,
+        filters: MovieFilters | None = None,
+        limit: int | None = None,
+        sort: BaseSort | None = None,
+        fields: Iterable[str] | None = None,
+        deadline: float | None = None,
+    ) -> builtins.list[MovieList]:
+        return self._fetch_pages(
+            lambda page: self.list(
+                filters=filters,
+                pagination=Pagination(page=page, limit=limit),
+                sort=sort,
+                fields=fields,
+            ),
+            pages,
+        )
+
+    async def list_pages_async(  # noqa: PLR0913
+        self,
+        pages: Iterable[int],
+        *,
+        filters: MovieFilters | None = None,
+        limit: int | None = None,
+        sort: BaseSort | None = None,
+        fields: Iterable[str] | None = None,
+        deadline: float | None = None,
+    ) -> builtins.list[MovieList]:
+        return await self._fetch_pages_async(
+            lambda page: self.list_async(
+                filters=filters,
+                pagination=Pagination(page=page, limit=limit),
+                sort=sort,
+                fields=fields,
+            ),
+            pages,
+        )
+
+    def list_all(
+        self,
+        *,
+        filters: MovieFilters | None = None,
+        limit: int | None = None,
+        sort: BaseSort | None = None,
+        fields: Iterable[str] | None = None,
+        deadline: float | None = None,
+    ) -> MovieList:
+        return self._fetch_all(
+            lambda page: self.list(
+                filters=filters,
+                pagination=Pagination(page=page, limit=limit),
+                sort=sort,
+                fields=fields,
+            ),
+        )
+
+    async def list_all_async(
+        self,
+        *,
+        filters: MovieFilters | None = None,
+        limit: int | None = None,
+        sort: BaseSort | None = None,
+        fields: Iterable[str] | None = None,
+        deadline: float | None = None,
+    ) -> MovieList:
+        return await self._fetch_all_async(
+            lambda page: self.list_async(
+                filters=filters,
+                pagination=Pagination(page=page, limit=limit),
+                sort=sort,
+                fields=fields,
+            ),
+        )
+
+    def scan(
+        self,
+        *,
+        filters: MovieFilters | None = None,
+        sort: BaseSort | None = None,
+        fields: Iterable[str] | None = None,
+        controller: PageSizeController | None = None,
+        deadline: float | None = None,
+    ) -> Iterator[Movie]:
+        """Stream every movie, choosing page sizes adaptively to use as few requests as possible.
+
+        Args:
+            filters: Filter options
+            sort: Sort options
+            fields: Fields to keep, see :meth:`list`
+            controller: Page size controller, defaults to one configured from the settings
+            deadline: Seconds the whole scan may take, see :class:`BaseService`
+
+        Yields:
+            Movies, in server order
+        """
+        return self._scan(
+            lambda offset, limit: self.list(
+                filters=filters,
+                pagination=Pagination(offset=offset, limit=limit),
+                sort=sort,
+                fields=fields,
+            ),
+            controller,
+        )
+
+    def scan_async(
+        self,
+        *,
+        filters: MovieFilters | None = None,
+        sort: BaseSort | None = None,
+        fields: Iterable[str] | None = None,
+        controller: PageSizeController | None = None,
+        deadline: float | None = None,
+    ) -> AsyncIterator[Movie]:
+        """Asynchronous version of :meth:`scan`."""
+        return self._scan_async(
+            lambda offset, limit: self.list_async(
+                filters=filters,
+                pagination=Pagination(offset=offset, limit=limit),
+                sort=sort,
+                fields=fields,
+            ),
+            controller,
+        )
+
+    def iter_sorted(
+        self,
+        sort: BaseSort,
+        *,
+        filters: MovieFilters | None = None,
+        limit: int | None = None,
+        deadline: float | None = None,
+    ) -> Iterator[Movie]:
+        return self._iter_sorted(
+            lambda page: self.list(filters=filters, pagination=Pagination(page=page, limit=limit), sort=sort),
+            window=self.executor.max_workers,
+        )
+
+    def iter_sorted_async(
+        self,
+        sort: BaseSort,
+        *,
+        filters: MovieFilters | None = None,
+        limit: int | None = None,
+        concurrency: int = 8,
+        deadline: float | None = None,
+    ) -> AsyncIterator[Movie]:
+        return self._iter_sorted_async(
+            lambda page: self.list_async(filters=filters, pagination=Pagination(page=page, limit=limit), sort=sort),
+            window=concurrency,
+        )
+
+    def top(
+        self, n: int, *, sort: BaseSort, filters: MovieFilters | None = None, deadline: float | None = None
+    ) -> builtins.list[Movie]:
+        return self.list(filters=filters, pagination=Pagination(limit=n), sort=sort).docs
+
+    async def top_async(
+        self, n: int, *, sort: BaseSort, filters: MovieFilters | None = None, deadline: float | None = None
+    ) -> builtins.list[Movie]:
+        return (await self.list_async(filters=filters, pagination=Pagination(limit=n), sort=sort)).docs
+
+    def get_many(self, movie_ids: Iterable[str], *, deadline: float | None = None) -> builtins.list[Movie]:
+        movie_ids = builtins.list(movie_ids)
+        self._prefetch(f"{self.base_url}/{movie_id}" for movie_id in movie_ids)
+        return self.executor.map(self.get, movie_ids)
+
+    async def get_many_async(self, movie_ids: Iterable[str], *, deadline: float | None = None) -> builtins.list[Movie]:
+        movie_ids = builtins.list(movie_ids)
+        await self._prefetch_async(f"{self.base_url}/{movie_id}" for movie_id in movie_ids)
+        return await gather(self.get_async(movie_id) for movie_id in movie_ids)
+
+    def sync(
+        self,
+        snapshot: SyncSnapshot | None = None,
+        *,
+        filters: MovieFilters | None = None,
+        limit: int = 1000,
+        full: bool = False,
+        deadline: float | None = None,
+    ) -> ChangeSet[Movie]:
+        return sync_collection(
+            self.http_client,
+            self._fetch_pages,
+            self.base_url,
+            Movie,
+            snapshot,
+            params=filters.to_dict() if filters else {},
+            limit=limit,
+            full=full,
+        )
+
+    async def sync_async(
+        self,
+        snapshot: SyncSnapshot | None = None,
+        *,
+        filters: MovieFilters | None = None,
+        limit: int = 1000,
+        full: bool = False,
+        deadline: float | None = None,
+    ) -> ChangeSet[Movie]:
+        return await sync_collection_async(
+            self.http_client,
+            self._fetch_pages_async,
+            self.base_url,
+            Movie,
+            snapshot,
+            params=filters.to_dict() if filters else {},
+            limit=limit,
+            full=full,
+        )
@@ -1,14 +1,28 @@
+import builtins
+from collections.abc import AsyncIterator, Iterable, Iterator
+
 from lotr_sdk.client.base import HTTPClient
+from lotr_sdk.core.concurrency import AsyncQueue, AsyncSendStream, gather
 from lotr_sdk.core.errors import ResourceNotFoundError
-from lotr_sdk.schemas.base import Pagination
+from lotr_sdk.core.executor import ParallelExecutor
+from lotr_sdk.core.identity import IdentityMap
+from lotr_sdk.core.paging import PageSizeController
+from lotr_sdk.schemas.base import BaseSort, Pagination, project_docs, projection_fields
 from lotr_sdk.schemas.quote import Quote, QuoteFilters, QuoteList
+from lotr_sdk.services.base import BaseService
+from lotr_sdk.sync import ChangeSet, SyncSnapshot, sync_collection, sync_collection_async
 
 
-class QuoteService:
+class QuoteService(BaseService):
     """Service for interacting with the Movie API endpoints."""
 
-    def __init__(self, http_client: HTTPClient):
-        self.http_client = http_client
+    def __init__(
+        self,
+        http_client: HTTPClient,
+        executor: ParallelExecutor | None = None,
+        identity_map: IdentityMap | None = None,
+    ):
+        super().__init__(http_client, executor, identity_map)
         self.base_url = "/v2/quote"
 
     def list(
@@ -16,8 +30,12 @@ class QuoteService:
         *,
         filters: QuoteFilters | None = None,
         pagination: Pagination | None = None,
+        sort: BaseSort | None = None,
+        fields: Iterable[str] | None = None,
+        deadline: float | None = None,
     ) -> QuoteList:
         params: dict[str, str] = {}
+        projection = projection_fields(Quote, fields) if fields else None
 
         if filters:
             params.update(filters.to_dict())
@@ -25,21 +43,33 @@ class QuoteService:
         if pagination:
             params.update(pagination.to_dict())
 
+        if sort:
+            params.update(sort.to_dict())
+
+        if projection:
+            params.update(self._projection_params(Quote, projection))
+
         response = self.http_client.request(
             method="GET",
             url=self.base_url,
             params=params,
         )
 
-        return QuoteList(**response.data)
+        if projection:
+            return QuoteList(**{**response.data, "docs": project_docs(Quote, projection, response.data["docs"])})
+        return self._build_page(QuoteList, Quote, response.data)
 
     async def list_async(
         self,
         *,
         filters: QuoteFilters | None = None,
         pagination: Pagination | None = None,
+        sort: BaseSort | None = None,
+        fields: Iterable[str] | None = None,
+        deadline: float | None = None,
     ) -> QuoteList:
         params: dict[str, str] = {}
+        projection = projection_fields(Quote, fields) if fields else None
 
         if filters:
             params.update(filters.to_dict())
@@ -47,15 +77,23 @@ class QuoteService:
         if pagination:
             params.update(pagination.to_dict())
 
+        if sort:
+            params.update(sort.to_dict())
+
+        if projection:
+            params.update(self._projection_params(Quote, projection))
+
         response = await self.http_client.request_async(
             method="GET",
             url=self.base_url,
             params=params,
         )
 
-        return QuoteList(**response.data)
+        if projection:
+            return QuoteList(**{**response.data, "docs": project_docs(Quote, projection, response.data["docs"])})
+        return self._build_page(QuoteList, Quote, response.data)
 
-    def get(self, quote_id: str) -> Quote:
+    def get(self, quote_id: str, *, deadline: float | None = None) -> Quote:
         response = self.http_client.request(
             method="GET",
             url=f"{self.base_url}/{quote_id}",
@@ -64,9 +102,9 @@ class QuoteService:
         if not docs:
             raise ResourceNotFoundError(f"Quote with id {quote_id} not found")
 
-        return Quote(**docs[0])
+        return self._build(Quote, docs[0])
 
-    async def get_async(self, quote_id: str) -> Quote:
+    async def get_async(self, quote_id: str, *, deadline: float | None = None) -> Quote:
         response = await self.http_client.request_async(
             method="GET",
             url=f"{self.base_url}/{quote_id}",
@@ -75,4 +113,233 @@ class QuoteService:
         if not docs:
             raise ResourceNotFoundError(f"Quote with id {quote_id} not found")
 
-        return Quote(**docs[0])
+        return self._build(Quote, docs[0])
+
+    def list_pages(  # noqa: PLR0913
+        self,
+        pages: Iterable[int],
+        *,
+        filters: QuoteFilters | None = None,
+        limit: int | None = None,
+        sort: BaseSort | None = None,
+        fields: Iterable[str] | None = None,
+        deadline: float | None = None,
+    ) -> builtins.list[QuoteList]:
+        return self._fetch_pages(
+            lambda page: self.list(
+                filters=filters,
+                pagination=Pagination(page=page, limit=limit),
+                sort=sort,
+                fields=fields,
+            ),
+            pages,
+        )
+
+    async def list_pages_async(  # noqa: PLR0913
+        self,
+        pages: Iterable[int],
+        *,
+        filters: QuoteFilters | None = None,
+        limit: int | None = None,
+        sort: BaseSort | None = None,
+        fields: Iterable[str] | None = None,
+        deadline: float | None = None,
+    ) -> builtins.list[QuoteList]:
+        return await self._fetch_pages_async(
+            lambda page: self.list_async(
+                filters=filters,
+                pagination=Pagination(page=page, limit=limit),
+                sort=sort,
+                fields=fields,
+            ),
+            pages,
+        )
+
+    def list_all(
+        self,
+        *,
+        filters: QuoteFilters | None = None,
+        limit: int | None = None,
+        sort: BaseSort | None = None,
+        fields: Iterable[str] | None = None,
+        deadline: float | None = None,
+    ) -> QuoteList:
+        return self._fetch_all(
+            lambda page: self.list(
+                filters=filters,
+                pagination=Pagination(page=page, limit=limit),
+                sort=sort,
+                fields=fields,
+            ),
+        )
+
+    async def list_all_async(
+        self,
+        *,
+        filters: QuoteFilters | None = None,
+        limit: int | None = None,
+        sort: BaseSort | None = None,
+        fields: Iterable[str] | None = None,
+        deadline: float | None = None,
+    ) -> QuoteList:
+        return await self._fetch_all_async(
+            lambda page: self.list_async(
+                filters=filters,
+                pagination=Pagination(page=page, limit=limit),
+                sort=sort,
+                fields=fields,
+            ),
+        )
+
+    def scan(
+        self,
+        *,
+        filters: QuoteFilters | None = None,
+        sort: BaseSort | None = None,
+        fields: Iterable[str] | None = None,
+        controller: PageSizeController | None = None,
+        deadline: float | None = None,
+    ) -> Iterator[Quote]:
+        """Stream every quote, choosing page sizes adaptively to use as few requests as possible.
+
+        Args:
+            filters: Filter options
+            sort: Sort options
+            fields: Fields to keep, see :meth:`list`
+            controller: Page size controller, defaults to one configured from the settings
+            deadline: Seconds the whole scan may take, see :class:`BaseService`
+
+        Yields:
+            Quotes, in server order
+        """
+        return self._scan(
+            lambda offset, limit: self.list(
+                filters=filters,
+                pagination=Pagination(offset=offset, limit=limit),
+                sort=sort,
+                fields=fields,
+            ),
+            controller,
+        )
+
+    def scan_async(
+        self,
+        *,
+        filters: QuoteFilters | None = None,
+        sort: BaseSort | None = None,
+        fields: Iterable[str] | None = None,
+        controller: PageSizeController | None = None,
+        deadline: float | None = None,
+    ) -> AsyncIterator[Quote]:
+        """Asynchronous version of :meth:`scan`."""
+        return self._scan_async(
+            lambda offset, limit: self.list_async(
+                filters=filters,
+                pagination=Pagination(offset=offset, limit=limit),
+                sort=sort,
+                fields=fields,
+            ),
+            controller,
+        )
+
+    def iter_sorted(
+        self,
+        sort: BaseSort,
+        *,
+        filters: QuoteFilters | None = None,
+        limit: int | None = None,
+        deadline: float | None = None,
+    ) -> Iterator[Quote]:
+        return self._iter_sorted(
+            lambda page: self.list(filters=filters, pagination=Pagination(page=page, limit=limit), sort=sort),
+            window=self.executor.max_workers,
+        )
+
+    def iter_sorted_async(
+        self,
+        sort: BaseSort,
+        *,
+        filters: QuoteFilters | None = None,
+        limit: int | None = None,
+        concurrency: int = 8,
+        deadline: float | None = None,
+    ) -> AsyncIterator[Quote]:
+        return self._iter_sorted_async(
+            lambda page: self.list_async(filters=filters, pagination=Pagination(page=page, limit=limit), sort=sort),
+            window=concurrency,
+        )
+
+    def top(
+        self, n: int, *, sort: BaseSort, filters: QuoteFilters | None = None, deadline: float | None = None
+    ) -> builtins.list[Quote]:
+        return self.list(filters=filters, pagination=Pagination(limit=n), sort=sort).docs
+
+    async def top_async(
+        self, n: int, *, sort: BaseSort, filters: QuoteFilters | None = None, deadline: float | None = None
+    ) -> builtins.list[Quote]:
+        return (await self.list_async(filters=filters, pagination=Pagination(limit=n), sort=sort)).docs
+
+    async def produce_async(
+        self,
+        queue: AsyncQueue[Quote] | AsyncSendStream[Quote],
+        *,
+        filters: QuoteFilters | None = None,
+        limit: int | None = None,
+        concurrency: int = 4,
+        deadline: float | None = None,
+    ) -> int:
+        return await self._produce_async(
+            lambda page: self.list_async(filters=filters, pagination=Pagination(page=page, limit=limit)),
+            queue,
+            concurrency,
+        )
+
+    def get_many(self, quote_ids: Iterable[str], *, deadline: float | None = None) -> builtins.list[Quote]:
+        quote_ids = builtins.list(quote_ids)
+        self._prefetch(f"{self.base_url}/{quote_id}" for quote_id in quote_ids)
+        return self.executor.map(self.get, quote_ids)
+
+    async def get_many_async(self, quote_ids: Iterable[str], *, deadline: float | None = None) -> builtins.list[Quote]:
+        quote_ids = builtins.list(quote_ids)
+        await self._prefetch_async(f"{self.base_url}/{quote_id}" for quote_id in quote_ids)
+        return await gather(self.get_async(quote_id) for quote_id in quote_ids)
+
+    def sync(
+        self,
+        snapshot: SyncSnapshot | None = None,
+        *,
+        filters: QuoteFilters | None = None,
+        limit: int = 1000,
+        full: bool = False,
+        deadline: float | None = None,
+    ) -> ChangeSet[Quote]:
+        return sync_collection(
+            self.http_client,
+            self._fetch_pages,
+            self.base_url,
+            Quote,
+            snapshot,
+            params=filters.to_dict() if filters else {},
+            limit=limit,
+            full=full,
+        )
+
+    async def sync_async(
+        self,
+        snapshot: SyncSnapshot | None = None,
+        *,
+        filters: QuoteFilters | None = None,
+        limit: int = 1000,
+        full: bool = False,
+        deadline: float | None = None,
+    ) -> ChangeSet[Quote]:
+        return await sync_collection_async(
+            self.http_client,
+            self._fetch_pages_async,
+            self.base_url,
+            Quote,
+            snapshot,
+            params=filters.to_dict() if filters else {},
+            limit=limit,
+            full=full,
+        )
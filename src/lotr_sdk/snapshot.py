@@ -0,0 +1,269 @@
+"""Compact binary snapshots of the movie and quote collections.
+
+A snapshot file is laid out as::
+
+    header | string table | movie records | quote records
+
+Strings are stored once, UTF-8 encoded, in the string table and referenced by
+``(offset, length)`` pairs. IDs are stored as their 12 raw ObjectId bytes.
+Records have a fixed width and are sorted by ID, so a reader can memory-map the
+file, index records directly and find IDs by binary search without parsing
+anything up front. Processes mapping the same file share one page-cached copy.
+"""
+
+import mmap
+import os
+import struct
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from pathlib import Path
+from typing import Any, overload
+
+from lotr_sdk.core.errors import ResourceNotFoundError
+from lotr_sdk.schemas.movie import Movie, MovieList
+from lotr_sdk.schemas.quote import Quote, QuoteList
+
+MAGIC = b"LOTRSNP1"
+
+_HEADER = struct.Struct("<8sIIQQQ")
+_MOVIE = struct.Struct("<12sIIiddiid")
+_QUOTE = struct.Struct("<12s12s12sII")
+_ID_SIZE = 12
+
+
+def _id_bytes(value: str) -> bytes:
+    try:
+        raw = bytes.fromhex(value)
+    except ValueError:
+        raw = b""
+    if len(raw) != _ID_SIZE:
+        raise ValueError(f"Not a MongoDB ObjectId: {value!r}")
+    return raw
+
+
+class _StringTable:
+    def __init__(self) -> None:
+        self.buffer = bytearray()
+        self.index: dict[str, tuple[int, int]] = {}
+
+    def add(self, value: str) -> tuple[int, int]:
+        ref = self.index.get(value)
+        if ref is None:
+            encoded = value.encode("utf-8")
+            ref = (len(self.buffer), len(encoded))
+            self.buffer.extend(encoded)
+            self.index[value] = ref
+        return ref
+
+
+def write_snapshot(path: str | Path, movies: Iterable[Movie], quotes: Iterable[Quote]) -> None:
+    """Write movies and quotes to a binary snapshot file.
+
+    The file is written next to its destination and moved into place, so
+    readers never observe a partially written snapshot.
+
+    Args:
+        path: Destination file
+        movies: Movies to store
+        quotes: Quotes to store
+
+    Raises:
+        ValueError: If an ID is not a 24-character hex ObjectId
+    """
+    strings = _StringTable()
+    movie_records = sorted(
+        _MOVIE.pack(
+            _id_bytes(movie.id),
+            *strings.add(movie.name),
+            movie.runtime_in_minutes,
+            movie.budget_in_millions,
+            movie.box_office_revenue_in_millions,
+            movie.academy_award_nominations,
+            movie.academy_award_wins,
+            movie.rotten_tomatoes_score,
+        )
+        for movie in movies
+    )
+    quote_records = sorted(
+        _QUOTE.pack(
+            _id_bytes(quote.id),
+            _id_bytes(quote.movie),
+            _id_bytes(quote.character),
+            *strings.add(quote.dialog),
+        )
+        for quote in quotes
+    )
+
+    strings_offset = _HEADER.size
+    movies_offset = strings_offset + len(strings.buffer)
+    quotes_offset = movies_offset + len(movie_records) * _MOVIE.size
+
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    header = _HEADER.pack(MAGIC, len(movie_records), len(quote_records), strings_offset, movies_offset, quotes_offset)
+    try:
+        with tmp_path.open("wb") as f:
+            f.write(header)
+            f.write(strings.buffer)
+            f.writelines(movie_records)
+            f.writelines(quote_records)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+class _Records[R](Sequence[R]):
+    """Lazy, read-only view over fixed-width records."""
+
+    def __init__(
+        self,
+        buffer: mmap.mmap,
+        offset: int,
+        count: int,
+        record: struct.Struct,
+        decode: Callable[[tuple[Any, ...]], R],
+    ):
+        self._buffer = buffer
+        self._offset = offset
+        self._count = count
+        self._record = record
+        self._decode = decode
+
+    def __len__(self) -> int:
+        return self._count
+
+    @overload
+    def __getitem__(self, index: int) -> R: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[R]: ...
+
+    def __getitem__(self, index: int | slice) -> R | list[R]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("snapshot record index out of range")
+        return self._decode(self._unpack(index))
+
+    def __iter__(self) -> Iterator[R]:
+        for index in range(self._count):
+            yield self._decode(self._unpack(index))
+
+    def _unpack(self, index: int) -> tuple[Any, ...]:
+        return self._record.unpack_from(self._buffer, self._offset + index * self._record.size)
+
+    def _key(self, index: int) -> bytes:
+        start = self._offset + index * self._record.size
+        return self._buffer[start : start + _ID_SIZE]
+
+    def find(self, resource_id: str) -> R | None:
+        """Find a record by ID using binary search."""
+        key = _id_bytes(resource_id)
+        low, high = 0, self._count
+        while low < high:
+            mid = (low + high) // 2
+            if self._key(mid) < key:
+                low = mid + 1
+            else:
+                high = mid
+        if low < self._count and self._key(low) == key:
+            return self[low]
+        return None
+
+
+class SnapshotReader:
+    """Memory-mapped reader for snapshots written by :func:`write_snapshot`.
+
+    Records are decoded on access and built with ``model_construct``, since the
+    data was validated when the snapshot was written.
+    """
+
+    def __init__(self, path: str | Path):
+        """Open a snapshot file.
+
+        Args:
+            path: Snapshot file
+
+        Raises:
+            ValueError: If the file is not a snapshot
+        """
+        self.path = Path(path)
+        with self.path.open("rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, movie_count, quote_count, strings_offset, movies_offset, quotes_offset = _HEADER.unpack_from(self._mmap)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{self.path} is not a LOTR snapshot")
+        self._strings_offset = strings_offset
+        self.movies: _Records[Movie] = _Records(self._mmap, movies_offset, movie_count, _MOVIE, self._decode_movie)
+        self.quotes: _Records[Quote] = _Records(self._mmap, quotes_offset, quote_count, _QUOTE, self._decode_quote)
+
+    def _string(self, offset: int, length: int) -> str:
+        start = self._strings_offset + offset
+        return self._mmap[start : start + length].decode("utf-8")
+
+    def _decode_movie(self, fields: tuple[Any, ...]) -> Movie:
+        raw_id, name_offset, name_length, runtime, budget, revenue, nominations, wins, score = fields
+        return Movie.model_construct(
+            id=raw_id.hex(),
+            name=self._string(name_offset, name_length),
+            runtime_in_minutes=runtime,
+            budget_in_millions=budget,
+            box_office_revenue_in_millions=revenue,
+            academy_award_nominations=nominations,
+            academy_award_wins=wins,
+            rotten_tomatoes_score=score,
+        )
+
+    def _decode_quote(self, fields: tuple[Any, ...]) -> Quote:
+        raw_id, movie, character, dialog_offset, dialog_length = fields
+        return Quote.model_construct(
+            id=raw_id.hex(),
+            dialog=self._string(dialog_offset, dialog_length),
+            movie=movie.hex(),
+            character=character.hex(),
+        )
+
+    def get_movie(self, movie_id: str) -> Movie:
+        """Get a movie by ID.
+
+        Raises:
+            ResourceNotFoundError: If the movie is not in the snapshot
+        """
+        movie = self.movies.find(movie_id)
+        if movie is None:
+            raise ResourceNotFoundError(f"Movie with id {movie_id} not found")
+        return movie
+
+    def get_quote(self, quote_id: str) -> Quote:
+        """Get a quote by ID.
+
+        Raises:
+            ResourceNotFoundError: If the quote is not in the snapshot
+        """
+        quote = self.quotes.find(quote_id)
+        if quote is None:
+            raise ResourceNotFoundError(f"Quote with id {quote_id} not found")
+        return quote
+
+    def movie_list(self) -> MovieList:
+        """Return every movie as a single page."""
+        docs = list(self.movies)
+        return MovieList.model_construct(docs=docs, total=len(docs), limit=len(docs), offset=0, page=1, pages=1)
+
+    def quote_list(self) -> QuoteList:
+        """Return every quote as a single page."""
+        docs = list(self.quotes)
+        return QuoteList.model_construct(docs=docs, total=len(docs), limit=len(docs), offset=0, page=1, pages=1)
+
+    def close(self) -> None:
+        """Release the memory map."""
+        self._mmap.close()
+
+    def __enter__(self) -> "SnapshotReader":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
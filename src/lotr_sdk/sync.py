@@ -0,0 +1,338 @@
+"""Incremental synchronisation of a collection against a stored snapshot."""
+
+import hashlib
+import json
+import math
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any
+
+from lotr_sdk.client.base import HTTPClient
+from lotr_sdk.schemas.base import APIResponse, BaseResource
+
+SNAPSHOT_VERSION = 2
+
+
+@dataclass
+class PageState:
+    """What a snapshot remembers about a single page.
+
+    Attributes:
+        hash: Content hash of the page's docs
+        ids: IDs of the docs on the page, in page order
+        etag: ETag returned by the server, if any
+    """
+
+    hash: str
+    ids: list[str]
+    etag: str | None = None
+
+
+@dataclass
+class SyncSnapshot:
+    """State of a collection as seen by the previous sync.
+
+    Attributes:
+        url: Collection endpoint the snapshot was taken from
+        limit: Page size used for the crawl
+        params: Query parameters, such as filters, the collection was crawled with
+        total: Total number of records reported by the server
+        pages: Page states by page number
+        records: Raw docs by ID
+    """
+
+    url: str
+    limit: int
+    params: dict[str, str] = field(default_factory=dict)
+    total: int = 0
+    pages: dict[int, PageState] = field(default_factory=dict)
+    records: dict[str, dict[str, Any]] = field(default_factory=dict)
+
+    def save(self, path: str | Path) -> None:
+        """Write the snapshot to a JSON file.
+
+        Args:
+            path: Destination file
+        """
+        data = asdict(self)
+        data["version"] = SNAPSHOT_VERSION
+        Path(path).write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: str | Path) -> "SyncSnapshot":
+        """Read a snapshot written by :meth:`save`.
+
+        Args:
+            path: Snapshot file
+
+        Returns:
+            The loaded snapshot
+        """
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        if data.pop("version", None) != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version in {path}")
+        pages = {int(page): PageState(**state) for page, state in data.pop("pages").items()}
+        return cls(pages=pages, **data)
+
+
+@dataclass
+class ChangeSet[R: BaseResource]:
+    """Differences between a snapshot and the current state of a collection.
+
+    Attributes:
+        added: Records that were not in the snapshot
+        updated: Records whose content changed
+        removed: Records that are no longer in the collection
+        snapshot: Snapshot of the current state, to be used by the next sync
+        requests: Number of requests made
+        unchanged_pages: Number of pages kept from the snapshot because their content was unchanged
+    """
+
+    added: list[R]
+    updated: list[R]
+    removed: list[R]
+    snapshot: SyncSnapshot
+    requests: int = 0
+    unchanged_pages: int = 0
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.updated or self.removed)
+
+
+@dataclass
+class _Page:
+    number: int
+    status_code: int
+    etag: str | None
+    docs: list[dict[str, Any]]
+    total: int | None
+    pages: int | None
+
+
+def _doc_id(doc: dict[str, Any]) -> str:
+    return str(doc.get("_id", doc.get("id")))
+
+
+def page_hash(docs: list[dict[str, Any]]) -> str:
+    """Return a stable content hash for a list of raw docs.
+
+    Args:
+        docs: Raw docs as returned by the API
+
+    Returns:
+        Hex digest that only changes when the docs change
+    """
+    payload = json.dumps(docs, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _canonical_params(params: dict[str, Any]) -> dict[str, str]:
+    return {name: str(value) for name, value in sorted(params.items())}
+
+
+def _page_params(params: dict[str, str], page: int, limit: int) -> dict[str, str]:
+    return {**params, "page": str(page), "limit": str(limit)}
+
+
+def _conditional_headers(snapshot: SyncSnapshot | None, page: int) -> dict[str, str] | None:
+    state = snapshot.pages.get(page) if snapshot else None
+    if state is None or state.etag is None:
+        return None
+    return {"If-None-Match": state.etag}
+
+
+def _to_page(number: int, response: APIResponse[Any]) -> _Page:
+    data = response.data or {}
+    etag = next((value for key, value in response.headers.items() if key.lower() == "etag"), None)
+    return _Page(
+        number=number,
+        status_code=response.status_code,
+        etag=etag,
+        docs=data.get("docs", []),
+        total=data.get("total"),
+        pages=data.get("pages"),
+    )
+
+
+class _Differ[R: BaseResource]:
+    """Folds fetched pages into a change set."""
+
+    def __init__(self, model: type[R], url: str, limit: int, params: dict[str, str], snapshot: SyncSnapshot | None):
+        if snapshot is not None and (snapshot.url, snapshot.params) != (url, params):
+            raise ValueError(
+                f"Snapshot of {snapshot.url} with params {snapshot.params} cannot be synced "
+                f"against {url} with params {params}"
+            )
+        self.model = model
+        self.previous = snapshot if snapshot and snapshot.limit == limit else None
+        self.old_records = snapshot.records if snapshot else {}
+        self.current = SyncSnapshot(url=url, limit=limit, params=params)
+        self.changed_docs: dict[str, dict[str, Any]] = {}
+        self.unchanged_pages = 0
+
+    def page_count(self, first: _Page) -> int:
+        if first.status_code == HTTPStatus.NOT_MODIFIED and self.previous is not None:
+            self.current.total = self.previous.total
+            return max(self.previous.pages, default=1)
+        self.current.total = first.total or 0
+        if first.pages is not None:
+            return first.pages
+        return max(1, math.ceil(self.current.total / self.current.limit))
+
+    def add(self, page: _Page) -> None:
+        old = self.previous.pages.get(page.number) if self.previous else None
+        if page.status_code == HTTPStatus.NOT_MODIFIED and old is not None:
+            self._keep(page.number, old)
+            return
+
+        digest = page_hash(page.docs)
+        if old is not None and old.hash == digest:
+            self._keep(page.number, PageState(hash=digest, ids=old.ids, etag=page.etag or old.etag))
+            return
+
+        ids = [_doc_id(doc) for doc in page.docs]
+        self.current.pages[page.number] = PageState(hash=digest, ids=ids, etag=page.etag)
+        for doc_id, doc in zip(ids, page.docs, strict=True):
+            self.current.records[doc_id] = doc
+            self.changed_docs[doc_id] = doc
+
+    def first_page_unchanged(self, first: _Page) -> bool:
+        """Return whether the first page, ``total`` included, is the one in the snapshot."""
+        old = self.previous.pages.get(1) if self.previous else None
+        if self.previous is None or old is None:
+            return False
+        if first.status_code == HTTPStatus.NOT_MODIFIED:
+            # The ETag covers the whole response body, total included
+            return True
+        return first.total == self.previous.total and page_hash(first.docs) == old.hash
+
+    def keep_rest(self) -> None:
+        """Keep every page after the first from the snapshot, without fetching them."""
+        assert self.previous is not None
+        self.current.total = self.previous.total
+        for number, state in self.previous.pages.items():
+            if number != 1:
+                self._keep(number, state)
+
+    def _keep(self, number: int, state: PageState) -> None:
+        self.unchanged_pages += 1
+        self.current.pages[number] = state
+        for doc_id in state.ids:
+            self.current.records[doc_id] = self.old_records[doc_id]
+
+    def result(self, requests: int) -> ChangeSet[R]:
+        added = [self.model(**doc) for doc_id, doc in self.changed_docs.items() if doc_id not in self.old_records]
+        updated = [
+            self.model(**doc)
+            for doc_id, doc in self.changed_docs.items()
+            if doc_id in self.old_records and self.old_records[doc_id] != doc
+        ]
+        removed = [self.model(**doc) for doc_id, doc in self.old_records.items() if doc_id not in self.current.records]
+        return ChangeSet(
+            added=added,
+            updated=updated,
+            removed=removed,
+            snapshot=self.current,
+            requests=requests,
+            unchanged_pages=self.unchanged_pages,
+        )
+
+
+def sync_collection[R: BaseResource](  # noqa: PLR0913
+    http_client: HTTPClient,
+    fetch_pages: Callable[[Callable[[int], _Page], range], list[_Page]],
+    url: str,
+    model: type[R],
+    snapshot: SyncSnapshot | None,
+    *,
+    params: dict[str, Any],
+    limit: int,
+    full: bool = False,
+) -> ChangeSet[R]:
+    """Crawl a collection and diff it against a snapshot.
+
+    When the first page and the collection's ``total`` are unchanged, the
+    remaining pages are assumed unchanged too and are not requested, so a sync
+    of an unchanged collection costs a single request. An edit that leaves
+    both untouched, such as a record updated in place on a later page, is only
+    found by a ``full`` sync. Otherwise every page is requested, and pages the
+    server reports as ``304 Not Modified``, or whose content hash matches the
+    snapshot, are not validated again. Only the docs of changed pages are
+    turned into models.
+
+    Args:
+        http_client: Client used for the requests
+        fetch_pages: Function fetching several pages, possibly in parallel
+        url: Collection endpoint
+        model: Resource model of the collection
+        snapshot: Snapshot from the previous sync, or None for a first sync
+        params: Extra query parameters, such as filters
+        limit: Page size
+        full: Request every page, even when the first page and total are unchanged
+
+    Returns:
+        The change set, including the new snapshot
+
+    Raises:
+        ValueError: If the snapshot was taken from another endpoint or with other params
+    """
+    params = _canonical_params(params)
+    differ = _Differ(model, url, limit, params, snapshot)
+
+    def fetch(page: int) -> _Page:
+        response = http_client.request(
+            method="GET",
+            url=url,
+            params=_page_params(params, page, limit),
+            headers=_conditional_headers(differ.previous, page),
+        )
+        return _to_page(page, response)
+
+    first = fetch(1)
+    if not full and differ.first_page_unchanged(first):
+        differ.add(first)
+        differ.keep_rest()
+        return differ.result(requests=1)
+    differ.add(first)
+    rest = range(2, differ.page_count(first) + 1)
+    for page in fetch_pages(fetch, rest):
+        differ.add(page)
+    return differ.result(requests=1 + len(rest))
+
+
+async def sync_collection_async[R: BaseResource](  # noqa: PLR0913
+    http_client: HTTPClient,
+    fetch_pages: Callable[[Callable[[int], Awaitable[_Page]], range], Awaitable[list[_Page]]],
+    url: str,
+    model: type[R],
+    snapshot: SyncSnapshot | None,
+    *,
+    params: dict[str, Any],
+    limit: int,
+    full: bool = False,
+) -> ChangeSet[R]:
+    """Asynchronous version of :func:`sync_collection`."""
+    params = _canonical_params(params)
+    differ = _Differ(model, url, limit, params, snapshot)
+
+    async def fetch(page: int) -> _Page:
+        response = await http_client.request_async(
+            method="GET",
+            url=url,
+            params=_page_params(params, page, limit),
+            headers=_conditional_headers(differ.previous, page),
+        )
+        return _to_page(page, response)
+
+    first = await fetch(1)
+    if not full and differ.first_page_unchanged(first):
+        differ.add(first)
+        differ.keep_rest()
+        return differ.result(requests=1)
+    differ.add(first)
+    rest = range(2, differ.page_count(first) + 1)
+    for page in await fetch_pages(fetch, rest):
+        differ.add(page)
+    return differ.result(requests=1 + len(rest))
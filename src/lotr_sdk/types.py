@@ -1,7 +1,83 @@
-from typing import Annotated
+import functools
+import sys
+from typing import Annotated, Any, Self
+
+from pydantic import AfterValidator, AliasChoices, Field, GetCoreSchemaHandler, GetJsonSchemaHandler
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import core_schema
+
+# Length of an ObjectId in bytes
+OBJECT_ID_SIZE = 12
+
+
+class ObjectId(bytes):
+    """A MongoDB ObjectId held as its 12 raw bytes.
+
+    Hashable and ordered like its hexadecimal form; ``str()`` returns the
+    24-character hexadecimal string the API uses.
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, value: str | bytes) -> Self:
+        """Create an ObjectId from its hexadecimal string or its 12 raw bytes.
+
+        Raises:
+            ValueError: If the value is not a valid ObjectId
+        """
+        if isinstance(value, str):
+            if len(value) != 2 * OBJECT_ID_SIZE:
+                raise ValueError(f"Invalid ObjectId: {value!r}")
+            value = bytes.fromhex(value)
+        if len(value) != OBJECT_ID_SIZE:
+            raise ValueError(f"Invalid ObjectId: {value!r}")
+        return super().__new__(cls, value)
+
+    def __str__(self) -> str:
+        return self.hex()
+
+    def __repr__(self) -> str:
+        return f"ObjectId('{self.hex()}')"
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            _validate_object_id,
+            serialization=core_schema.plain_serializer_function_ser_schema(str, when_used="json"),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls,
+        schema: core_schema.CoreSchema,
+        handler: GetJsonSchemaHandler,
+    ) -> JsonSchemaValue:
+        return {"type": "string", "pattern": "^[0-9a-f]{24}$"}
+
+
+@functools.lru_cache(maxsize=65536)
+def parse_object_id(value: str) -> ObjectId:
+    """Parse an ObjectId, returning the same instance for repeated values."""
+    return ObjectId(value)
+
+
+def _validate_object_id(value: Any) -> ObjectId:
+    if isinstance(value, ObjectId):
+        return value
+    if isinstance(value, str | bytes):
+        return parse_object_id(value)
+    raise ValueError(f"Invalid ObjectId: {value!r}")
 
-from pydantic import AliasChoices, Field
 
 MongoIdField = Annotated[
     str, Field(description="MongoDB ObjectId", validation_alias=AliasChoices("_id", "id"), serialization_alias="id")
 ]
+
+# Compact alternative to MongoIdField, for models that opt in
+ObjectIdField = Annotated[
+    ObjectId,
+    Field(description="MongoDB ObjectId", validation_alias=AliasChoices("_id", "id"), serialization_alias="id"),
+]
+
+# ID of another resource, interned since many resources repeat it
+ForeignKeyField = Annotated[str, AfterValidator(sys.intern)]
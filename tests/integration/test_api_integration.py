@@ -112,3 +112,19 @@ def test_authentication_header(lotr_api, httpx_mock: HTTPXMock, sample_movie_dat
 
     # The test will fail if the header doesn't match what we specified in match_headers
     assert len(result.docs) == 1
+
+
+def test_not_modified_response(lotr_api, httpx_mock: HTTPXMock):
+    """Test that a 304 answer to a conditional request is returned instead of raised."""
+    httpx_mock.add_response(
+        method="GET",
+        url="https://the-one-api.dev/v2/movie",
+        status_code=304,
+        headers={"ETag": 'W/"abc"'},
+        match_headers={"If-None-Match": 'W/"abc"'},
+    )
+
+    response = lotr_api._http_client.request("GET", "/v2/movie", headers={"If-None-Match": 'W/"abc"'})
+
+    assert response.status_code == 304
+    assert response.data == {}
@@ -0,0 +1,48 @@
+"""Scripted transports shared by the transport tests."""
+
+import json
+
+import anyio
+
+from lotr_sdk.client.base import BaseHTTPClient, TransportResponse
+
+
+class ScriptedClient(BaseHTTPClient):
+    """Transport that replays a fixed sequence of responses and errors."""
+
+    transient_errors = (ConnectionError,)
+
+    def __init__(self, settings, outcomes):
+        super().__init__(settings)
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def _send(self, method, url, params, body, headers, timeouts):
+        self.sent = (body, headers)
+        outcome = self.outcomes[self.calls]
+        self.calls += 1
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def ok(data=None, status_code=200):
+    return TransportResponse(status_code, {"etag": '"1"'}, json.dumps(data or {"docs": []}).encode())
+
+
+class DelayedClient(BaseHTTPClient):
+    """Async transport whose responses take scripted delays."""
+
+    def __init__(self, settings, delays, errors=()):
+        super().__init__(settings)
+        self.delays = list(delays)
+        self.errors = set(errors)
+        self.calls = 0
+
+    async def _send_async(self, method, url, params, body, headers, timeouts):
+        index = self.calls
+        self.calls += 1
+        await anyio.sleep(self.delays[index])
+        if index in self.errors:
+            raise ConnectionError(f"attempt {index} failed")
+        return ok({"attempt": index})
@@ -0,0 +1,67 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from lotr_sdk.analytics import MovieFrame  # noqa: E402
+from lotr_sdk.schemas.base import BaseSort, FieldFilter  # noqa: E402
+from lotr_sdk.schemas.movie import Movie, MovieFilters  # noqa: E402
+
+
+@pytest.fixture
+def frame():
+    """Frame over three sample movies."""
+    movies = [
+        Movie(
+            id=f"5cd95395de30eff6ebccde5{suffix}",
+            name=name,
+            runtimeInMinutes=runtime,
+            budgetInMillions=budget,
+            boxOfficeRevenueInMillions=revenue,
+            academyAwardNominations=nominations,
+            academyAwardWins=wins,
+            rottenTomatoesScore=score,
+        )
+        for suffix, name, runtime, budget, revenue, nominations, wins, score in [
+            ("c", "The Fellowship of the Ring", 178, 93, 871.5, 13, 4, 91),
+            ("d", "The Two Towers", 179, 94, 926, 6, 2, 96),
+            ("e", "The Return of the King", 201, 94, 1120, 11, 11, 95),
+        ]
+    ]
+    return MovieFrame.from_movies(movies)
+
+
+def test_filter_mirrors_field_filter_semantics(frame):
+    """Test that local filtering matches the API's filter operators."""
+    assert len(frame.filter(MovieFilters(runtime_in_minutes=FieldFilter(gt=178)))) == 2
+    assert len(frame.filter(MovieFilters(academy_award_wins=FieldFilter(include=[2, 11])))) == 2
+    assert len(frame.filter(MovieFilters(name=FieldFilter(regex="/^the two/i")))) == 1
+
+    filters = MovieFilters(name=FieldFilter(exclude=["The Two Towers"]), budget_in_millions=FieldFilter(lt=94))
+    assert len(frame.filter(filters)) == 1
+
+
+def test_sort(frame):
+    """Test sorting by field name or BaseSort, including API field names."""
+    assert frame.sort("rotten_tomatoes_score")["name"][0] == "The Fellowship of the Ring"
+    assert frame.sort(BaseSort(field="rottenTomatoesScore", order="desc"))["name"][0] == "The Two Towers"
+
+
+def test_aggregates_and_ratios(frame):
+    """Test column aggregates and derived ratios."""
+    assert frame.aggregate("academy_award_wins", "sum") == 17
+    assert frame.awards_per_minute()[2] == pytest.approx(11 / 201)
+    assert frame.budget_to_box_office()[0] == pytest.approx(93 / 871.5)
+
+
+def test_group_by(frame):
+    """Test grouped aggregation."""
+    assert frame.group_by("budget_in_millions", "academy_award_wins", "sum") == {93.0: 4.0, 94.0: 13.0}
+    assert frame.group_by("budget_in_millions", "runtime_in_minutes", "max") == {93.0: 178.0, 94.0: 201.0}
+
+
+def test_round_trip_to_movies(frame):
+    """Test converting rows back into movies."""
+    movies = frame.to_movies()
+
+    assert movies[2].name == "The Return of the King"
+    assert movies[2].runtime_in_minutes == 201
@@ -0,0 +1,63 @@
+from unittest.mock import MagicMock
+
+import pytest
+from fakes import ScriptedClient, ok
+
+from lotr_sdk import benchmark
+from lotr_sdk.benchmark import BenchmarkResult, benchmark_async, benchmark_sync, format_results
+from lotr_sdk.core.errors import APIError
+from lotr_sdk.core.settings import Settings
+
+
+@pytest.fixture
+def settings():
+    return Settings(api_key="test-api-key", max_retries=2, retry_delay=0)
+
+
+def test_benchmark_sync(mock_http_client):
+    """Test that the sync benchmark counts successes and failures."""
+    mock_http_client.request.side_effect = [MagicMock(), APIError(), MagicMock()]
+
+    result = benchmark_sync(mock_http_client, name="mock", requests=3, concurrency=1)
+
+    assert result.requests == 3
+    assert result.errors == 1
+    assert len(result.latencies) == 2
+    assert "mock" in format_results([result])
+
+
+@pytest.mark.asyncio
+async def test_benchmark_async(mock_http_client):
+    """Test that the async benchmark issues the requested number of requests."""
+    result = await benchmark_async(mock_http_client, name="mock", requests=5, concurrency=2)
+
+    assert mock_http_client.request_async.call_count == 5
+    assert result.errors == 0
+
+
+def test_benchmark_run_measures_the_transport(settings, monkeypatch):
+    """Test that the benchmark disables coalescing and caching and sizes pools to the concurrency."""
+    clients = []
+
+    def factory(settings):
+        clients.append(ScriptedClient(settings, [ok()] * 3))
+        return clients[-1]
+
+    monkeypatch.setattr(benchmark, "transports", lambda: {"scripted": (factory, ("sync",))})
+
+    results = benchmark.run(settings.model_copy(update={"cache_url": "memory://"}), requests=2, concurrency=4)
+
+    assert [result.requests for result in results] == [2]
+    assert not clients[0].settings.coalesce_requests
+    assert clients[0].settings.cache_url is None
+    assert clients[0].settings.max_workers == 4
+
+
+def test_benchmark_percentiles():
+    """Test latency percentiles of a result, and that failed requests do not count towards throughput."""
+    result = BenchmarkResult("mock", "sync", 1.0, tuple(i / 100 for i in range(1, 101)), errors=50)
+
+    assert result.requests == 150
+    assert result.requests_per_second == 100
+    assert result.percentile(50) == pytest.approx(0.505)
+    assert result.percentile(95) == pytest.approx(0.9505)
@@ -0,0 +1,208 @@
+import json
+import threading
+import time
+
+import fakeredis
+import pytest
+import redis
+
+from lotr_sdk.client.base import BaseHTTPClient, TransportResponse
+from lotr_sdk.core.cache import MemoryCache, RedisCache, decode_response, encode_response
+from lotr_sdk.core.codec import get_codec
+from lotr_sdk.core.settings import Settings
+from lotr_sdk.schemas.base import APIResponse
+from lotr_sdk.services.movie import MovieService
+
+
+class CountingClient(BaseHTTPClient):
+    """Transport answering every request with the same movie, counting requests."""
+
+    def __init__(self, settings, delay=0.0):
+        super().__init__(settings)
+        self.delay = delay
+        self.calls = 0
+
+    def _send(self, method, url, params, body, headers, timeouts):
+        self.calls += 1
+        time.sleep(self.delay)
+        movie = {
+            "_id": url.rsplit("/", 1)[-1],
+            "name": "The Two Towers",
+            "runtimeInMinutes": 179,
+            "budgetInMillions": 94,
+            "boxOfficeRevenueInMillions": 926,
+            "academyAwardNominations": 6,
+            "academyAwardWins": 2,
+            "rottenTomatoesScore": 96,
+        }
+        return TransportResponse(200, {}, json.dumps({"docs": [movie]}).encode())
+
+
+@pytest.fixture
+def settings():
+    return Settings(api_key="test-api-key", max_retries=0, coalesce_requests=False)
+
+
+@pytest.fixture
+def redis_cache():
+    return RedisCache(fakeredis.FakeRedis())
+
+
+def test_encode_response_compresses_large_payloads():
+    """Test that large payloads are compressed and round-trip."""
+    codec = get_codec()
+    small = APIResponse(data={"docs": []}, status_code=200, headers={"etag": "1"})
+    large = APIResponse(data={"docs": ["Sméagol"] * 1000}, status_code=200, headers={})
+
+    assert decode_response(codec, encode_response(codec, small)) == small
+    assert len(encode_response(codec, large)) < len(codec.dumps(large.data))
+    assert decode_response(codec, encode_response(codec, large)) == large
+
+
+@pytest.mark.parametrize("cache_factory", [MemoryCache, lambda: RedisCache(fakeredis.FakeRedis())])
+def test_backend_contract(cache_factory):
+    """Test get, get_many, TTL and locking on every backend."""
+    cache = cache_factory()
+    cache.set("a", b"1", ttl=60)
+    cache.set("b", b"2", ttl=0.01)
+    time.sleep(0.05)
+
+    assert cache.get("a") == b"1"
+    assert cache.get_many(["a", "b", "c"]) == [b"1", None, None]
+
+    token = cache.lock("a", ttl=60)
+    assert token is not None
+    assert cache.lock("a", ttl=60) is None
+    cache.unlock("a", "someone-else")
+    assert cache.lock("a", ttl=60) is None
+    cache.unlock("a", token)
+    assert cache.lock("a", ttl=60) is not None
+
+
+def test_redis_unlock_leaves_a_lock_taken_over_meanwhile(redis_cache, monkeypatch):
+    """Test that unlocking gives up when another holder takes the lock between the check and the delete."""
+    token = redis_cache.lock("a", ttl=60)
+    client_pipeline = redis_cache.client.pipeline
+
+    def racing_pipeline(*args, **kwargs):
+        pipeline = client_pipeline(*args, **kwargs)
+        get = pipeline.get
+
+        def get_then_take_over(key):
+            held = get(key)
+            redis_cache.client.set(key, "other-holder")
+            return held
+
+        pipeline.get = get_then_take_over
+        return pipeline
+
+    monkeypatch.setattr(redis_cache.client, "pipeline", racing_pipeline)
+
+    redis_cache.unlock("a", token)
+
+    assert redis_cache.client.get("lotr:a:lock") == b"other-holder"
+
+
+def test_redis_unlock_raises_connection_errors():
+    """Test that unlocking only swallows lost races, not Redis failures."""
+    server = fakeredis.FakeServer()
+    cache = RedisCache(fakeredis.FakeRedis(server=server))
+    token = cache.lock("a", ttl=60)
+    server.connected = False
+
+    with pytest.raises(redis.ConnectionError):
+        cache.unlock("a", token)
+
+
+def test_redis_cache_shared_between_clients(settings, redis_cache):
+    """Test that a response fetched by one client is served from Redis to another."""
+    first, second = CountingClient(settings), CountingClient(settings)
+    first.cache = second.cache = redis_cache
+
+    fetched = first.request("GET", "/v2/movie", params={"limit": 2})
+    cached = second.request("GET", "/v2/movie", params={"limit": "2"})
+
+    assert cached == fetched
+    assert (first.calls, second.calls) == (1, 0)
+
+
+def test_cache_skips_conditional_requests(settings):
+    """Test that requests with extra headers always reach the server."""
+    client = CountingClient(settings)
+    client.cache = MemoryCache()
+
+    client.request("GET", "/v2/movie")
+    client.request("GET", "/v2/movie", headers={"If-None-Match": '"1"'})
+
+    assert client.calls == 2
+
+
+def test_cache_lock_prevents_stampede(settings, redis_cache):
+    """Test that concurrent misses in separate clients cost a single request."""
+    clients = [CountingClient(settings, delay=0.1) for _ in range(4)]
+    for client in clients:
+        client.cache = redis_cache
+        client.cache_poll_interval = 0.01
+    threads = [threading.Thread(target=client.request, args=("GET", "/v2/movie")) for client in clients]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(client.calls for client in clients) == 1
+
+
+def test_get_many_prefetches_in_one_round_trip(settings):
+    """Test that get_many loads cached movies with one pipelined round trip."""
+    server = fakeredis.FakeServer()
+    client = CountingClient(settings)
+    client.cache = RedisCache(fakeredis.FakeRedis(server=server))
+    service = MovieService(client)
+    service.get("1")
+
+    commands = []
+    redis = fakeredis.FakeRedis(server=server)
+    redis.execute_command = lambda *args, **kwargs: (
+        commands.append(args) or fakeredis.FakeRedis.execute_command(redis, *args, **kwargs)
+    )
+    client.cache = RedisCache(redis)
+    movies = service.get_many(["1", "2"])
+
+    assert [movie.id for movie in movies] == ["1", "2"]
+    assert client.calls == 2
+    # The cached movie came from the pipelined lookup, only the missing one was read again
+    assert [args[1] for args in commands if args[0] == "GET"] == ["lotr:https://the-one-api.dev/v2/movie/2?"]
+
+
+def test_prefetched_responses_do_not_accumulate(settings):
+    """Test that prefetched responses are dropped once read, or when the next prefetch replaces them."""
+    client = CountingClient(settings)
+    client.cache = MemoryCache()
+    for movie_id in ("1", "2", "3"):
+        client.request("GET", f"/v2/movie/{movie_id}")
+
+    assert client.prefetch([("/v2/movie/1", None), ("/v2/movie/2", None)]) == 2
+    client.request("GET", "/v2/movie/1")
+    assert list(client._prefetched) == ["https://the-one-api.dev/v2/movie/2?"]
+
+    assert client.prefetch([("/v2/movie/3", None)]) == 1
+    assert list(client._prefetched) == ["https://the-one-api.dev/v2/movie/3?"]
+    assert client.calls == 3
+
+
+async def test_cache_async(settings, redis_cache):
+    """Test that asynchronous requests read and fill the cache."""
+    client = CountingClient(settings)
+    client.cache = redis_cache
+
+    await client.request_async("GET", "/v2/movie/1")
+    response = await client.request_async("GET", "/v2/movie/1")
+
+    assert response.data["docs"][0]["_id"] == "1"
+    assert client.calls == 1
+
+
+def test_cache_from_settings():
+    """Test that cache_url selects the backend."""
+    assert CountingClient(Settings(api_key="k")).cache is None
+    assert isinstance(CountingClient(Settings(api_key="k", cache_url="memory://")).cache, MemoryCache)
@@ -0,0 +1,111 @@
+import gzip
+import json
+import time
+
+import pytest
+
+from lotr_sdk.client.base import BaseHTTPClient, TransportResponse
+from lotr_sdk.client.cassette import CassetteClient
+from lotr_sdk.core.errors import CassetteMissError, ServerError
+from lotr_sdk.core.settings import Settings
+from lotr_sdk.schemas.base import Pagination
+from lotr_sdk.services.movie import MovieService
+
+MOVIE = {
+    "_id": "5cd95395de30eff6ebccde5c",
+    "name": "The Fellowship of the Ring",
+    "runtimeInMinutes": 178,
+    "budgetInMillions": 93,
+    "boxOfficeRevenueInMillions": 871.5,
+    "academyAwardNominations": 13,
+    "academyAwardWins": 4,
+    "rottenTomatoesScore": 91,
+}
+
+
+class LiveClient(BaseHTTPClient):
+    """Transport standing in for a live server, answering after a fixed latency."""
+
+    def __init__(self, settings, latency=0.0, status_code=200):
+        super().__init__(settings)
+        self.latency = latency
+        self.status_code = status_code
+        self.calls = 0
+
+    def _send(self, method, url, params, body, headers, timeouts):
+        self.calls += 1
+        time.sleep(self.latency)
+        page = {"docs": [MOVIE], "total": 1, "limit": 1, "offset": 0, "page": 1, "pages": 1}
+        return TransportResponse(self.status_code, {"x-call": str(self.calls)}, json.dumps(page).encode())
+
+
+@pytest.fixture
+def settings():
+    return Settings(api_key="test-api-key", max_retries=1, retry_delay=0, coalesce_requests=False)
+
+
+@pytest.fixture
+def cassette(settings, tmp_path):
+    path = tmp_path / "movies.ndjson.gz"
+    recorder = CassetteClient.record(LiveClient(settings, latency=0.05), path)
+    service = MovieService(recorder)
+    service.list(pagination=Pagination(limit=1))
+    service.list(pagination=Pagination(limit=1))
+    service.get(MOVIE["_id"])
+    recorder.close()
+    return path
+
+
+def test_cassette_records_compressed_ndjson(cassette):
+    """Test that each exchange is saved as one line without credentials."""
+    with gzip.open(cassette, "rt") as file:
+        exchanges = [json.loads(line) for line in file]
+
+    assert [exchange["url"] for exchange in exchanges] == ["/v2/movie", "/v2/movie", f"/v2/movie/{MOVIE['_id']}"]
+    assert exchanges[0]["params"] == [["limit", "1"]]
+    assert exchanges[0]["latency"] >= 0.05
+    assert "test-api-key" not in cassette.read_bytes().decode("latin-1")
+
+
+def test_cassette_replays_offline(settings, cassette):
+    """Test that replay returns recorded responses in order, then starts over."""
+    service = MovieService(CassetteClient.replay(settings, cassette))
+
+    assert service.get(MOVIE["_id"]).name == "The Fellowship of the Ring"
+    calls = [service.http_client.request("GET", "/v2/movie", params={"limit": 1}).headers["x-call"] for _ in range(3)]
+
+    assert calls == ["1", "2", "1"]
+
+
+def test_cassette_replay_miss(settings, cassette):
+    """Test that an unrecorded request raises instead of reaching the network."""
+    client = CassetteClient.replay(settings, cassette)
+
+    with pytest.raises(CassetteMissError):
+        client.request("GET", "/v2/quote")
+
+
+@pytest.mark.parametrize(("speed", "minimum", "maximum"), [(None, 0.0, 0.04), (1.0, 0.05, 1.0), (10.0, 0.005, 0.04)])
+async def test_cassette_replay_timing(settings, cassette, speed, minimum, maximum):
+    """Test that replay reproduces recorded latencies, scaled by the speed factor."""
+    client = CassetteClient.replay(settings, cassette, speed=speed)
+
+    start = time.perf_counter()
+    await client.request_async("GET", f"/v2/movie/{MOVIE['_id']}")
+    elapsed = time.perf_counter() - start
+
+    assert minimum <= elapsed < maximum
+
+
+def test_cassette_replays_errors_through_retries(settings, tmp_path):
+    """Test that recorded error responses drive the same retry logic as live ones."""
+    path = tmp_path / "errors.ndjson.gz"
+    recorder = CassetteClient.record(LiveClient(settings, status_code=503), path)
+    with pytest.raises(ServerError):
+        recorder.request("GET", "/v2/movie")
+    recorder.close()
+
+    client = CassetteClient.replay(settings, path)
+    with pytest.raises(ServerError):
+        client.request("GET", "/v2/movie")
+    assert client._played[("GET", "/v2/movie", (), None)] == 2
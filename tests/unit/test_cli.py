@@ -0,0 +1,122 @@
+import csv
+import io
+import json
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from lotr_sdk.cli import Progress, build_filters, build_parser, main, parse_filter, run
+from lotr_sdk.core.settings import Settings
+from lotr_sdk.schemas.base import FieldFilter
+from lotr_sdk.schemas.quote import QuoteFilters
+
+
+def quote_pages(request: httpx.Request) -> httpx.Response:
+    """Serve 5 quotes in pages of the requested size."""
+    page = int(request.url.params.get("page", 1))
+    limit = int(request.url.params["limit"])
+    ids = range((page - 1) * limit, min(page * limit, 5))
+    docs = [{"_id": f"{i:024x}", "dialog": f"Quote {i}", "movie": "m", "character": "c"} for i in ids]
+    return httpx.Response(200, json={"docs": docs, "total": 5, "limit": limit, "page": page, "pages": -(-5 // limit)})
+
+
+@pytest.fixture
+def settings():
+    return Settings(api_key="test-api-key")
+
+
+def test_parse_filter():
+    """Test that each expression maps to the matching FieldFilter condition."""
+    assert parse_filter(["Gandalf"]) == FieldFilter(match="Gandalf")
+    assert parse_filter(["!=Gandalf"]) == FieldFilter(not_match="Gandalf")
+    assert parse_filter(["a,b"]) == FieldFilter(include=["a", "b"])
+    assert parse_filter(["!a,b"]) == FieldFilter(exclude=["a", "b"])
+    assert parse_filter([">=160", "<200.5"]) == FieldFilter(gte=160, lt=200.5)
+    assert parse_filter(["/ring/i"]) == FieldFilter(regex="/ring/i")
+    assert parse_filter(["!exists"]) == FieldFilter(exists=False)
+    with pytest.raises(ValueError):
+        parse_filter([""])
+    with pytest.raises(ValueError, match="Conflicting"):
+        parse_filter(["Gandalf", "/ring/i"])
+
+
+def test_build_filters_from_flags():
+    """Test that filter flags are generated from the filter dataclass fields."""
+    args = build_parser().parse_args(["quotes", "--movie", "m1,m2", "--dialog", "/ring/i", "--dialog", "!exists"])
+
+    assert build_filters("quotes", args) == QuoteFilters(
+        movie=FieldFilter(include=["m1", "m2"]),
+        dialog=FieldFilter(regex="/ring/i", exists=False),
+    )
+    assert build_filters("quotes", build_parser().parse_args(["quotes"])) is None
+
+
+def test_run_streams_ndjson_in_order(settings, httpx_mock: HTTPXMock, capsys):
+    """Test that every page is fetched and records are written in order."""
+    httpx_mock.add_callback(quote_pages, is_reusable=True)
+    stdout = io.StringIO()
+
+    args = build_parser().parse_args(["quotes", "--limit", "2", "--concurrency", "2"])
+    written = run(args, settings=settings, stdout=stdout)
+
+    records = [json.loads(line) for line in stdout.getvalue().splitlines()]
+    assert written == 5
+    assert [record["dialog"] for record in records] == [f"Quote {i}" for i in range(5)]
+    assert len(httpx_mock.get_requests()) == 3
+    assert "5/5 records" in capsys.readouterr().err
+
+
+def test_run_writes_csv_file(settings, httpx_mock: HTTPXMock, tmp_path):
+    """Test CSV output to a file, stopping after --max-records."""
+    httpx_mock.add_callback(quote_pages, is_reusable=True)
+    path = tmp_path / "quotes.csv"
+
+    args = ["quotes", "--format", "csv", "-o", str(path), "--limit", "2", "--max-records", "3", "-q"]
+    written = run(build_parser().parse_args(args), settings=settings)
+
+    with path.open(newline="") as file:
+        rows = list(csv.DictReader(file))
+    assert written == 3
+    assert [row["dialog"] for row in rows] == ["Quote 0", "Quote 1", "Quote 2"]
+
+
+def test_run_writes_selected_fields_only(settings, httpx_mock: HTTPXMock):
+    """Test that --fields keeps only the selected fields, without null keys for the others."""
+    httpx_mock.add_callback(quote_pages, is_reusable=True)
+    stdout = io.StringIO()
+
+    run(build_parser().parse_args(["quotes", "--fields", "dialog", "-q"]), settings=settings, stdout=stdout)
+
+    records = [json.loads(line) for line in stdout.getvalue().splitlines()]
+    assert records[0] == {"id": f"{0:024x}", "dialog": "Quote 0"}
+
+
+def test_progress_estimates_time_left():
+    """Test that the progress line reports throughput and ETA."""
+    progress = Progress(io.StringIO())
+    progress.start -= 2
+    progress.update(100, total=300)
+
+    assert progress.line().startswith("100/300 records  50 records/s")
+    assert "ETA 4s" in progress.line()
+
+
+def test_main_reports_invalid_arguments(capsys):
+    """Test that invalid arguments exit with a usage error."""
+    with pytest.raises(SystemExit):
+        main(["quotes", "--sort", "dialog:sideways"])
+
+    assert "Invalid sort order" in capsys.readouterr().err
+
+
+def test_main_reports_api_errors(monkeypatch, httpx_mock: HTTPXMock, capsys):
+    """Test that API errors are reported on stderr with a non-zero exit status."""
+    monkeypatch.setenv("LOTR_API_KEY", "test-api-key")
+    httpx_mock.add_response(status_code=401, json={"message": "Unauthorized"})
+
+    with pytest.raises(SystemExit) as exit_info:
+        main(["quotes", "--quiet"])
+
+    assert exit_info.value.code == 1
+    assert capsys.readouterr().err.startswith("lotr: error: ")
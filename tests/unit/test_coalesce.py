@@ -0,0 +1,146 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import anyio
+import pytest
+from fakes import ScriptedClient, ok
+
+from lotr_sdk.core.coalesce import Coalescer
+from lotr_sdk.core.concurrency import gather
+from lotr_sdk.core.errors import DeadlineExceededError
+from lotr_sdk.core.scheduler import priority
+from lotr_sdk.core.settings import Settings
+from lotr_sdk.core.timeouts import deadline
+
+
+@pytest.fixture
+def settings():
+    return Settings(api_key="test-api-key", max_retries=2, retry_delay=0)
+
+
+def test_base_client_coalesces_concurrent_gets(settings):
+    """Test that identical GETs in flight at the same time are sent once."""
+    sending = threading.Event()
+    release = threading.Event()
+
+    class SlowClient(ScriptedClient):
+        def _send(self, method, url, params, body, headers, timeouts):
+            sending.set()
+            release.wait(1)
+            return super()._send(method, url, params, body, headers, timeouts)
+
+    client = SlowClient(settings, [ok({"docs": [1]}), ok({"docs": [2]})])
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        first = pool.submit(client.request, "GET", "/v2/movie", {"limit": 10, "page": 1})
+        sending.wait(1)
+        second = pool.submit(client.request, "GET", "/v2/movie", {"page": "1", "limit": "10"})
+        time.sleep(0.05)
+        release.set()
+
+    assert first.result() is second.result()
+    assert client.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_base_client_coalesces_concurrent_gets_async(settings):
+    """Test that identical async GETs share a response, while other requests do not."""
+    client = ScriptedClient(settings, [ok()] * 3)
+
+    responses = await gather(
+        [
+            client.request_async("GET", "/v2/quote", {"limit": 10}),
+            client.request_async("GET", "/v2/quote", {"limit": 10}),
+            client.request_async("GET", "/v2/quote", {"limit": 20}),
+        ]
+    )
+
+    assert responses[0] is responses[1]
+    assert client.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_coalescer_retries_after_cancelled_leader():
+    """Test that waiters run the call themselves when the running call is cancelled."""
+    coalescer = Coalescer()
+    calls = []
+
+    async def call():
+        calls.append(True)
+        if len(calls) == 1:
+            await anyio.sleep_forever()
+        return len(calls)
+
+    results = []
+
+    async def leader(task_status=anyio.TASK_STATUS_IGNORED):
+        with anyio.CancelScope() as scope:
+            task_status.started(scope)
+            await coalescer.run_async("key", call)
+
+    async def waiter():
+        results.append(await coalescer.run_async("key", call))
+
+    with anyio.fail_after(1):
+        async with anyio.create_task_group() as group:
+            scope = await group.start(leader)
+            group.start_soon(waiter)
+            # Both tasks are blocked once the leader is in the call and the waiter waits on it
+            await anyio.wait_all_tasks_blocked()
+            scope.cancel()
+
+    assert results == [2]
+
+
+def test_coalescer_retries_after_leader_deadline():
+    """Test that waiters run the call themselves when the running call exceeds its own deadline."""
+    coalescer = Coalescer()
+    started = threading.Event()
+
+    def leader_call():
+        started.set()
+        time.sleep(0.05)
+        raise DeadlineExceededError()
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(coalescer.run, "key", leader_call)
+        started.wait(1)
+        waiter = pool.submit(coalescer.run, "key", lambda: "waiter")
+
+        with pytest.raises(DeadlineExceededError):
+            leader.result()
+        assert waiter.result() == "waiter"
+
+
+@pytest.mark.asyncio
+async def test_coalescer_waiter_keeps_its_own_deadline():
+    """Test that a waiter gives up at its own deadline rather than waiting for the running call."""
+    coalescer = Coalescer()
+
+    async def call():
+        await anyio.sleep(0.2)
+        return "leader"
+
+    async def waiter():
+        with deadline(0.02), pytest.raises(DeadlineExceededError):
+            await coalescer.run_async("key", call)
+
+    async with anyio.create_task_group() as group:
+        group.start_soon(coalescer.run_async, "key", call)
+        await anyio.wait_all_tasks_blocked()
+        with anyio.fail_after(0.1):
+            await waiter()
+
+
+@pytest.mark.asyncio
+async def test_base_client_does_not_coalesce_across_priorities(settings):
+    """Test that identical GETs made at different priorities are each sent."""
+    client = ScriptedClient(settings, [ok()] * 2)
+
+    async def fetch(name):
+        with priority(name):
+            return await client.request_async("GET", "/v2/quote", {"limit": 10})
+
+    await gather([fetch("interactive"), fetch("batch")])
+
+    assert client.calls == 2
@@ -0,0 +1,59 @@
+import sys
+
+import pytest
+from fakes import ScriptedClient, ok
+
+from lotr_sdk.core.codec import get_codec
+from lotr_sdk.core.settings import Settings
+
+DOC = {"docs": [{"_id": "5cd95395de30eff6ebccde5c", "name": "Ringwraith ☠", "score": 1.5, "tags": None}]}
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_codec_round_trip(name):
+    """Test that every codec encodes to bytes and decodes back to the same data."""
+    pytest.importorskip(name)
+    codec = get_codec(name)
+
+    encoded = codec.dumps(DOC)
+
+    assert isinstance(encoded, bytes)
+    assert codec.loads(encoded) == DOC
+    assert codec.loads(encoded.decode()) == DOC
+
+
+@pytest.mark.parametrize("name", ["json", "orjson", "msgspec"])
+def test_codec_rejects_invalid_json(name):
+    """Test that every codec raises ValueError on invalid input."""
+    pytest.importorskip(name)
+
+    with pytest.raises(ValueError):
+        get_codec(name).loads(b"{not json")
+
+
+def test_auto_codec_falls_back_to_json(monkeypatch):
+    """Test that auto picks the standard library when no fast codec is installed."""
+    monkeypatch.setitem(sys.modules, "orjson", None)
+    monkeypatch.setitem(sys.modules, "msgspec", None)
+    get_codec.cache_clear()
+    try:
+        assert get_codec("auto").name == "json"
+    finally:
+        get_codec.cache_clear()
+
+
+def test_unknown_codec():
+    """Test that an unknown codec name is rejected by the settings."""
+    with pytest.raises(ValueError):
+        Settings(api_key="test-api-key", json_codec="simdjson")
+
+
+def test_base_client_encodes_request_body():
+    """Test that request data is encoded with the configured codec."""
+    client = ScriptedClient(Settings(api_key="test-api-key", json_codec="json"), [ok()])
+
+    client.request("POST", "/v2/movie", data={"name": "Éowyn"})
+
+    body, headers = client.sent
+    assert body == '{"name":"Éowyn"}'.encode()
+    assert headers["Content-Type"] == "application/json"
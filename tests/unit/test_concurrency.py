@@ -0,0 +1,89 @@
+import anyio
+import pytest
+
+from lotr_sdk.core.concurrency import gather, run_workers
+from lotr_sdk.core.errors import ResourceNotFoundError
+
+# The helpers must behave the same under both event loops. The tests drive the
+# loop with anyio.run, since pytest-asyncio's auto mode would run every async
+# test under asyncio.
+BACKENDS = ["asyncio", "trio"]
+
+
+async def delayed(value, delay):
+    await anyio.sleep(delay)
+    return value
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_gather_preserves_order(backend):
+    """Test that results come back in input order regardless of completion order."""
+
+    async def main():
+        return await gather(delayed(value, 0.01 * (3 - value)) for value in range(3))
+
+    assert anyio.run(main, backend=backend) == [0, 1, 2]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_gather_respects_limit(backend):
+    """Test that no more than ``limit`` awaitables run at once."""
+    running = peak = 0
+
+    async def track():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await anyio.sleep(0.01)
+        running -= 1
+
+    async def main():
+        await gather((track() for _ in range(6)), limit=2)
+
+    anyio.run(main, backend=backend)
+
+    assert peak == 2
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_gather_raises_first_error_unwrapped(backend):
+    """Test that a failure is raised as is and cancels the other awaitables."""
+    finished = []
+
+    async def slow():
+        await anyio.sleep(1)
+        finished.append(True)
+
+    async def fail():
+        raise ResourceNotFoundError("Quote not found")
+
+    async def main():
+        await gather([slow(), fail()])
+
+    with pytest.raises(ResourceNotFoundError):
+        anyio.run(main, backend=backend)
+    assert finished == []
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_run_workers(backend):
+    """Test that every worker copy runs to completion."""
+    calls = []
+
+    async def worker():
+        calls.append(True)
+
+    anyio.run(run_workers, worker, 3, backend=backend)
+
+    assert len(calls) == 3
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_helpers_run_on_the_requested_loop(backend):
+    """Test that each parametrized test really runs on its event loop."""
+    sniffio = pytest.importorskip("sniffio")
+
+    async def current():
+        return sniffio.current_async_library()
+
+    assert anyio.run(gather, [current()], backend=backend) == [backend]
@@ -0,0 +1,44 @@
+import threading
+
+import pytest
+
+from lotr_sdk.core.executor import ParallelExecutor
+
+
+def test_executor_runs_inline_with_single_worker():
+    """Test that a single-worker executor calls the function on the current thread."""
+    executor = ParallelExecutor()
+    threads = executor.map(lambda _: threading.current_thread(), range(3))
+
+    assert threads == [threading.current_thread()] * 3
+
+
+def test_executor_preserves_order():
+    """Test that results come back in input order when running in parallel."""
+    executor = ParallelExecutor(max_workers=4)
+    try:
+        assert executor.map(lambda value: value * 2, range(10)) == [value * 2 for value in range(10)]
+    finally:
+        executor.shutdown()
+
+
+def test_executor_propagates_errors():
+    """Test that an error raised by a worker reaches the caller."""
+    executor = ParallelExecutor(max_workers=2)
+
+    def fail(value):
+        if value == 1:
+            raise RuntimeError("boom")
+        return value
+
+    try:
+        with pytest.raises(RuntimeError):
+            executor.map(fail, range(3))
+    finally:
+        executor.shutdown()
+
+
+def test_executor_rejects_invalid_worker_count():
+    """Test that max_workers must be positive."""
+    with pytest.raises(ValueError):
+        ParallelExecutor(max_workers=0)
@@ -0,0 +1,138 @@
+import csv
+import json
+import time
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from lotr_sdk import LotrAPI
+from lotr_sdk.export import RateBudget, Shard, export_shard, plan_shards
+
+
+def quote_page(page, pages):
+    """Build a raw quote page with two quotes."""
+    return {
+        "docs": [
+            {
+                "_id": f"5cd96e05de30eff6ebcce7{page}{index}",
+                "dialog": f"Quote {page}-{index}",
+                "movie": "5cd95395de30eff6ebccde5d",
+                "character": "5cd99d4bde30eff6ebccfe9e",
+            }
+            for index in range(2)
+        ],
+        "total": pages * 2,
+        "limit": 2,
+        "offset": (page - 1) * 2,
+        "page": page,
+        "pages": pages,
+    }
+
+
+def test_plan_shards_by_page(mock_settings, mock_http_client):
+    """Test that page partitioning splits the page range into contiguous shards."""
+    mock_http_client.configure_response(quote_page(1, pages=5))
+    api = LotrAPI(settings=mock_settings, http_client=mock_http_client)
+
+    shards = plan_shards(api, partition_by="page", limit=2, shards=2)
+
+    assert [(shard.first_page, shard.last_page) for shard in shards] == [(1, 3), (4, 5)]
+    # The page fetched to plan the shards is handed to the first one
+    assert [row["dialog"] for row in shards[0].first_rows] == ["Quote 1-0", "Quote 1-1"]
+    assert shards[1].first_rows is None
+    assert mock_http_client.request.call_count == 1
+
+
+def test_plan_shards_draws_from_budget(mock_settings, mock_http_client):
+    """Test that the planning request is charged to the request budget."""
+    mock_http_client.configure_response(quote_page(1, pages=1))
+    api = LotrAPI(settings=mock_settings, http_client=mock_http_client)
+    budget = RateBudget(requests_per_second=1)
+
+    plan_shards(api, partition_by="page", limit=2, budget=budget)
+
+    assert budget._next_slot.value > 0
+
+
+def test_plan_shards_by_movie(mock_settings, mock_http_client):
+    """Test that movie partitioning creates one shard per movie."""
+    mock_http_client.configure_response(
+        {
+            "docs": [
+                {
+                    "_id": "5cd95395de30eff6ebccde5c",
+                    "name": "The Fellowship of the Ring",
+                    "runtimeInMinutes": 178,
+                    "budgetInMillions": 93,
+                    "boxOfficeRevenueInMillions": 871.5,
+                    "academyAwardNominations": 13,
+                    "academyAwardWins": 4,
+                    "rottenTomatoesScore": 91,
+                }
+            ],
+            "total": 1,
+            "limit": 1000,
+        }
+    )
+    api = LotrAPI(settings=mock_settings, http_client=mock_http_client)
+
+    shards = plan_shards(api, partition_by="movie")
+
+    assert shards == [Shard(name="movie-5cd95395de30eff6ebccde5c", movie_id="5cd95395de30eff6ebccde5c")]
+
+
+@pytest.mark.parametrize("format", ["ndjson", "csv"])
+def test_export_shard_streams_pages(mock_settings, httpx_mock: HTTPXMock, tmp_path, format):
+    """Test that a shard is written page by page until its last page."""
+    for page in (2, 3):
+        httpx_mock.add_response(
+            method="GET",
+            url=f"https://the-one-api.dev/v2/quote?page={page}&limit=2",
+            json=quote_page(page, pages=3),
+        )
+
+    result = export_shard(
+        mock_settings, Shard(name="pages-2-3", first_page=2, last_page=3), tmp_path, format=format, limit=2
+    )
+
+    assert result.records == 4
+    assert result.pages == 2
+    with result.path.open() as f:
+        rows = [json.loads(line) for line in f] if format == "ndjson" else list(csv.DictReader(f))
+    assert [row["dialog"] for row in rows] == ["Quote 2-0", "Quote 2-1", "Quote 3-0", "Quote 3-1"]
+
+
+def test_export_shard_reuses_planned_first_page(mock_settings, httpx_mock: HTTPXMock, tmp_path):
+    """Test that a shard holding its first page's rows only requests the pages after it."""
+    httpx_mock.add_response(url="https://the-one-api.dev/v2/quote?page=2&limit=2", json=quote_page(2, pages=2))
+    first_rows = tuple({"dialog": f"Quote 1-{index}"} for index in range(2))
+
+    result = export_shard(mock_settings, Shard(name="pages-1-2", last_page=2, first_rows=first_rows), tmp_path, limit=2)
+
+    assert result.records == 4
+    assert result.pages == 2
+
+
+def test_export_shard_without_page_count_reads_until_short_page(mock_settings, httpx_mock: HTTPXMock, tmp_path):
+    """Test that a shard keeps paging until a short page when responses carry no page count."""
+    for page, size in ((1, 2), (2, 2), (3, 1)):
+        data = quote_page(page, pages=3)
+        del data["pages"]
+        data["docs"] = data["docs"][:size]
+        httpx_mock.add_response(url=f"https://the-one-api.dev/v2/quote?page={page}&limit=2", json=data)
+
+    result = export_shard(mock_settings, Shard(name="all"), tmp_path, limit=2)
+
+    assert result.records == 5
+    assert result.pages == 3
+
+
+def test_rate_budget_spaces_requests():
+    """Test that the budget spaces consecutive requests by its interval."""
+    budget = RateBudget(requests_per_second=50)
+
+    start = time.monotonic()
+    for _ in range(5):
+        budget.acquire()
+
+    assert time.monotonic() - start >= 4 * budget.interval * 0.9
@@ -1,4 +1,8 @@
+import pytest
+
 from lotr_sdk.schemas.base import FieldFilter
+from lotr_sdk.schemas.movie import MovieFilters
+from lotr_sdk.schemas.quote import Quote, QuoteFilters
 
 
 def test_field_filter_initialization():
@@ -82,3 +86,103 @@ def test_field_filter_to_dict():
 
     filter_lte = FieldFilter(lte=10)
     assert filter_lte.to_dict("field") == {"field<=": 10}
+
+
+def test_field_filter_predicate():
+    """Test that compiled predicates apply every condition of the filter."""
+    assert FieldFilter(match="value").matches("value")
+    assert not FieldFilter(not_match="value").matches("value")
+    assert FieldFilter(include=[1, 2]).matches(2)
+    assert not FieldFilter(exclude=[1, 2]).matches(2)
+    assert FieldFilter(regex="/^dea/i").matches("Deagol!")
+    assert FieldFilter(gt=10, lte=20).matches(20)
+    assert not FieldFilter(gt=10, lte=20).matches(10)
+    assert not FieldFilter(exists=True).matches(None)
+
+
+@pytest.mark.parametrize(
+    "conditions",
+    [
+        {"match": "a", "include": ["b"]},
+        {"match": "a", "regex": "/b/"},
+        {"include": ["a"], "exists": True},
+        {"not_match": "a", "exclude": ["b"]},
+    ],
+)
+def test_field_filter_rejects_conflicting_conditions(conditions):
+    """Test that conditions sent as the same query parameter are rejected rather than overwritten."""
+    with pytest.raises(ValueError, match="Conflicting filter conditions"):
+        FieldFilter(**conditions)
+
+
+def test_field_filter_allows_conditions_on_distinct_parameters():
+    """Test that conditions sent as distinct parameters can be combined and agree locally."""
+    field_filter = FieldFilter(match="a", exclude=["b"], exists=None)
+
+    assert field_filter.to_dict("name") == {"name": "a", "name!": "b"}
+    assert field_filter.matches("a")
+    assert FieldFilter(regex="x", exists=False).to_dict("name") == {"name": "x", "!name": ""}
+
+
+def test_field_filter_predicate_is_cached():
+    """Test that predicates are compiled once and rebuilt after the filter changes."""
+    field_filter = FieldFilter(gt=10)
+    predicate = field_filter.predicate()
+
+    assert field_filter.predicate() is predicate
+
+    field_filter.gt = 100
+    assert field_filter.predicate() is not predicate
+    assert not field_filter.matches(50)
+
+
+def test_filters_apply_to_resources():
+    """Test that MovieFilters and QuoteFilters filter already fetched resources."""
+    quotes = [
+        Quote(id=f"5cd96e05de30eff6ebcce7e{index}", dialog=dialog, movie=movie, character="c")
+        for index, (dialog, movie) in enumerate([("Deagol!", "m1"), ("My precious", "m1"), ("Deagol?", "m2")])
+    ]
+    filters = QuoteFilters(dialog=FieldFilter(regex="^Deagol"), movie=FieldFilter(include=["m1"]))
+
+    assert filters.apply(quotes) == quotes[:1]
+    assert filters.predicate() is filters.predicate()
+
+
+def test_field_filter_mask():
+    """Test that filters compile into NumPy masks."""
+    np = pytest.importorskip("numpy")
+    scores = np.array([91.0, 96.0, 95.0])
+    names = np.array(["The Fellowship", "The Two Towers", "The Return"], dtype=object)
+
+    assert FieldFilter(gte=95).mask(scores).tolist() == [False, True, True]
+    assert FieldFilter(regex="Two").mask(names).tolist() == [False, True, False]
+
+    filters = MovieFilters(rotten_tomatoes_score=FieldFilter(exclude=[96.0]))
+    assert filters.mask({"rotten_tomatoes_score": scores}, 3).tolist() == [True, False, True]
+
+
+def test_field_filter_canonical_key():
+    """Test that equivalent filters are equal, hash alike and send the same parameters."""
+    assert FieldFilter(include=[1, 2]) == FieldFilter(include=[2, 1, 2])
+    assert FieldFilter(include=[2, 1]).to_dict("movie") == {"movie": "1,2"}
+    assert FieldFilter(match="x") == FieldFilter(include=["x"])
+    assert FieldFilter(gt=1) != FieldFilter(gte=1)
+    assert len({FieldFilter(exclude=["a", "b"]), FieldFilter(exclude=["b", "a"])}) == 1
+
+
+def test_field_filter_equality_is_typed():
+    """Test that filters sending the same strings with different typed values are not equal."""
+    assert FieldFilter(gt=5) != FieldFilter(gt="5")
+    assert FieldFilter(include=[1]) != FieldFilter(include=["1"])
+    assert FieldFilter(exists=True) != FieldFilter(match="")
+    assert FieldFilter(regex="x") != FieldFilter(match="x")
+    assert QuoteFilters(movie=FieldFilter(gt=5)) != QuoteFilters(movie=FieldFilter(gt="5"))
+
+
+def test_filters_as_dict_keys():
+    """Test that filter objects describing the same query are interchangeable dict keys."""
+    cache = {QuoteFilters(movie=FieldFilter(include=["m1", "m2"]), dialog=FieldFilter(regex="/ring/i")): "hit"}
+
+    assert cache[QuoteFilters(dialog=FieldFilter(regex="/ring/i"), movie=FieldFilter(include=["m2", "m1"]))] == "hit"
+    assert QuoteFilters() != MovieFilters()
+    assert QuoteFilters(movie=FieldFilter(match="m1")).query_key() == (("movie", "m1"),)
@@ -0,0 +1,110 @@
+import anyio
+import pytest
+from fakes import DelayedClient, ScriptedClient, ok
+
+from lotr_sdk.core.errors import APIError
+from lotr_sdk.core.settings import Settings
+
+
+@pytest.fixture
+def settings():
+    return Settings(api_key="test-api-key", max_retries=2, retry_delay=0)
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_first_answer_wins(settings):
+    """Test that a slow GET is hedged after the endpoint's usual latency and the faster answer wins."""
+    settings = settings.model_copy(update={"hedge_requests": True, "hedge_max_rate": 1.0})
+    client = DelayedClient(settings, [1.0, 0.0])
+    for _ in range(client.latency.min_samples):
+        client.latency.record("/v2/movie/5cd95395de30eff6ebccde5c", 0.01)
+
+    with anyio.fail_after(0.5):
+        response = await client.request_async("GET", "/v2/movie/5cd95395de30eff6ebccde5d")
+
+    assert response.data == {"attempt": 1}
+    assert client.calls == 2
+    assert client.keys.states["test-api-key"].in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_hedge_does_not_cancel_primary(settings):
+    """Test that a hedge failing first leaves the primary request to answer."""
+    settings = settings.model_copy(update={"hedge_requests": True, "hedge_max_rate": 1.0, "max_retries": 0})
+    client = DelayedClient(settings, [0.1, 0.0], errors=[1])
+    for _ in range(client.latency.min_samples):
+        client.latency.record("/v2/movie", 0.01)
+
+    with anyio.fail_after(0.5):
+        response = await client.request_async("GET", "/v2/movie")
+
+    assert response.data == {"attempt": 0}
+    assert client.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_hedged_request_fails_once_both_attempts_fail(settings):
+    """Test that a hedged request raises only after the primary and the hedge have both failed."""
+    settings = settings.model_copy(update={"hedge_requests": True, "hedge_max_rate": 1.0, "max_retries": 0})
+    client = DelayedClient(settings, [0.1, 0.0], errors=[0, 1])
+    for _ in range(client.latency.min_samples):
+        client.latency.record("/v2/movie", 0.01)
+
+    with pytest.raises(APIError):
+        await client.request_async("GET", "/v2/movie")
+
+    assert client.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_primary_failure_does_not_wait_for_hedge_delay(settings):
+    """Test that a primary failing before the hedge is sent fails at once, without sending the hedge."""
+    settings = settings.model_copy(update={"hedge_requests": True, "hedge_max_rate": 1.0, "max_retries": 0})
+    client = DelayedClient(settings, [0.0, 0.0], errors=[0])
+    for _ in range(client.latency.min_samples):
+        client.latency.record("/v2/movie", 5.0)
+
+    with anyio.fail_after(0.5), pytest.raises(APIError):
+        await client.request_async("GET", "/v2/movie")
+
+    assert client.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_thread_transports_are_not_hedged(settings):
+    """Test that transports sending asynchronous requests from worker threads are never hedged."""
+    settings = settings.model_copy(update={"hedge_requests": True, "hedge_max_rate": 1.0})
+    client = ScriptedClient(settings, [ok()])
+    for _ in range(client.latency.min_samples):
+        client.latency.record("/v2/movie", 0.001)
+
+    await client.request_async("GET", "/v2/movie")
+
+    assert client.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_hedging_respects_rate_cap(settings):
+    """Test that no more requests are hedged than the configured rate allows."""
+    settings = settings.model_copy(update={"hedge_requests": True, "hedge_max_rate": 0.5})
+    client = DelayedClient(settings, [0.05] * 10)
+    # Enough fast samples that the slow answers below do not move the p95
+    for _ in range(5 * client.latency.min_samples):
+        client.latency.record("/v2/movie", 0.001)
+
+    for page in range(4):
+        await client.request_async("GET", "/v2/movie", {"page": page})
+
+    assert client.calls == 6
+
+
+@pytest.mark.asyncio
+async def test_hedging_is_off_by_default(settings):
+    """Test that requests are not hedged unless enabled."""
+    client = DelayedClient(settings, [0.02])
+    for _ in range(client.latency.min_samples):
+        client.latency.record("/v2/movie", 0.001)
+
+    await client.request_async("GET", "/v2/movie")
+
+    assert client.calls == 1
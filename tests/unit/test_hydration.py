@@ -0,0 +1,92 @@
+import pytest
+
+from lotr_sdk.hydration import QuoteHydrator
+from lotr_sdk.schemas.quote import Quote
+from lotr_sdk.services.movie import MovieService
+
+MOVIE_IDS = ["5cd95395de30eff6ebccde5c", "5cd95395de30eff6ebccde5d"]
+
+
+def movie_doc(movie_id):
+    """Build a raw movie doc."""
+    return {
+        "_id": movie_id,
+        "name": f"Movie {movie_id[-1]}",
+        "runtimeInMinutes": 178,
+        "budgetInMillions": 93,
+        "boxOfficeRevenueInMillions": 871.5,
+        "academyAwardNominations": 13,
+        "academyAwardWins": 4,
+        "rottenTomatoesScore": 91,
+    }
+
+
+MOVIE_PAGE = {"docs": [movie_doc(movie_id) for movie_id in MOVIE_IDS], "total": 2, "limit": 2}
+
+
+@pytest.fixture
+def quotes():
+    """Quotes referencing two movies."""
+    return [
+        Quote(
+            id=f"5cd96e05de30eff6ebcce7e{index}",
+            dialog=f"Quote {index}",
+            movie=MOVIE_IDS[index % 2],
+            character="5cd99d4bde30eff6ebccfe9e",
+        )
+        for index in range(6)
+    ]
+
+
+@pytest.fixture
+def hydrator(mock_http_client):
+    """Hydrator whose movie lookups answer with the requested IDs."""
+    mock_http_client.configure_response(MOVIE_PAGE)
+    return QuoteHydrator(MovieService(mock_http_client))
+
+
+def test_hydrate_batches_movie_lookups(hydrator, mock_http_client, quotes):
+    """Test that all distinct movies are fetched with a single request."""
+    hydrated = hydrator.hydrate(quotes)
+
+    mock_http_client.request.assert_called_once_with(
+        method="GET",
+        url="/v2/movie",
+        params={"_id": ",".join(MOVIE_IDS), "limit": "2"},
+    )
+    assert [item.movie.id for item in hydrated] == [quote.movie for quote in quotes]
+    assert hydrated[0].dialog == "Quote 0"
+
+
+def test_hydrate_reuses_cached_movies(hydrator, mock_http_client, quotes):
+    """Test that a second render does not refetch known movies."""
+    hydrator.hydrate(quotes)
+    hydrator.hydrate(quotes)
+
+    assert mock_http_client.request.call_count == 1
+
+
+def test_hydrate_with_character_resolver(mock_http_client, quotes):
+    """Test that characters are resolved through the given resolver in one call."""
+    calls = []
+
+    def resolve(character_ids):
+        calls.append(list(character_ids))
+        return {character_id: {"name": "Gollum"} for character_id in character_ids}
+
+    hydrator = QuoteHydrator(MovieService(mock_http_client), characters=resolve)
+    mock_http_client.configure_response(MOVIE_PAGE)
+
+    hydrated = hydrator.hydrate(quotes)
+
+    assert calls == [["5cd99d4bde30eff6ebccfe9e"]]
+    assert hydrated[0].character == {"name": "Gollum"}
+
+
+@pytest.mark.asyncio
+async def test_hydrate_async(hydrator, mock_http_client, quotes):
+    """Test asynchronous hydration."""
+    hydrated = await hydrator.hydrate_async(quotes)
+
+    assert mock_http_client.request_async.call_count == 1
+    assert hydrated[1].movie.id == MOVIE_IDS[1]
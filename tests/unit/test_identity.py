@@ -0,0 +1,113 @@
+import gc
+
+import pytest
+from pydantic import BaseModel, ConfigDict
+
+from lotr_sdk import LotrAPI, Settings
+from lotr_sdk.core.identity import IdentityMap
+from lotr_sdk.schemas.movie import Movie
+from lotr_sdk.services.movie import MovieService
+
+
+def movie_doc(movie_id="5cd95395de30eff6ebccde5c", score=91):
+    return {
+        "_id": movie_id,
+        "name": "The Fellowship of the Ring",
+        "runtimeInMinutes": 178,
+        "budgetInMillions": 93,
+        "boxOfficeRevenueInMillions": 871.5,
+        "academyAwardNominations": 13,
+        "academyAwardWins": 4,
+        "rottenTomatoesScore": score,
+    }
+
+
+def test_weak_identity_map_shares_live_instances():
+    """Test that equal records resolve to one instance while it is referenced."""
+    identity_map = IdentityMap()
+
+    first = identity_map.resolve(Movie, movie_doc())
+    assert identity_map.resolve(Movie, dict(movie_doc())) is first
+    assert (identity_map.hits, identity_map.misses) == (1, 1)
+
+    del first
+    gc.collect()
+    assert len(identity_map) == 0
+
+
+def test_changed_record_builds_new_instance():
+    """Test that a record whose fields changed is not served from the map."""
+    identity_map = IdentityMap()
+    old = identity_map.resolve(Movie, movie_doc(score=91))
+
+    new = identity_map.resolve(Movie, movie_doc(score=92))
+
+    assert new is not old
+    assert new.rotten_tomatoes_score == 92
+
+
+class Tagged(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    id: str
+    tags: list[str]
+    extra: dict[str, list[int]] | list[list[str | int]]
+
+
+@pytest.mark.parametrize("maxsize", [None, 10])
+def test_records_with_equal_hashes_build_separate_instances(maxsize):
+    """Test that records are told apart by their content, not only by its hash."""
+    identity_map = IdentityMap(maxsize)
+    # hash(-1) == hash(-2) in CPython, so both records hash alike
+    old = identity_map.resolve(Movie, movie_doc(score=-1))
+
+    new = identity_map.resolve(Movie, movie_doc(score=-2))
+
+    assert new is not old
+    assert new.rotten_tomatoes_score == -2
+
+
+@pytest.mark.parametrize("maxsize", [None, 10])
+def test_records_with_nested_values(maxsize):
+    """Test that records holding arrays and objects are shared by content."""
+    identity_map = IdentityMap(maxsize)
+    first = identity_map.resolve(Tagged, {"id": "a", "tags": ["x"], "extra": {"b": [1], "c": [2]}})
+
+    assert identity_map.resolve(Tagged, {"id": "a", "tags": ["x"], "extra": {"c": [2], "b": [1]}}) is first
+    assert identity_map.resolve(Tagged, {"id": "a", "tags": ["y"], "extra": {"b": [1], "c": [2]}}) is not first
+    pairs = identity_map.resolve(Tagged, {"id": "a", "tags": ["x"], "extra": [["b", 1], ["c", 2]]})
+    assert pairs is not first
+
+
+def test_lru_identity_map_evicts_least_recently_used():
+    """Test that a bounded map keeps the most recently used resources alive."""
+    identity_map = IdentityMap(maxsize=2)
+    first = identity_map.resolve(Movie, movie_doc("a" * 24))
+    identity_map.resolve(Movie, movie_doc("b" * 24))
+    identity_map.resolve(Movie, movie_doc("a" * 24))
+    identity_map.resolve(Movie, movie_doc("c" * 24))
+
+    assert len(identity_map) == 2
+    assert identity_map.resolve(Movie, movie_doc("a" * 24)) is first
+    assert identity_map.misses == 3
+
+    with pytest.raises(ValueError):
+        IdentityMap(maxsize=0)
+
+
+def test_service_shares_instances_between_get_and_list(mock_http_client):
+    """Test that get and list return the same object for the same movie."""
+    service = MovieService(mock_http_client, identity_map=IdentityMap())
+    mock_http_client.configure_response({"docs": [movie_doc()], "total": 1, "limit": 1000, "page": 1, "pages": 1})
+
+    movie = service.get("5cd95395de30eff6ebccde5c")
+
+    assert service.list().docs[0] is movie
+
+
+def test_identity_map_from_settings():
+    """Test that the identity map is off unless configured."""
+    assert LotrAPI(settings=Settings(api_key="k")).identity_map is None
+    api = LotrAPI(settings=Settings(api_key="k", identity_map="lru", identity_map_size=5))
+    assert api.identity_map.maxsize == 5
+    assert api.movies.identity_map is api.quotes.identity_map is api.identity_map
@@ -0,0 +1,100 @@
+import pytest
+from fakes import ScriptedClient, ok
+
+from lotr_sdk.client.base import TransportResponse
+from lotr_sdk.core.keys import KeyPool
+from lotr_sdk.core.settings import Settings
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_least_used_prefers_idle_keys_with_quota():
+    """Test that least_used picks keys with fewer requests in flight and more quota left."""
+    pool = KeyPool(["a", "b"])
+    pool.release(pool.acquire(), 200, {"x-ratelimit-remaining": "5"})
+    pool.release(pool.acquire(), 200, {"x-ratelimit-remaining": "50"})
+
+    first = pool.acquire()
+    second = pool.acquire()
+
+    assert (first, second) == ("b", "a")
+
+
+def test_weighted_follows_remaining_quota():
+    """Test that weighted round-robin hands out keys in proportion to their remaining quota."""
+    pool = KeyPool(["a", "b"], strategy="weighted")
+    pool.states["a"].remaining = 30
+    pool.states["b"].remaining = 10
+
+    picks = []
+    for _ in range(4):
+        key = pool.acquire()
+        picks.append(key)
+        pool.release(key)
+
+    assert picks.count("a") == 3
+
+
+def test_rate_limited_key_is_benched_until_reset():
+    """Test that a 429 benches the key until its reset and then restores it."""
+    clock = FakeClock()
+    pool = KeyPool(["a", "b"], clock=clock)
+
+    pool.release(pool.acquire(), 429, {"retry-after": "30"})
+
+    assert pool.available() == 1
+    assert pool.acquire() == "b"
+    pool.release("b", 200, {"x-ratelimit-remaining": "0", "x-ratelimit-reset": "10"})
+    assert pool.acquire() is None
+    assert pool.next_available() == 10
+    clock.now += 30
+    assert pool.available() == 2
+
+
+def test_benched_key_is_selected_again_after_reset():
+    """Test that a key whose bench expired gets its quota back and is chosen again."""
+    clock = FakeClock()
+    pool = KeyPool(["a", "b"], strategy="weighted", clock=clock)
+
+    pool.release(pool.acquire(), 429, {"x-ratelimit-limit": "100", "retry-after": "30"})
+    pool.states["b"].remaining = 50
+    assert pool.states["a"].remaining == 0
+    clock.now += 30
+
+    picks = []
+    for _ in range(4):
+        key = pool.acquire()
+        picks.append(key)
+        pool.release(key)
+
+    assert pool.states["a"].remaining == 100
+    assert picks.count("a") == 3
+
+
+def test_pool_requires_keys():
+    """Test that an empty pool is rejected."""
+    with pytest.raises(ValueError):
+        KeyPool([])
+
+
+def test_base_client_spreads_requests_over_keys():
+    """Test that requests rotate over the key pool and a 429 switches keys immediately."""
+    settings = Settings(api_key="test-api-key", api_keys=["second-key"], max_retries=1, retry_delay=0)
+    limited = TransportResponse(429, {"retry-after": "30"}, b"{}")
+    client = ScriptedClient(settings, [ok(), limited, ok()])
+    keys = []
+    send = client._send
+    client._send = lambda *args: keys.append(args[4]["Authorization"]) or send(*args)
+
+    client.request("GET", "/v2/movie", {"page": 1})
+    client.request("GET", "/v2/movie", {"page": 2})
+
+    assert keys == ["Bearer test-api-key", "Bearer second-key", "Bearer test-api-key"]
+    assert client.keys.states["second-key"].rate_limited == 1
+    assert client.keys.available() == 1
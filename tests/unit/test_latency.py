@@ -0,0 +1,25 @@
+import pytest
+
+from lotr_sdk.core.latency import LatencyTracker, endpoint_key
+
+
+def test_endpoint_key_groups_resource_ids():
+    """Test that URLs of the same endpoint share a key."""
+    assert endpoint_key("/v2/movie/5cd95395de30eff6ebccde5c") == "/v2/movie/{id}"
+    assert endpoint_key("/v2/movie/5cd95395de30eff6ebccde5c/quote?limit=5") == "/v2/movie/{id}/quote"
+    assert endpoint_key("/v2/movie") == "/v2/movie"
+
+
+def test_tracker_percentiles():
+    """Test percentiles over the sliding window once enough samples exist."""
+    tracker = LatencyTracker(window=100, min_samples=10)
+    for index in range(5):
+        tracker.record("/v2/movie", index)
+    assert tracker.percentile("/v2/movie", 95) is None
+
+    for index in range(1, 101):
+        tracker.record("/v2/movie", index / 100)
+
+    assert tracker.percentile("/v2/movie", 50) == pytest.approx(0.5, abs=0.01)
+    assert tracker.percentile("/v2/movie", 99) == pytest.approx(0.99, abs=0.01)
+    assert tracker.percentile("/v2/quote", 50) is None
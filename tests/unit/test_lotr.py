@@ -1,3 +1,7 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
 from lotr_sdk import LotrAPI
 from lotr_sdk.services.movie import MovieService
 from lotr_sdk.services.quote import QuoteService
@@ -20,3 +24,68 @@ def test_lotr_api_initialization(mock_settings, mock_http_client):
     # Test that services use the same HTTP client
     assert api.movies.http_client == mock_http_client
     assert api.quotes.http_client == mock_http_client
+
+
+def test_warmup_reports_phases(mock_settings, mock_http_client):
+    """Test that warmup opens connections, prefetches hot data and times each phase."""
+    mock_http_client.warmup = MagicMock()
+    mock_http_client.configure_response({"docs": [], "total": 0, "limit": 1000, "page": 1, "pages": 1})
+    api = LotrAPI(settings=mock_settings, http_client=mock_http_client)
+
+    report = api.warmup(connections=3, prefetch=True, quote_pages=2)
+
+    mock_http_client.warmup.assert_called_once_with(3)
+    assert list(report.phases) == ["connect", "movies", "quotes"]
+    assert report.total == sum(report.phases.values())
+    assert [call.kwargs["url"] for call in mock_http_client.request.call_args_list] == [
+        "/v2/movie",
+        "/v2/quote",
+        "/v2/quote",
+    ]
+
+
+async def test_warmup_async_without_client_support(mock_settings, mock_http_client):
+    """Test that clients without a warm-up hook skip the connect phase."""
+    api = LotrAPI(settings=mock_settings, http_client=mock_http_client)
+
+    report = await api.warmup_async()
+
+    assert report.phases == {}
+
+
+async def test_warmup_requires_a_connection(mock_settings, mock_http_client):
+    """Test that warming up zero connections is rejected with a clear error."""
+    mock_http_client.warmup = MagicMock()
+    api = LotrAPI(settings=mock_settings, http_client=mock_http_client)
+
+    with pytest.raises(ValueError, match="connections must be at least 1"):
+        api.warmup(connections=0)
+    with pytest.raises(ValueError, match="connections must be at least 1"):
+        await api.warmup_async(connections=0)
+    mock_http_client.warmup.assert_not_called()
+
+
+def test_lotr_api_rejects_zero_workers(mock_settings, mock_http_client):
+    """Test that an explicit max_workers of 0 is rejected rather than replaced by the default."""
+    with pytest.raises(ValueError, match="max_workers must be at least 1"):
+        LotrAPI(settings=mock_settings, http_client=mock_http_client, max_workers=0)
+
+
+async def test_close_async_closes_the_async_client(mock_settings, mock_http_client):
+    """Test that leaving the async context closes the client from the event loop."""
+    mock_http_client.close_async = AsyncMock()
+
+    async with LotrAPI(settings=mock_settings, http_client=mock_http_client):
+        pass
+
+    mock_http_client.close_async.assert_awaited_once()
+
+
+async def test_close_async_closes_both_httpx_clients(mock_settings):
+    """Test that close_async closes the synchronous and the asynchronous httpx clients."""
+    api = LotrAPI(settings=mock_settings)
+
+    await api.close_async()
+
+    assert api._http_client.client.is_closed
+    assert api._http_client.async_client.is_closed
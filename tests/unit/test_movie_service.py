@@ -1,7 +1,12 @@
+import asyncio
+import threading
+import time
+
 import pytest
 
 from lotr_sdk.core.errors import ResourceNotFoundError
-from lotr_sdk.schemas.base import FieldFilter, Pagination
+from lotr_sdk.core.executor import ParallelExecutor
+from lotr_sdk.schemas.base import APIResponse, FieldFilter, Pagination
 from lotr_sdk.schemas.movie import Movie, MovieFilters, MovieList
 from lotr_sdk.schemas.quote import QuoteList
 from lotr_sdk.services.movie import MovieService
@@ -234,3 +239,106 @@ async def test_get_quotes_async(movie_service, mock_http_client, sample_quotes_d
     # Check result is correct type
     assert isinstance(result, QuoteList)
     assert len(result.docs) == 1
+
+
+def make_movie(movie_id):
+    """Build a raw movie record."""
+    return {
+        "_id": movie_id,
+        "name": f"Movie {movie_id}",
+        "runtimeInMinutes": 100,
+        "budgetInMillions": 10,
+        "boxOfficeRevenueInMillions": 20,
+        "academyAwardNominations": 0,
+        "academyAwardWins": 0,
+        "rottenTomatoesScore": 50,
+    }
+
+
+def make_movie_page(page, limit=2, pages=3):
+    """Build a page of movies."""
+    return APIResponse(
+        data={
+            "docs": [make_movie(f"{page}-{index}") for index in range(limit)],
+            "total": pages * limit,
+            "limit": limit,
+            "offset": (page - 1) * limit,
+            "page": page,
+            "pages": pages,
+        },
+        status_code=200,
+        headers={},
+    )
+
+
+def test_list_pages_movies(mock_http_client):
+    """Test that list_pages fetches the requested pages and returns them in the requested order."""
+    movie_service = MovieService(mock_http_client, ParallelExecutor(max_workers=3))
+    mock_http_client.request.side_effect = lambda **kwargs: make_movie_page(int(kwargs["params"]["page"]))
+
+    result = movie_service.list_pages([3, 1, 2], limit=2)
+
+    assert [page.page for page in result] == [3, 1, 2]
+    assert all(isinstance(page, MovieList) for page in result)
+
+
+def test_list_all_movies_in_parallel(mock_http_client):
+    """Test that list_all fetches every page through the thread pool and keeps page order."""
+    movie_service = MovieService(mock_http_client, ParallelExecutor(max_workers=4))
+    mock_http_client.request.side_effect = lambda **kwargs: make_movie_page(int(kwargs["params"]["page"]))
+
+    result = movie_service.list_all(limit=2)
+
+    assert mock_http_client.request.call_count == 3
+    assert [movie.id for movie in result] == [f"{page}-{index}" for page in (1, 2, 3) for index in (0, 1)]
+    assert result.total == 6
+
+
+def test_get_many_movies_keeps_input_order(mock_http_client):
+    """Test that get_many spreads more IDs than workers over the pool and returns them in input order."""
+    movie_service = MovieService(mock_http_client, ParallelExecutor(max_workers=3))
+    movie_ids = [str(index) for index in range(10)]
+    threads = set()
+
+    def respond(**kwargs):
+        threads.add(threading.get_ident())
+        movie_id = kwargs["url"].rsplit("/", 1)[1]
+        # Later IDs answer first
+        time.sleep((10 - int(movie_id)) / 1000)
+        return APIResponse(data={"docs": [make_movie(movie_id)]}, status_code=200, headers={})
+
+    mock_http_client.request.side_effect = respond
+
+    result = movie_service.get_many(movie_ids)
+
+    assert [movie.id for movie in result] == movie_ids
+    assert mock_http_client.request.call_count == len(movie_ids)
+    assert 1 < len(threads) <= 3
+
+
+@pytest.mark.asyncio
+async def test_list_all_movies_async(movie_service, mock_http_client):
+    """Test that list_all_async fetches the remaining pages concurrently and keeps page order."""
+    mock_http_client.request_async.side_effect = lambda **kwargs: make_movie_page(int(kwargs["params"]["page"]))
+
+    result = await movie_service.list_all_async(limit=2)
+
+    assert mock_http_client.request_async.call_count == 3
+    assert [movie.id for movie in result] == [f"{page}-{index}" for page in (1, 2, 3) for index in (0, 1)]
+
+
+@pytest.mark.asyncio
+async def test_get_many_movies_async_keeps_input_order(movie_service, mock_http_client):
+    """Test that get_many_async returns movies in input order whatever order they complete in."""
+    movie_ids = [str(index) for index in range(5)]
+
+    async def respond(**kwargs):
+        movie_id = kwargs["url"].rsplit("/", 1)[1]
+        await asyncio.sleep((5 - int(movie_id)) / 1000)
+        return APIResponse(data={"docs": [make_movie(movie_id)]}, status_code=200, headers={})
+
+    mock_http_client.request_async.side_effect = respond
+
+    result = await movie_service.get_many_async(movie_ids)
+
+    assert [movie.id for movie in result] == movie_ids
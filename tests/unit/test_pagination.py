@@ -51,3 +51,10 @@ def test_pagination_validation():
     assert pagination.page is None
     assert pagination.limit == 10
     assert pagination.offset is None
+
+
+def test_pagination_query_key():
+    """Test that pagination options with the same parameters are equal and hashable."""
+    assert Pagination(page=2, limit=10) == Pagination(limit=10, page=2)
+    assert hash(Pagination(limit=10)) == hash(Pagination(limit=10))
+    assert Pagination(limit=10).query_key() == (("limit", "10"),)
@@ -0,0 +1,50 @@
+import pytest
+
+from lotr_sdk.core.paging import PageSizeController
+
+
+def test_controller_grows_towards_latency_target():
+    """Test that fast pages grow the page size, bounded by the growth factor and maximum."""
+    controller = PageSizeController(initial=100, maximum=1000, target_latency=2.0)
+
+    controller.record(requested=100, returned=100, remaining=5000, latency=0.1)
+    assert controller.size == 400
+
+    controller.record(requested=400, returned=400, remaining=5000, latency=0.4)
+    assert controller.size == 1000
+
+
+def test_controller_shrinks_slow_pages():
+    """Test that pages slower than the target shrink the page size proportionally."""
+    controller = PageSizeController(initial=400, target_latency=1.0)
+
+    controller.record(requested=400, returned=400, remaining=5000, latency=4.0)
+
+    assert controller.size == 100
+
+
+def test_controller_learns_server_maximum():
+    """Test that a short page with records remaining caps the page size."""
+    controller = PageSizeController(initial=100, maximum=1000)
+
+    controller.record(requested=100, returned=50, remaining=500, latency=0.01)
+
+    assert controller.maximum == 50
+    assert controller.size == 50
+
+
+def test_controller_backs_off_on_failure():
+    """Test that failures halve the page size down to the minimum."""
+    controller = PageSizeController(initial=40, minimum=10)
+
+    assert controller.failed()
+    assert controller.size == 20
+    assert controller.failed()
+    assert controller.size == 10
+    assert not controller.failed()
+
+
+def test_controller_validates_bounds():
+    """Test that inconsistent page size bounds are rejected."""
+    with pytest.raises(ValueError):
+        PageSizeController(initial=5, minimum=10)
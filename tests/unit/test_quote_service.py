@@ -1,7 +1,12 @@
+import asyncio
+
+import anyio
 import pytest
 
-from lotr_sdk.core.errors import ResourceNotFoundError
-from lotr_sdk.schemas.base import FieldFilter, Pagination
+from lotr_sdk.core.errors import CassetteMissError, DeadlineExceededError, ResourceNotFoundError, ServerError
+from lotr_sdk.core.executor import ParallelExecutor
+from lotr_sdk.core.paging import PageSizeController
+from lotr_sdk.schemas.base import APIResponse, FieldFilter, Pagination
 from lotr_sdk.schemas.quote import Quote, QuoteFilters, QuoteList
 from lotr_sdk.services.quote import QuoteService
 
@@ -166,3 +171,254 @@ async def test_get_quote_async(quote_service, mock_http_client, sample_quote_dat
     assert isinstance(result, Quote)
     assert result.id == quote_id
     assert result.dialog == "Deagol!"
+
+
+def make_quote_page(page, pages=3, limit=2):
+    """Build a raw quote page response for pagination tests."""
+    return APIResponse(
+        data={
+            "docs": [
+                {
+                    "id": f"5cd96e05de30eff6ebcce{page:02d}{index}",
+                    "dialog": f"Quote {page}-{index}",
+                    "movie": "5cd95395de30eff6ebccde5d",
+                    "character": "5cd99d4bde30eff6ebccfe9e",
+                }
+                for index in range(limit)
+            ],
+            "total": pages * limit,
+            "limit": limit,
+            "offset": (page - 1) * limit,
+            "page": page,
+            "pages": pages,
+        },
+        status_code=200,
+        headers={},
+    )
+
+
+def test_list_all_quotes_in_parallel(mock_http_client):
+    """Test that list_all fetches every page through the thread pool and keeps page order."""
+    quote_service = QuoteService(mock_http_client, ParallelExecutor(max_workers=4))
+    mock_http_client.request.side_effect = lambda **kwargs: make_quote_page(int(kwargs["params"]["page"]))
+
+    result = quote_service.list_all(limit=2)
+
+    assert mock_http_client.request.call_count == 3
+    assert isinstance(result, QuoteList)
+    assert [quote.dialog for quote in result] == [f"Quote {page}-{index}" for page in (1, 2, 3) for index in (0, 1)]
+    assert result.total == 6
+
+
+def test_get_many_quotes(mock_http_client, sample_quote_data):
+    """Test fetching several quotes by ID in parallel."""
+    quote_service = QuoteService(mock_http_client, ParallelExecutor(max_workers=2))
+    mock_http_client.configure_response(sample_quote_data)
+
+    result = quote_service.get_many(["5cd96e05de30eff6ebcce7e9", "5cd96e05de30eff6ebcce7ea"])
+
+    assert mock_http_client.request.call_count == 2
+    assert all(isinstance(quote, Quote) for quote in result)
+
+
+@pytest.mark.asyncio
+async def test_list_all_quotes_async(quote_service, mock_http_client):
+    """Test that list_all_async fetches the remaining pages concurrently."""
+    mock_http_client.request_async.side_effect = lambda **kwargs: make_quote_page(int(kwargs["params"]["page"]))
+
+    result = await quote_service.list_all_async(limit=2)
+
+    assert mock_http_client.request_async.call_count == 3
+    assert len(result) == 6
+    assert result[0].dialog == "Quote 1-0"
+
+
+def test_list_quotes_with_projection(quote_service, mock_http_client, sample_quote_data):
+    """Test that a projection strips unselected fields and builds partial quotes."""
+    mock_http_client.configure_response(sample_quote_data)
+
+    result = quote_service.list(fields=["dialog"])
+
+    mock_http_client.request.assert_called_once_with(method="GET", url="/v2/quote", params={})
+    assert isinstance(result, QuoteList)
+    assert isinstance(result.docs[0], Quote)
+    assert result.docs[0].id == "5cd96e05de30eff6ebcce7e9"
+    assert result.docs[0].dialog == "Deagol!"
+    assert result.docs[0].movie is None
+    assert type(result.docs[0]) is type(quote_service.list(fields=["dialog"]).docs[0])
+
+
+def test_projected_quotes_serialize_selected_fields(quote_service, mock_http_client, sample_quote_data):
+    """Test that partial quotes leave unselected fields out when serialized."""
+    mock_http_client.configure_response(sample_quote_data)
+
+    quote = quote_service.list(fields=["dialog"]).docs[0]
+
+    assert quote.model_dump(mode="json") == {"id": "5cd96e05de30eff6ebcce7e9", "dialog": "Deagol!"}
+    assert quote.model_dump_json() == '{"id":"5cd96e05de30eff6ebcce7e9","dialog":"Deagol!"}'
+    assert "movie" in quote.model_dump(exclude_unset=False)
+
+
+def test_list_quotes_with_server_projection(mock_settings, mock_http_client, sample_quote_data):
+    """Test that the projection is sent to the server when a projection parameter is configured."""
+    mock_http_client.settings = mock_settings.model_copy(update={"projection_param": "select"})
+    mock_http_client.configure_response(sample_quote_data)
+
+    QuoteService(mock_http_client).list(fields=["dialog", "character"])
+
+    mock_http_client.request.assert_called_once_with(
+        method="GET",
+        url="/v2/quote",
+        params={"select": "character,dialog"},
+    )
+
+
+def test_list_quotes_with_unknown_projection(quote_service, mock_http_client, sample_quote_data):
+    """Test that projecting an unknown field fails."""
+    mock_http_client.configure_response(sample_quote_data)
+
+    with pytest.raises(ValueError):
+        quote_service.list(fields=["speaker"])
+
+
+@pytest.mark.asyncio
+async def test_produce_async_applies_backpressure(quote_service, mock_http_client):
+    """Test that the producer stops fetching pages while the queue is full."""
+    mock_http_client.request_async.side_effect = lambda **kwargs: make_quote_page(
+        int(kwargs["params"]["page"]), pages=10
+    )
+    queue = asyncio.Queue(maxsize=2)
+
+    producer = asyncio.create_task(quote_service.produce_async(queue, limit=2, concurrency=2))
+    await asyncio.sleep(0.01)
+    assert mock_http_client.request_async.call_count <= 3
+
+    received = [(await queue.get()).dialog for _ in range(20)]
+
+    assert await producer == 20
+    assert mock_http_client.request_async.call_count == 10
+    assert sorted(received) == sorted(f"Quote {page}-{index}" for page in range(1, 11) for index in (0, 1))
+
+
+@pytest.mark.asyncio
+async def test_produce_async_cancellation(quote_service, mock_http_client):
+    """Test that cancelling the producer cancels its page fetchers."""
+    mock_http_client.request_async.side_effect = lambda **kwargs: make_quote_page(
+        int(kwargs["params"]["page"]), pages=10
+    )
+    queue = asyncio.Queue(maxsize=1)
+
+    producer = asyncio.create_task(quote_service.produce_async(queue, limit=2))
+    await asyncio.sleep(0.01)
+    producer.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await producer
+    assert len(asyncio.all_tasks()) == 1
+
+
+def test_services_run_under_trio(mock_http_client):
+    """Test that async service methods work on the Trio backend."""
+    pytest.importorskip("trio")
+    mock_http_client.request_async.side_effect = lambda **kwargs: make_quote_page(int(kwargs["params"]["page"]))
+    quote_service = QuoteService(mock_http_client)
+
+    async def main():
+        quotes = await quote_service.list_all_async(limit=2)
+        send, receive = anyio.create_memory_object_stream(max_buffer_size=1)
+        received = []
+
+        async def consume():
+            async with receive:
+                async for quote in receive:
+                    received.append(quote.dialog)
+
+        async with anyio.create_task_group() as group:
+            group.start_soon(consume)
+            async with send:
+                produced = await quote_service.produce_async(send, limit=2)
+        return quotes, produced, received
+
+    quotes, produced, received = anyio.run(main, backend="trio")
+
+    assert len(quotes) == 6
+    assert produced == 6
+    assert sorted(received) == sorted(quote.dialog for quote in quotes)
+
+
+def make_offset_page(offset, limit, total=25, max_limit=8):
+    """Build a raw quote page for an offset request, capping the limit like a server would."""
+    count = max(0, min(limit, max_limit, total - offset))
+    docs = [
+        {
+            "_id": f"{offset + index:024x}",
+            "dialog": f"Quote {offset + index}",
+            "movie": "5cd95395de30eff6ebccde5d",
+            "character": "5cd99d4bde30eff6ebccfe9e",
+        }
+        for index in range(count)
+    ]
+    data = {"docs": docs, "total": total, "limit": min(limit, max_limit), "offset": offset}
+    return APIResponse(data=data, status_code=200, headers={})
+
+
+def test_scan_adapts_page_size(quote_service, mock_http_client):
+    """Test that scan reads every record with offset pagination and learns the server's page size cap."""
+    mock_http_client.request.side_effect = lambda **kwargs: make_offset_page(
+        int(kwargs["params"]["offset"]), int(kwargs["params"]["limit"])
+    )
+    controller = PageSizeController(initial=5, minimum=1, maximum=100)
+
+    quotes = list(quote_service.scan(controller=controller))
+
+    assert [quote.dialog for quote in quotes] == [f"Quote {index}" for index in range(25)]
+    assert controller.maximum == 8
+    assert mock_http_client.request.call_count == 4
+
+
+def test_scan_shrinks_page_after_error(quote_service, mock_http_client):
+    """Test that a failed page is retried with a smaller page size."""
+
+    def respond(**kwargs):
+        limit = int(kwargs["params"]["limit"])
+        if limit > 4:
+            raise ServerError()
+        return make_offset_page(int(kwargs["params"]["offset"]), limit, total=6)
+
+    mock_http_client.request.side_effect = respond
+    controller = PageSizeController(initial=8, minimum=2, maximum=8, max_growth=1)
+
+    assert len(list(quote_service.scan(controller=controller))) == 6
+    assert controller.size == 4
+
+
+def test_scan_gives_up_at_minimum_page_size(quote_service, mock_http_client):
+    """Test that errors at the minimum page size are raised."""
+    mock_http_client.request.side_effect = ServerError()
+
+    with pytest.raises(ServerError):
+        list(quote_service.scan(controller=PageSizeController(initial=4, minimum=2, maximum=4)))
+
+
+@pytest.mark.parametrize("error", [DeadlineExceededError(), CassetteMissError()])
+def test_scan_stops_at_once_on_errors_a_smaller_page_would_not_avoid(quote_service, mock_http_client, error):
+    """Test that a passed deadline or a cassette miss is raised without retrying smaller pages."""
+    mock_http_client.request.side_effect = error
+    controller = PageSizeController(initial=8, minimum=1, maximum=8)
+
+    with pytest.raises(type(error)):
+        list(quote_service.scan(controller=controller))
+    assert mock_http_client.request.call_count == 1
+    assert controller.size == 8
+
+
+@pytest.mark.asyncio
+async def test_scan_async(quote_service, mock_http_client):
+    """Test that scan_async streams every record."""
+    mock_http_client.request_async.side_effect = lambda **kwargs: make_offset_page(
+        int(kwargs["params"]["offset"]), int(kwargs["params"]["limit"])
+    )
+
+    quotes = [quote async for quote in quote_service.scan_async()]
+
+    assert len(quotes) == 25
@@ -0,0 +1,103 @@
+import anyio
+import pytest
+
+from lotr_sdk.core.scheduler import PrioritizedClient, RequestScheduler, current_priority, priority
+from lotr_sdk.schemas.base import APIResponse
+from lotr_sdk.services.movie import MovieService
+
+
+async def run_requests(scheduler, names, order, hold=0.01):
+    async def request(name):
+        async with scheduler.slot(name):
+            order.append(name)
+            await anyio.sleep(hold)
+
+    async with anyio.create_task_group() as group:
+        for name in names:
+            group.start_soon(request, name)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_caps_concurrency():
+    """Test that no more than max_concurrency requests hold a slot at once."""
+    scheduler = RequestScheduler(2)
+    peak = 0
+
+    async def request():
+        nonlocal peak
+        async with scheduler.slot():
+            peak = max(peak, scheduler.total_in_flight)
+            await anyio.sleep(0.01)
+
+    async with anyio.create_task_group() as group:
+        for _ in range(6):
+            group.start_soon(request)
+
+    assert peak == 2
+    assert scheduler.total_in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_weighted_fair_queuing():
+    """Test that a heavier class gets proportionally more slots while both classes wait."""
+    scheduler = RequestScheduler(1, weights={"interactive": 3, "batch": 1})
+    order = []
+
+    await run_requests(scheduler, ["batch"] * 8 + ["interactive"] * 3, order)
+
+    # The batch request queued first runs first; then interactive requests take three slots for every batch one
+    assert order[:5] == ["batch", "interactive", "interactive", "interactive", "batch"]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_per_class_limit():
+    """Test that a class never exceeds its own concurrency cap."""
+    scheduler = RequestScheduler(4, limits={"batch": 1})
+    peak = 0
+
+    async def request():
+        nonlocal peak
+        async with scheduler.slot("batch"):
+            peak = max(peak, scheduler.in_flight["batch"])
+            await anyio.sleep(0.01)
+
+    async with anyio.create_task_group() as group:
+        for _ in range(3):
+            group.start_soon(request)
+
+    assert peak == 1
+
+
+@pytest.mark.asyncio
+async def test_scheduler_cancelled_waiter_frees_queue():
+    """Test that a cancelled waiter leaves the queue without leaking a slot."""
+    scheduler = RequestScheduler(1)
+
+    async with scheduler.slot():
+        with anyio.move_on_after(0.01):
+            async with scheduler.slot():
+                pass
+
+    async with scheduler.slot():
+        assert scheduler.total_in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_service_with_priority(mock_http_client):
+    """Test that a service bound to a priority runs its requests in that class."""
+    seen = []
+
+    def respond(**kwargs):
+        seen.append(current_priority())
+        return APIResponse(data={"docs": [], "total": 0, "limit": 10}, status_code=200, headers={})
+
+    mock_http_client.request_async.side_effect = respond
+    service = MovieService(mock_http_client).with_priority("batch")
+
+    await service.list_async()
+    with priority("interactive"):
+        await MovieService(mock_http_client).list_async()
+
+    assert seen == ["batch", "interactive"]
+    assert isinstance(service.http_client, PrioritizedClient)
+    assert service.with_priority("interactive").http_client.client is mock_http_client
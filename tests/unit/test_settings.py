@@ -107,3 +107,12 @@ def test_partial_override_of_environment(monkeypatch):
     assert settings.max_retries == 4
     assert settings.retry_delay == 3.0
     assert settings.user_agent == "env-agent/1.0"
+
+
+def test_settings_api_key_pool(monkeypatch):
+    """Test that additional API keys are read from the environment and deduplicated."""
+    monkeypatch.setenv("LOTR_API_KEYS", '["second-key", "arg-key"]')
+
+    settings = Settings(api_key="arg-key")
+
+    assert settings.all_api_keys == ["arg-key", "second-key"]
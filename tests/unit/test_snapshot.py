@@ -0,0 +1,98 @@
+import pytest
+
+from lotr_sdk.core.errors import ResourceNotFoundError
+from lotr_sdk.schemas.movie import Movie
+from lotr_sdk.schemas.quote import Quote
+from lotr_sdk.snapshot import SnapshotReader, write_snapshot
+
+
+@pytest.fixture
+def movies():
+    """Sample movies."""
+    return [
+        Movie(
+            id=f"5cd95395de30eff6ebccde5{suffix}",
+            name=name,
+            runtimeInMinutes=178,
+            budgetInMillions=93.0,
+            boxOfficeRevenueInMillions=871.5,
+            academyAwardNominations=13,
+            academyAwardWins=4,
+            rottenTomatoesScore=91.0,
+        )
+        for suffix, name in [("d", "The Two Towers"), ("c", "The Fellowship of the Ring")]
+    ]
+
+
+@pytest.fixture
+def quotes():
+    """Sample quotes, with a repeated dialog line."""
+    return [
+        Quote(
+            id=f"5cd96e05de30eff6ebcce7{index:02x}",
+            dialog="Deagol!" if index % 2 else "Ring!",
+            movie="5cd95395de30eff6ebccde5d",
+            character="5cd99d4bde30eff6ebccfe9e",
+        )
+        for index in range(10, 0, -1)
+    ]
+
+
+@pytest.fixture
+def snapshot_path(tmp_path, movies, quotes):
+    """Path of a snapshot holding the sample data."""
+    path = tmp_path / "corpus.snap"
+    write_snapshot(path, movies, quotes)
+    return path
+
+
+def test_snapshot_round_trip(snapshot_path, movies, quotes):
+    """Test that every record survives a write and read, sorted by ID."""
+    with SnapshotReader(snapshot_path) as reader:
+        assert list(reader.movies) == sorted(movies, key=lambda movie: movie.id)
+        assert list(reader.quotes) == sorted(quotes, key=lambda quote: quote.id)
+        assert reader.quotes[-1] == max(quotes, key=lambda quote: quote.id)
+
+
+def test_snapshot_lookup_by_id(snapshot_path, quotes):
+    """Test binary-search lookups by ID."""
+    with SnapshotReader(snapshot_path) as reader:
+        assert reader.get_movie("5cd95395de30eff6ebccde5d").name == "The Two Towers"
+        assert reader.get_quote(quotes[3].id) == quotes[3]
+        with pytest.raises(ResourceNotFoundError):
+            reader.get_quote("000000000000000000000000")
+
+
+def test_snapshot_deduplicates_strings(tmp_path, quotes):
+    """Test that repeated strings are stored once."""
+    write_snapshot(tmp_path / "one.snap", [], quotes[:1])
+    write_snapshot(tmp_path / "many.snap", [], quotes[:1] * 2)
+
+    growth = (tmp_path / "many.snap").stat().st_size - (tmp_path / "one.snap").stat().st_size
+    assert growth == 44
+
+
+def test_snapshot_rejects_other_files(tmp_path):
+    """Test that opening a file that is not a snapshot fails."""
+    path = tmp_path / "not-a-snapshot"
+    path.write_bytes(b"\0" * 64)
+
+    with pytest.raises(ValueError):
+        SnapshotReader(path)
+
+
+def test_failed_write_removes_temporary_file(tmp_path, monkeypatch, movies, quotes):
+    """Test that a failed write keeps the previous snapshot and leaves no temporary file behind."""
+    path = tmp_path / "corpus.snap"
+    write_snapshot(path, movies, [])
+    previous = path.read_bytes()
+
+    def fail(*args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("lotr_sdk.snapshot.os.replace", fail)
+    with pytest.raises(OSError, match="disk full"):
+        write_snapshot(path, movies, quotes)
+
+    assert path.read_bytes() == previous
+    assert [file.name for file in tmp_path.iterdir()] == ["corpus.snap"]
@@ -0,0 +1,90 @@
+import pytest
+
+from lotr_sdk.core.executor import ParallelExecutor
+from lotr_sdk.schemas.base import APIResponse, BaseSort, merge_sorted
+from lotr_sdk.schemas.movie import Movie
+from lotr_sdk.services.movie import MovieService
+
+SCORES = [98, 96, 95, 91, 90, 85, 64]
+
+
+def movie_doc(index, score):
+    """Build a raw movie doc."""
+    return {
+        "_id": f"5cd95395de30eff6ebccde{index:02d}",
+        "name": f"Movie {index}",
+        "runtimeInMinutes": 170,
+        "budgetInMillions": 90,
+        "boxOfficeRevenueInMillions": 800,
+        "academyAwardNominations": 1,
+        "academyAwardWins": 0,
+        "rottenTomatoesScore": score,
+    }
+
+
+def sorted_page(**kwargs):
+    """Serve movies sorted by descending score, two per page."""
+    page = int(kwargs["params"]["page"])
+    docs = [movie_doc(index, score) for index, score in enumerate(SCORES)][(page - 1) * 2 : page * 2]
+    return APIResponse(
+        data={"docs": docs, "total": len(SCORES), "limit": 2, "page": page, "pages": 4},
+        status_code=200,
+        headers={},
+    )
+
+
+def test_list_passes_sort(mock_http_client):
+    """Test that list sends the sort query parameter."""
+    mock_http_client.configure_response({"docs": [], "total": 0, "limit": 10})
+    MovieService(mock_http_client).list(sort=BaseSort(field="rottenTomatoesScore", order="desc"))
+
+    mock_http_client.request.assert_called_once_with(
+        method="GET",
+        url="/v2/movie",
+        params={"sort": "rottenTomatoesScore:desc"},
+    )
+
+
+def test_merge_sorted_accepts_api_field_names():
+    """Test that merge_sorted merges sorted streams lazily using API field names."""
+    movies = [Movie(**movie_doc(index, score)) for index, score in enumerate(SCORES)]
+    sort = BaseSort(field="rottenTomatoesScore", order="desc")
+
+    merged = merge_sorted(movies[0::3], movies[1::3], movies[2::3], sort=sort)
+
+    assert [movie.rotten_tomatoes_score for movie in merged] == SCORES
+
+
+def test_iter_sorted_streams_pages_in_global_order(mock_http_client):
+    """Test that iter_sorted yields a globally sorted stream from parallel page fetches."""
+    mock_http_client.request.side_effect = sorted_page
+    service = MovieService(mock_http_client, ParallelExecutor(max_workers=2))
+
+    stream = service.iter_sorted(BaseSort(field="rottenTomatoesScore", order="desc"), limit=2)
+
+    assert next(stream).rotten_tomatoes_score == 98
+    assert mock_http_client.request.call_count == 1
+    assert [movie.rotten_tomatoes_score for movie in stream] == SCORES[1:]
+    assert mock_http_client.request.call_count == 4
+
+
+def test_top(mock_http_client):
+    """Test that top fetches only the first n records in sort order."""
+    mock_http_client.configure_response({"docs": [movie_doc(0, 98)], "total": 7, "limit": 1})
+
+    top = MovieService(mock_http_client).top(1, sort=BaseSort(field="rottenTomatoesScore", order="desc"))
+
+    assert [movie.rotten_tomatoes_score for movie in top] == [98]
+    assert mock_http_client.request.call_args.kwargs["params"] == {"limit": "1", "sort": "rottenTomatoesScore:desc"}
+
+
+@pytest.mark.asyncio
+async def test_iter_sorted_async(mock_http_client):
+    """Test the asynchronous sorted stream."""
+    mock_http_client.request_async.side_effect = sorted_page
+    service = MovieService(mock_http_client)
+
+    stream = service.iter_sorted_async(BaseSort(field="rottenTomatoesScore", order="desc"), limit=2)
+    scores = [movie.rotten_tomatoes_score async for movie in stream]
+
+    assert scores == SCORES
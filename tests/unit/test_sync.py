@@ -0,0 +1,161 @@
+import pytest
+
+from lotr_sdk.schemas.base import APIResponse, FieldFilter
+from lotr_sdk.schemas.quote import QuoteFilters
+from lotr_sdk.services.quote import QuoteService
+from lotr_sdk.sync import SyncSnapshot
+
+
+def quote(index, dialog=None):
+    """Build a raw quote doc."""
+    return {
+        "_id": f"5cd96e05de30eff6ebcce7{index:02d}",
+        "dialog": dialog or f"Quote {index}",
+        "movie": "5cd95395de30eff6ebccde5d",
+        "character": "5cd99d4bde30eff6ebccfe9e",
+    }
+
+
+class FakeQuoteServer:
+    """Serves quote pages with ETags and honours If-None-Match."""
+
+    def __init__(self, docs, limit=2):
+        self.docs = docs
+        self.limit = limit
+        self.not_modified = 0
+
+    def etag(self, page):
+        start = (page - 1) * self.limit
+        return f'W/"{hash((len(self.docs), str(self.docs[start : start + self.limit])))}"'
+
+    def __call__(self, *, method, url, params, headers):
+        page = int(params["page"])
+        etag = self.etag(page)
+        if headers and headers.get("If-None-Match") == etag:
+            self.not_modified += 1
+            return APIResponse(data={}, status_code=304, headers={"ETag": etag})
+        start = (page - 1) * self.limit
+        pages = -(-len(self.docs) // self.limit)
+        return APIResponse(
+            data={
+                "docs": self.docs[start : start + self.limit],
+                "total": len(self.docs),
+                "limit": self.limit,
+                "page": page,
+                "pages": pages,
+            },
+            status_code=200,
+            headers={"ETag": etag},
+        )
+
+
+@pytest.fixture
+def quote_service(mock_http_client):
+    """Fixture for QuoteService with mock HTTP client."""
+    return QuoteService(mock_http_client)
+
+
+def test_first_sync_reports_everything_as_added(quote_service, mock_http_client):
+    """Test that a sync without a snapshot crawls every page."""
+    mock_http_client.request.side_effect = FakeQuoteServer([quote(i) for i in range(4)])
+
+    changes = quote_service.sync(limit=2)
+
+    assert len(changes.added) == 4
+    assert not changes.updated
+    assert not changes.removed
+    assert changes.requests == 2
+    assert changes.snapshot.total == 4
+
+
+def test_sync_only_validates_changed_pages(quote_service, mock_http_client):
+    """Test that unchanged pages are skipped and changes are detected by ID."""
+    server = FakeQuoteServer([quote(i) for i in range(4)])
+    mock_http_client.request.side_effect = server
+    snapshot = quote_service.sync(limit=2).snapshot
+
+    server.docs = [quote(0), quote(1), quote(2, "Changed"), quote(4)]
+    changes = quote_service.sync(snapshot, limit=2, full=True)
+
+    assert server.not_modified == 1
+    assert changes.unchanged_pages == 1
+    assert [q.dialog for q in changes.updated] == ["Changed"]
+    assert [q.id for q in changes.added] == [quote(4)["_id"]]
+    assert [q.id for q in changes.removed] == [quote(3)["_id"]]
+
+
+def test_sync_without_changes_is_empty(quote_service, mock_http_client):
+    """Test that a sync against an identical collection reports no changes."""
+    mock_http_client.request.side_effect = FakeQuoteServer([quote(i) for i in range(3)])
+    snapshot = quote_service.sync(limit=2).snapshot
+
+    changes = quote_service.sync(snapshot, limit=2)
+
+    assert not changes
+    assert changes.unchanged_pages == 2
+
+
+def test_sync_stops_when_first_page_and_total_are_unchanged(quote_service, mock_http_client):
+    """Test that an unchanged first page and total skip the remaining pages."""
+    server = FakeQuoteServer([quote(i) for i in range(5)])
+    mock_http_client.request.side_effect = server
+    snapshot = quote_service.sync(limit=2).snapshot
+    mock_http_client.request.reset_mock()
+
+    changes = quote_service.sync(snapshot, limit=2)
+
+    assert not changes
+    assert changes.requests == mock_http_client.request.call_count == 1
+    assert server.not_modified == 1
+    assert changes.unchanged_pages == 3
+    assert changes.snapshot.total == 5
+    assert changes.snapshot.records == snapshot.records
+
+
+def test_sync_crawls_when_total_changes(quote_service, mock_http_client):
+    """Test that a changed total crawls every page even when the first page's docs are unchanged."""
+    server = FakeQuoteServer([quote(i) for i in range(4)])
+    mock_http_client.request.side_effect = server
+    snapshot = quote_service.sync(limit=2).snapshot
+
+    server.docs = [quote(0), quote(1), quote(2), quote(3), quote(4)]
+    changes = quote_service.sync(snapshot, limit=2)
+
+    assert changes.requests == 3
+    assert [q.id for q in changes.added] == [quote(4)["_id"]]
+
+
+def test_sync_rejects_snapshot_with_other_filters(quote_service, mock_http_client):
+    """Test that a snapshot only syncs against the filters it was taken with."""
+    mock_http_client.request.side_effect = FakeQuoteServer([quote(i) for i in range(3)])
+    filters = QuoteFilters(dialog=FieldFilter(match="Quote 1"))
+    snapshot = quote_service.sync(filters=filters, limit=2).snapshot
+
+    assert snapshot.params == {"dialog": "Quote 1"}
+    assert not quote_service.sync(snapshot, filters=QuoteFilters(dialog=FieldFilter(match="Quote 1")), limit=2)
+    with pytest.raises(ValueError, match="params"):
+        quote_service.sync(snapshot, limit=2)
+
+
+def test_snapshot_round_trip(tmp_path, quote_service, mock_http_client):
+    """Test that snapshots survive saving and loading."""
+    mock_http_client.request.side_effect = FakeQuoteServer([quote(i) for i in range(3)])
+    snapshot = quote_service.sync(limit=2).snapshot
+
+    snapshot.save(tmp_path / "quotes.json")
+
+    assert SyncSnapshot.load(tmp_path / "quotes.json") == snapshot
+
+
+@pytest.mark.asyncio
+async def test_sync_async(quote_service, mock_http_client):
+    """Test the asynchronous sync."""
+    server = FakeQuoteServer([quote(i) for i in range(4)])
+    mock_http_client.request_async.side_effect = server
+    snapshot = (await quote_service.sync_async(limit=2)).snapshot
+
+    server.docs = [quote(0), quote(1), quote(2)]
+    changes = await quote_service.sync_async(snapshot, limit=2)
+
+    assert [q.id for q in changes.removed] == [quote(3)["_id"]]
+    assert changes.unchanged_pages == 1
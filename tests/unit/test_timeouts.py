@@ -0,0 +1,151 @@
+import inspect
+import time
+from pathlib import Path
+
+import anyio
+import pytest
+
+from lotr_sdk.client.base import BaseHTTPClient, TransportResponse
+from lotr_sdk.core.errors import DeadlineExceededError
+from lotr_sdk.core.executor import ParallelExecutor
+from lotr_sdk.core.settings import Settings
+from lotr_sdk.core.timeouts import Timeouts, deadline, remaining
+from lotr_sdk.schemas.base import APIResponse
+from lotr_sdk.services.movie import MovieService
+from lotr_sdk.services.quote import QuoteService
+
+
+class RecordingClient(BaseHTTPClient):
+    """Transport that fails with a server error and records the timeouts it was given."""
+
+    def __init__(self, settings, delay=0.0):
+        super().__init__(settings)
+        self.delay = delay
+        self.timeouts = []
+
+    def _send(self, method, url, params, body, headers, timeouts):
+        self.timeouts.append(timeouts)
+        return TransportResponse(503, {}, b"{}")
+
+    async def _send_async(self, method, url, params, body, headers, timeouts):
+        self.timeouts.append(timeouts)
+        await anyio.sleep(self.delay)
+        return TransportResponse(503, {}, b"{}")
+
+
+def make_page(page):
+    docs = [{"_id": f"{page:024x}", "dialog": "d", "movie": "m", "character": "c"}]
+    return APIResponse(data={"docs": docs, "total": 3, "limit": 1, "pages": 3}, status_code=200, headers={})
+
+
+def test_settings_timeouts_fall_back_to_timeout():
+    """Test that unset connect, read and pool timeouts default to the overall timeout."""
+    settings = Settings(api_key="test-api-key", timeout=10, connect_timeout=2)
+
+    assert settings.timeouts == Timeouts(connect=2, read=10, pool=10)
+
+
+def test_adaptive_timeouts_follow_p99():
+    """Test that adaptive timeouts are a multiple of p99 latency, within the floor and the ceiling."""
+    settings = Settings(api_key="test-api-key", adaptive_timeouts=True, timeout_multiplier=4, min_timeout=1, timeout=30)
+    client = RecordingClient(settings)
+    assert client._timeouts("/v2/movie", None) == Timeouts(30, 30, 30)
+
+    for _ in range(client.latency.min_samples):
+        client.latency.record("/v2/movie", 2.0)
+        client.latency.record("/v2/quote", 0.01)
+
+    assert client._timeouts("/v2/movie", None) == Timeouts(connect=8.0, read=8.0, pool=30)
+    assert client._timeouts("/v2/quote", None) == Timeouts(connect=1.0, read=1.0, pool=30)
+    capped = client._timeouts("/v2/movie", 0.5)
+    assert capped.total == pytest.approx(0.5)
+    assert capped.connect == capped.read < capped.pool
+
+
+def test_capped_timeouts_fit_in_the_budget():
+    """Test that capping splits the time left across the phases of an attempt."""
+    timeouts = Timeouts(connect=2, read=6, pool=2)
+
+    assert timeouts.capped(20) is timeouts
+    assert timeouts.capped(5) == Timeouts(connect=1, read=3, pool=1)
+    assert timeouts.capped(-1).total == 0
+
+
+def test_retries_respect_deadline():
+    """Test that a retry which cannot finish before the deadline is not attempted."""
+    client = RecordingClient(Settings(api_key="test-api-key", max_retries=5, retry_delay=1.0))
+
+    start = time.monotonic()
+    with deadline(0.5), pytest.raises(DeadlineExceededError):
+        client.request("GET", "/v2/movie")
+
+    assert len(client.timeouts) == 1
+    assert client.timeouts[0].read <= 0.5
+    assert time.monotonic() - start < 0.5
+
+
+@pytest.mark.asyncio
+async def test_async_request_cancelled_at_deadline():
+    """Test that an async attempt still running at the deadline is cancelled."""
+    client = RecordingClient(Settings(api_key="test-api-key"), delay=5.0)
+
+    with deadline(0.05), pytest.raises(DeadlineExceededError):
+        await client.request_async("GET", "/v2/movie")
+
+
+def test_nested_deadlines_never_extend():
+    """Test that an inner deadline cannot outlive an outer one."""
+    with deadline(1.0):
+        with deadline(10.0):
+            assert remaining() <= 1.0
+    assert remaining() is None
+
+
+def test_service_methods_accept_deadline(mock_http_client):
+    """Test that service methods take a deadline that reaches their requests, in executor threads too."""
+    seen = []
+
+    def respond(**kwargs):
+        seen.append(remaining())
+        return make_page(int(kwargs["params"].get("page", 1)))
+
+    mock_http_client.request.side_effect = respond
+    service = QuoteService(mock_http_client, ParallelExecutor(max_workers=2))
+
+    service.list_all(limit=2, deadline=5.0)
+    service.list(deadline=None)
+
+    assert len(seen) == 4
+    assert all(0 < left <= 5.0 for left in seen[:3])
+    assert seen[3] is None
+
+
+@pytest.mark.parametrize("service", [MovieService, QuoteService])
+def test_service_methods_declare_deadline(service):
+    """Test that every public service method declares the deadline argument its wrapper consumes."""
+    for name, method in vars(service).items():
+        if not name.startswith("_") and inspect.isfunction(method):
+            parameter = inspect.signature(method).parameters.get("deadline")
+            assert parameter is not None, name
+            assert parameter.kind is inspect.Parameter.KEYWORD_ONLY, name
+
+
+def test_service_deadline_type_checks(tmp_path, monkeypatch):
+    """Test that mypy accepts calls passing a deadline to service methods."""
+    mypy = pytest.importorskip("mypy.api")
+    snippet = tmp_path / "snippet.py"
+    snippet.write_text(
+        "from lotr_sdk.services.movie import MovieService\n"
+        "from lotr_sdk.services.quote import QuoteService\n"
+        "\n"
+        "\n"
+        "async def fetch(movies: MovieService, quotes: QuoteService) -> None:\n"
+        "    movies.get('5cd95395de30eff6ebccde5d', deadline=5.0)\n"
+        "    quotes.list_all(limit=2, deadline=None)\n"
+        "    await movies.get_async('5cd95395de30eff6ebccde5d', deadline=1)\n"
+    )
+    monkeypatch.setenv("MYPYPATH", str(Path(__file__).parents[2] / "src"))
+
+    report, _, status = mypy.run(["--follow-imports=silent", str(snippet)])
+
+    assert status == 0, report
@@ -0,0 +1,132 @@
+from unittest.mock import MagicMock
+
+import pytest
+from fakes import ScriptedClient, ok
+
+from lotr_sdk.client.base import TransportResponse
+from lotr_sdk.core.errors import APIError, AuthenticationError, ResourceNotFoundError, ServerError
+from lotr_sdk.core.settings import Settings
+
+
+@pytest.fixture
+def settings():
+    return Settings(api_key="test-api-key", max_retries=2, retry_delay=0)
+
+
+def test_base_client_decodes_response(settings):
+    """Test that a successful response is decoded into an APIResponse."""
+    client = ScriptedClient(settings, [ok({"docs": [1]})])
+
+    response = client.request("GET", "/v2/movie")
+
+    assert response.data == {"docs": [1]}
+    assert response.headers == {"etag": '"1"'}
+
+
+def test_base_client_not_modified(settings):
+    """Test that a 304 response is returned with empty data."""
+    client = ScriptedClient(settings, [TransportResponse(304, {}, b"")])
+
+    assert client.request("GET", "/v2/movie").data == {}
+
+
+@pytest.mark.parametrize(
+    ("status_code", "error"),
+    [(401, AuthenticationError), (404, ResourceNotFoundError), (400, APIError)],
+)
+def test_base_client_maps_client_errors_without_retrying(settings, status_code, error):
+    """Test that client errors are mapped to API errors and not retried."""
+    client = ScriptedClient(settings, [ok(status_code=status_code)])
+
+    with pytest.raises(error):
+        client.request("GET", "/v2/movie")
+    assert client.calls == 1
+
+
+def test_base_client_retries_server_and_transient_errors(settings):
+    """Test that server errors and transient transport errors are retried."""
+    client = ScriptedClient(settings, [ok(status_code=503), ConnectionError(), ok()])
+
+    assert client.request("GET", "/v2/movie").status_code == 200
+    assert client.calls == 3
+
+
+def test_base_client_gives_up_after_max_retries(settings):
+    """Test that the last error is raised once retries are exhausted."""
+    client = ScriptedClient(settings, [ok(status_code=500)] * 3)
+
+    with pytest.raises(ServerError):
+        client.request("GET", "/v2/movie")
+
+
+def test_base_client_does_not_retry_unknown_errors(settings):
+    """Test that non-transient transport errors become APIError immediately."""
+    client = ScriptedClient(settings, [ValueError("bad url"), ok()])
+
+    with pytest.raises(APIError):
+        client.request("GET", "/v2/movie")
+    assert client.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_base_client_runs_sync_transport_async(settings):
+    """Test that a synchronous transport also serves async requests."""
+    client = ScriptedClient(settings, [ConnectionError(), ok()])
+
+    assert (await client.request_async("GET", "/v2/movie")).status_code == 200
+
+
+def test_urllib3_client_builds_request(settings):
+    """Test that the urllib3 client sends query parameters and headers."""
+    pytest.importorskip("urllib3")
+    from lotr_sdk.client.urllib3 import Urllib3Client
+
+    client = Urllib3Client(settings)
+    client.pool = MagicMock()
+    client.pool.request.return_value = MagicMock(status=200, headers={"ETag": '"1"'}, data=b'{"docs": []}')
+
+    response = client.request("GET", "/v2/movie", params={"runtimeInMinutes>": 100}, headers={"If-None-Match": "x"})
+
+    args, kwargs = client.pool.request.call_args
+    assert args == ("GET", "https://the-one-api.dev/v2/movie?runtimeInMinutes%3E=100")
+    assert kwargs["headers"]["Authorization"] == "Bearer test-api-key"
+    assert kwargs["headers"]["If-None-Match"] == "x"
+    assert response.headers == {"etag": '"1"'}
+
+
+def test_aiohttp_client_is_async_only(settings):
+    """Test that the aiohttp client refuses synchronous requests."""
+    pytest.importorskip("aiohttp")
+    from lotr_sdk.client.aiohttp import AiohttpClient
+
+    with pytest.raises(TypeError):
+        AiohttpClient(settings).request("GET", "/v2/movie")
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_client_sends_request(settings):
+    """Test that the aiohttp client sends requests and decodes responses from a local server."""
+    pytest.importorskip("aiohttp")
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    from lotr_sdk.client.aiohttp import AiohttpClient
+
+    seen = []
+
+    async def movies(request):
+        seen.append((request.query.get("limit"), request.headers["Authorization"]))
+        return web.json_response({"docs": [1]}, headers={"ETag": '"1"'})
+
+    app = web.Application()
+    app.router.add_get("/v2/movie", movies)
+    async with TestServer(app) as server:
+        client = AiohttpClient(settings.model_copy(update={"base_url": str(server.make_url("")).rstrip("/")}))
+        try:
+            response = await client.request_async("GET", "/v2/movie", params={"limit": "1"})
+        finally:
+            await client.close_async()
+
+    assert response.data == {"docs": [1]}
+    assert response.headers["etag"] == '"1"'
+    assert seen == [("1", "Bearer test-api-key")]
@@ -0,0 +1,65 @@
+import pytest
+from pydantic import ValidationError
+
+from lotr_sdk.schemas.base import BaseResource
+from lotr_sdk.schemas.quote import Quote
+from lotr_sdk.types import ObjectId, ObjectIdField
+
+MOVIE_ID = "5cd95395de30eff6ebccde5c"
+
+
+class CompactQuote(BaseResource):
+    id: ObjectIdField
+    movie: ObjectId
+
+
+def fresh(value: str) -> str:
+    """Return an equal string that is not the same object."""
+    return "".join(list(value))
+
+
+def test_object_id_round_trip():
+    """Test conversion between hexadecimal strings and raw bytes."""
+    object_id = ObjectId(MOVIE_ID)
+
+    assert len(object_id) == 12
+    assert str(object_id) == MOVIE_ID
+    assert ObjectId(bytes(object_id)) == object_id
+    assert repr(object_id) == f"ObjectId('{MOVIE_ID}')"
+
+
+def test_object_id_hash_and_order():
+    """Test that ObjectIds work as keys and sort like their hexadecimal form."""
+    ids = ["5cd95395de30eff6ebccde5d", MOVIE_ID, "0cd95395de30eff6ebccde5c"]
+
+    assert [str(object_id) for object_id in sorted(map(ObjectId, ids))] == sorted(ids)
+    assert {ObjectId(MOVIE_ID): 1}[ObjectId(fresh(MOVIE_ID))] == 1
+
+
+@pytest.mark.parametrize("value", ["5cd95395", "zz" * 12, b"short"])
+def test_object_id_rejects_invalid_values(value):
+    """Test that malformed IDs are rejected."""
+    with pytest.raises(ValueError):
+        ObjectId(value)
+
+
+def test_object_id_field_in_model():
+    """Test validation, interning and serialization of ObjectId fields."""
+    first = CompactQuote.model_validate({"_id": "5cd96e05de30eff6ebcce7e9", "movie": fresh(MOVIE_ID)})
+    second = CompactQuote.model_validate({"_id": "5cd96e05de30eff6ebcce7ea", "movie": fresh(MOVIE_ID)})
+
+    assert isinstance(first.id, ObjectId)
+    assert first.movie is second.movie
+    assert first.model_dump(mode="json", by_alias=True) == {"id": "5cd96e05de30eff6ebcce7e9", "movie": MOVIE_ID}
+    assert CompactQuote.model_json_schema()["properties"]["movie"]["pattern"] == "^[0-9a-f]{24}$"
+    with pytest.raises(ValidationError):
+        CompactQuote.model_validate({"_id": "5cd96e05de30eff6ebcce7e9", "movie": 42})
+
+
+def test_quote_foreign_keys_are_interned():
+    """Test that quotes referencing the same movie and character share one string."""
+    docs = [{"_id": f"{i:024x}", "dialog": "...", "movie": fresh(MOVIE_ID), "character": fresh("c")} for i in range(2)]
+    quotes = [Quote.model_validate(doc) for doc in docs]
+
+    assert quotes[0].movie is quotes[1].movie
+    assert quotes[0].character is quotes[1].character
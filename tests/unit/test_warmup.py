@@ -0,0 +1,38 @@
+import threading
+
+import pytest
+from fakes import DelayedClient
+
+from lotr_sdk.client.base import BaseHTTPClient, TransportResponse
+from lotr_sdk.core.settings import Settings
+
+
+@pytest.fixture
+def settings():
+    return Settings(api_key="test-api-key", max_retries=2, retry_delay=0)
+
+
+def test_warmup_opens_connections_concurrently(settings):
+    """Test that warmup sends concurrent unauthenticated HEAD requests."""
+    barrier = threading.Barrier(3, timeout=1)
+    sent = []
+
+    class WarmupClient(BaseHTTPClient):
+        def _send(self, method, url, params, body, headers, timeouts):
+            sent.append((method, url, headers))
+            barrier.wait()
+            return TransportResponse(200, {}, b"")
+
+    WarmupClient(settings).warmup(3)
+
+    assert sent == [("HEAD", "/", None)] * 3
+
+
+@pytest.mark.asyncio
+async def test_warmup_async_uses_async_transport(settings):
+    """Test that warmup_async opens connections through the asynchronous transport."""
+    client = DelayedClient(settings, [0.0] * 2)
+
+    await client.warmup_async(2)
+
+    assert client.calls == 2